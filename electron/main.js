@@ -57,13 +57,62 @@ function initializeGemini() {
     return geminiInitializationPromise;
 }
 
+// --- Input formatting cache ---
+// Mirrors the Python LLM response cache: answers are keyed by a hash of the model name,
+// the prompt version and the normalized input, and persisted in the user data folder.
+const FORMAT_MODEL_NAME = "gemini-2.0-flash";
+const FORMAT_PROMPT_VERSION = "1"; // Bump when the formatting prompt below changes
+const FORMAT_CACHE_TTL_MS = 30 * 24 * 60 * 60 * 1000;
+const FORMAT_CACHE_MAX_ENTRIES = 500;
+let formatCache = null; // Map of key -> { value, createdAt }, least recently used first
+
+function getFormatCachePath() {
+    return path.join(app.getPath('userData'), 'format_cache.json');
+}
+
+function loadFormatCache() {
+    if (!formatCache) {
+        formatCache = new Map();
+        try {
+            const stored = JSON.parse(fs.readFileSync(getFormatCachePath(), 'utf8'));
+            for (const [key, entry] of Object.entries(stored)) {
+                if (Date.now() - entry.createdAt < FORMAT_CACHE_TTL_MS) formatCache.set(key, entry);
+            }
+        } catch (err) {
+            if (err.code !== 'ENOENT') console.warn("Main Process: Ignoring unreadable format cache:", err.message);
+        }
+    }
+    return formatCache;
+}
+
+function saveFormatCache() {
+    fs.writeFile(getFormatCachePath(), JSON.stringify(Object.fromEntries(formatCache)), (err) => {
+        if (err) console.warn("Main Process: Failed to save format cache:", err.message);
+    });
+}
+
+function formatCacheKey(text) {
+    const normalized = text.replace(/\r\n/g, '\n').trim();
+    return crypto.createHash('sha256').update(JSON.stringify([FORMAT_MODEL_NAME, FORMAT_PROMPT_VERSION, normalized])).digest('hex');
+}
+
 // Function to format input using Gemini
 async function formatInputWithGemini(text) {
+    const cache = loadFormatCache();
+    const cacheKey = formatCacheKey(text);
+    const cached = cache.get(cacheKey);
+    if (cached && Date.now() - cached.createdAt < FORMAT_CACHE_TTL_MS) {
+        cache.delete(cacheKey); // Re-insert to mark as most recently used
+        cache.set(cacheKey, cached);
+        console.log("Main Process: Format cache hit.");
+        return cached.value;
+    }
+
     try {
         await initializeGemini(); // Ensure Gemini is initialized
         if (!genAI) throw new Error("Gemini AI client not initialized.");
 
-        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash" }); // Using 2.0-flash model
+        const model = genAI.getGenerativeModel({ model: FORMAT_MODEL_NAME }); // Using 2.0-flash model
         const prompt = `Your task is to reformat the following text so that distinct trademark descriptions are separated ONLY by a single semicolon.
 - Identify distinct descriptions. They might be separated by newlines or existing semicolons.
 - Replace newline characters or existing semicolons that separate distinct descriptions with a single semicolon.
@@ -86,6 +135,9 @@ Reformatted Text:`;
         const response = await result.response;
         const formattedText = response.text();
         console.log("Main Process: Received formatted text from Gemini:", formattedText);
+        cache.set(cacheKey, { value: formattedText, createdAt: Date.now() });
+        while (cache.size > FORMAT_CACHE_MAX_ENTRIES) cache.delete(cache.keys().next().value);
+        saveFormatCache();
         return formattedText;
 
     } catch (error) {
@@ -98,7 +150,7 @@ Reformatted Text:`;
 // --- Electron App Setup ---
 let mainWindow;
 let pythonProcess = null;
-let currentSearchType = null; // Track current search type (uspto or mgs)
+let currentSearchType = null; // Track current search type (uspto, mgs, or all for a combined USPTO + MGS run)
 const cancellationFile = path.join(__dirname, '..', 'python', 'cancel_search.tmp');
 
 async function createWindow() { // Make the function async
@@ -165,15 +217,16 @@ app.on('activate', () => {
     }
 });
 
-ipcMain.on('start-search', (event, searchTerms) => {
-    startSearchProcess('uspto', searchTerms);
+ipcMain.on('start-search', (event, searchTerms, mgsTasksJson) => {
+    // With MGS tasks, one process runs both sources concurrently on a shared browser
+    startSearchProcess(mgsTasksJson ? 'all' : 'uspto', searchTerms, mgsTasksJson);
 });
 
 ipcMain.on('start-mgs-search', (event, searchTerms) => {
     startSearchProcess('mgs', searchTerms);
 });
 
-function startSearchProcess(searchType, searchTerms) {
+function startSearchProcess(searchType, searchTerms, mgsTasksJson = null) {
     // General check: If any process is *actually* running (handle exists), block the new request.
     // This covers starting USPTO while MGS runs, MGS while MGS runs, USPTO while USPTO runs,
     // or starting MGS when USPTO is *truly* still running (not just the handle cleanup delay).
@@ -199,7 +252,7 @@ function startSearchProcess(searchType, searchTerms) {
     }
 
     let scriptPath;
-    if (searchType === 'uspto') {
+    if (searchType === 'uspto' || searchType === 'all') {
         scriptPath = path.join(__dirname, '..', 'python', 'search_script.py');
     } else if (searchType === 'mgs') {
         scriptPath = path.join(__dirname, '..', 'python', 'mgs_search_script.py');
@@ -213,11 +266,11 @@ function startSearchProcess(searchType, searchTerms) {
         let dataForEnv = null; // Data for environment variable (MGS)
 
         // Determine script path and set up args/env data accordingly
-        if (searchType === 'uspto') {
+        if (searchType === 'uspto' || searchType === 'all') {
             scriptPath = path.join(__dirname, '..', 'python', 'search_script.py');
-            // USPTO script expects args: --search_type, type, terms
-            commandArgs = ['--search_type', searchType, searchTerms];
-            console.log(`Main Process: Preparing USPTO script: python ${scriptPath} ${commandArgs.join(' ')}`);
+            // Terms and MGS tasks are streamed to stdin as NDJSON job records (no argv/env size limits)
+            commandArgs = ['--stream'];
+            console.log(`Main Process: Preparing ${searchType.toUpperCase()} search: python ${scriptPath} --stream (job records via stdin)`);
         } else if (searchType === 'mgs') {
             scriptPath = path.join(__dirname, '..', 'python', 'mgs_search_script.py');
             // MGS script expects NO args, data via env var MGS_TASKS_JSON
@@ -249,10 +302,11 @@ function startSearchProcess(searchType, searchTerms) {
             // Explicitly ensure only scriptPath is passed as argument
             const mgsArgs = [scriptPath];
             pythonProcess = spawn('python', mgsArgs, spawnOptions);
-        } else if (searchType === 'uspto') {
-            // Spawn USPTO script with the prepared command line arguments
-            console.log(`Main Process: Spawning USPTO: python ${scriptPath} ${commandArgs.join(' ')}`);
+        } else if (searchType === 'uspto' || searchType === 'all') {
+            console.log(`Main Process: Spawning ${searchType.toUpperCase()}: python ${scriptPath} ${commandArgs.join(' ')}`);
             pythonProcess = spawn('python', [scriptPath, ...commandArgs], spawnOptions);
+            writeJobRecords(pythonProcess.stdin, jobRecords(searchTerms, mgsTasksJson))
+                .catch(error => console.error('Main Process: Failed to write search job to Python stdin:', error));
         } else {
              // This case should have been caught earlier, but acts as a safeguard
              throw new Error(`Attempting to spawn unknown script type: ${searchType}`);
@@ -272,6 +326,32 @@ function startSearchProcess(searchType, searchTerms) {
     }
 }
 
+// Yields the NDJSON job records for --stream mode: one per USPTO term, one per MGS task
+function* jobRecords(searchTerms, mgsTasksJson) {
+    for (const term of (searchTerms || '').split(/[\n;]+/)) {
+        if (term.trim()) yield { source: 'uspto', term: term.trim() };
+    }
+    for (const task of (mgsTasksJson ? JSON.parse(mgsTasksJson) : [])) {
+        yield { source: 'mgs', term: task.term, needsNiceOn: !!task.needsNiceOn, needsNiceOff: !!task.needsNiceOff };
+    }
+}
+
+// Writes job records line by line, waiting for 'drain' whenever Python's stdin pipe is full
+async function writeJobRecords(stdin, records) {
+    stdin.on('error', error => console.warn('Main Process: Python stdin closed early:', error.message));
+    for (const record of records) {
+        if (stdin.destroyed) return;
+        if (!stdin.write(JSON.stringify(record) + '\n')) {
+            await new Promise(resolve => {
+                const done = () => { stdin.off('drain', done); stdin.off('close', done); resolve(); };
+                stdin.on('drain', done);
+                stdin.on('close', done);
+            });
+        }
+    }
+    stdin.end(); // EOF ends the job once every record has been handled
+}
+
 function setupProcessHandlers(process, searchType) {
     let bufferedOutput = '';
 
@@ -290,7 +370,8 @@ function setupProcessHandlers(process, searchType) {
 
                 switch (result.type) {
                     case 'progress':
-                        mainWindow.webContents.send('search-progress', result.value, searchType);
+                        // Combined runs report progress per source ('uspto' or 'mgs'), with that source's current concurrency limit
+                        mainWindow.webContents.send('search-progress', { progress: result.value, searchType: result.source || searchType, limit: result.limit });
                         break;
                     case 'result':
                         if (result.source === 'uspto') {
@@ -314,6 +395,9 @@ function setupProcessHandlers(process, searchType) {
                              console.warn(`Received time report with unknown source: ${result.source}`, result);
                         }
                         break;
+                    case 'metric':
+                        // Per-stage timing spans (SEARCH_METRICS=on) are for profiling and the benchmark; the UI ignores them
+                        break;
                     default:
                          console.warn(`Received message with unknown type: ${result.type}`, result);
                 }
@@ -338,12 +422,6 @@ function setupProcessHandlers(process, searchType) {
         // Send finished signal with search type and exit code
         if (mainWindow && !mainWindow.isDestroyed()) {
              mainWindow.webContents.send('search-finished', { searchType, code });
-
-             // If USPTO finished successfully, request the renderer to start MGS
-             if (searchType === 'uspto' && code === 0) {
-                 console.log("Main Process: USPTO finished successfully. Requesting renderer to start MGS search.");
-                 mainWindow.webContents.send('request-mgs-start');
-             }
         }
     });
 
@@ -362,28 +440,33 @@ function setupProcessHandlers(process, searchType) {
     });
 }
 
+// Python cancels its tasks and closes pages, contexts and Chromium within bounded time;
+// only force-kill if it has not exited by then (a killed process can orphan Chromium)
+const CANCEL_KILL_TIMEOUT_MS = 15000;
+
 ipcMain.on('cancel-search', () => {
     if (pythonProcess) {
         console.log(`Main Process: Attempting to cancel ${currentSearchType} search...`);
+        const cancellingProcess = pythonProcess;
         try {
+            // The cancellation file works on every platform (Python polls it)
             fs.writeFileSync(cancellationFile, 'cancel');
-            // Sending SIGTERM might be more graceful if Python script handles it
-            pythonProcess.kill('SIGTERM');
-            // Fallback kill after a short delay if SIGTERM doesn't work
+            // On POSIX, SIGTERM is handled by Python as a cancel request; on Windows it would terminate outright
+            if (process.platform !== 'win32') {
+                cancellingProcess.kill('SIGTERM');
+            }
+            // Fallback kill if the graceful shutdown does not finish in time
             setTimeout(() => {
-                if (pythonProcess) {
-                    console.log("Main Process: Force killing Python process after timeout.");
-                    pythonProcess.kill('SIGKILL');
+                if (cancellingProcess.exitCode === null && cancellingProcess.signalCode === null) {
+                    console.log("Main Process: Force killing Python process after cancel timeout.");
+                    cancellingProcess.kill('SIGKILL');
                 }
-            }, 500); // 500ms grace period
+            }, CANCEL_KILL_TIMEOUT_MS);
         } catch (error) {
             console.error("Error during cancel process:", error);
-            if (pythonProcess) pythonProcess.kill('SIGKILL'); // Force kill on error
-        } finally {
-            pythonProcess = null;
-            currentSearchType = null;
-            // Note: search-finished is sent by the 'close' handler now
+            cancellingProcess.kill('SIGKILL'); // Force kill on error
         }
+        // pythonProcess is cleared by the 'close' handler, so no new search starts while this one shuts down
     } else {
         console.log("Main Process: No active search process to cancel.");
     }
@@ -446,86 +529,122 @@ ipcMain.handle('ai:format-input', async (event, text) => {
     }
 });
 
-// IPC Handler for getting AI suggestions
-ipcMain.handle('ai:get-suggestions', async (event, term, reason, example) => {
-    console.log(`Main Process: Received 'ai:get-suggestions' for term: "${term}"`);
-    if (!term || !reason) {
-        throw new Error("Term and reason are required for AI suggestions.");
-    }
+// --- Resident Python worker (search_script.py --serve) ---
+// Suggestion and vagueness requests go to one long-lived process so Python startup,
+// the Gemini client setup and imports are paid once instead of on every click.
+let searchWorker = null;
+const workerRequests = new Map(); // request id -> { resolve, reject, records }
 
-    const scriptPath = path.join(__dirname, '..', 'python', 'search_script.py');
-    const args = [
-        scriptPath,
-        '--suggest', // Mode argument
-        '--term', term,
-        '--reason', reason
-    ];
-    if (example) {
-        args.push('--example', example);
+function getSearchWorker() {
+    if (searchWorker) {
+        return searchWorker;
     }
+    const scriptPath = path.join(__dirname, '..', 'python', 'search_script.py');
+    console.log(`Main Process: Spawning resident Python worker: python ${scriptPath} --serve`);
+    const worker = spawn('python', [scriptPath, '--serve'], { env: { ...process.env } });
+    let bufferedOutput = '';
 
-    console.log(`Main Process: Spawning Python for suggestions: python ${args.join(' ')}`);
-
-    return new Promise((resolve, reject) => {
-        const suggestionProcess = spawn('python', args);
-        let stdoutData = '';
-        let stderrData = '';
-
-        suggestionProcess.stdout.on('data', (data) => {
-            stdoutData += data.toString();
-        });
-
-        suggestionProcess.stderr.on('data', (data) => {
-            stderrData += data.toString();
-            console.error(`Python Suggestion stderr: ${data}`); // Log stderr immediately
-        });
+    worker.stdout.on('data', (data) => {
+        bufferedOutput += data.toString();
+        const lines = bufferedOutput.split('\n');
+        bufferedOutput = lines.pop();
 
-        suggestionProcess.on('close', (code) => {
-            console.log(`Python suggestion process exited with code ${code}`);
-            if (stderrData.trim() && !stderrData.includes("DEBUG:")) {
-                 // Reject if there was significant stderr output (excluding DEBUG lines)
-                 reject(new Error(`Python script error: ${stderrData.trim()}`));
-                 return;
+        lines.filter(line => line.trim() !== '').forEach(line => {
+            let record;
+            try {
+                record = JSON.parse(line);
+            } catch (e) {
+                console.warn("DEBUG: Error parsing worker JSON:", e, line);
+                return;
             }
-            if (code === 0) {
-                try {
-                    // Find the last JSON object/array in the output
-                    const jsonMatch = stdoutData.match(/(\[.*\]|\{.*\})\s*$/);
-                    if (!jsonMatch) {
-                        throw new Error("No valid JSON found in the script output.");
-                    }
-                    const jsonString = jsonMatch[0];
-                    const result = JSON.parse(jsonString);
-
-                    if (result.type === 'suggestions') {
-                        console.log(`Main Process: Received suggestions for "${term}":`, result.suggestions);
-                        resolve(result.suggestions); // Resolve with the array of suggestions
-                    } else if (result.type === 'error') {
-                         console.error(`Main Process: Python script returned error: ${result.message}`);
-                         reject(new Error(result.message));
-                    } else if (result.suggestions?.error) { // Handle error structure from suggest_alternatives_gemini
-                         console.error(`Main Process: AI suggestion function returned error: ${result.suggestions.error}`);
-                         reject(new Error(result.suggestions.error));
-                    }
-                    else {
-                         console.error(`Main Process: Unexpected JSON structure from Python script:`, result);
-                         reject(new Error('Unexpected response structure from suggestion script.'));
-                    }
-                } catch (e) {
-                    console.error(`Main Process: Error parsing JSON from Python suggestion script: ${e}`);
-                    console.error(`Main Process: Raw stdout: ${stdoutData}`);
-                    reject(new Error(`Failed to parse suggestions: ${e.message}`));
-                }
+            const pending = record.id ? workerRequests.get(record.id) : null;
+            if (!pending) {
+                return; // 'ready' and other untagged records
+            }
+            if (record.type === 'done') {
+                workerRequests.delete(record.id);
+                pending.resolve(pending.records);
             } else {
-                reject(new Error(`Python suggestion script exited with code ${code}. Stderr: ${stderrData}`));
+                pending.records.push(record);
             }
         });
+    });
 
-        suggestionProcess.on('error', (err) => {
-            console.error('Main Process: Failed to start Python suggestion process:', err);
-            reject(new Error(`Failed to start suggestion script: ${err.message}`));
-        });
+    worker.stderr.on('data', (data) => {
+        console.error(`Python worker stderr: ${data}`);
+    });
+
+    const failPending = (error) => {
+        workerRequests.forEach(pending => pending.reject(error));
+        workerRequests.clear();
+        if (searchWorker === worker) {
+            searchWorker = null;
+        }
+    };
+    worker.on('close', (code) => {
+        console.log(`Python worker exited with code ${code}`);
+        failPending(new Error(`Python worker exited with code ${code}`));
+    });
+    worker.on('error', (err) => {
+        console.error('Main Process: Failed to start Python worker:', err);
+        failPending(new Error(`Failed to start Python worker: ${err.message}`));
+    });
+
+    searchWorker = worker;
+    return worker;
+}
+
+// Sends one request to the worker and resolves with every record tagged with its id
+function sendWorkerRequest(op, payload) {
+    return new Promise((resolve, reject) => {
+        const id = crypto.randomUUID();
+        workerRequests.set(id, { resolve, reject, records: [] });
+        try {
+            getSearchWorker().stdin.write(JSON.stringify({ id, op, ...payload }) + '\n');
+        } catch (err) {
+            workerRequests.delete(id);
+            reject(err);
+        }
     });
+}
+
+function stopSearchWorker() {
+    if (searchWorker) {
+        try {
+            searchWorker.stdin.write(JSON.stringify({ op: 'shutdown' }) + '\n');
+            searchWorker.stdin.end();
+        } catch (err) {
+            searchWorker.kill();
+        }
+        searchWorker = null;
+    }
+}
+
+app.on('will-quit', stopSearchWorker);
+
+// IPC Handler for getting AI suggestions
+ipcMain.handle('ai:get-suggestions', async (event, term, reason, example) => {
+    console.log(`Main Process: Received 'ai:get-suggestions' for term: "${term}"`);
+    if (!term || !reason) {
+        throw new Error("Term and reason are required for AI suggestions.");
+    }
+
+    const records = await sendWorkerRequest('suggest', { term, reason, example: example || null });
+    const result = records.find(record => record.type === 'suggestions' || record.type === 'error');
+
+    if (result?.type === 'suggestions') {
+        if (result.suggestions?.error) { // Handle error structure from suggest_alternatives_gemini
+            console.error(`Main Process: AI suggestion function returned error: ${result.suggestions.error}`);
+            throw new Error(result.suggestions.error);
+        }
+        console.log(`Main Process: Received suggestions for "${term}":`, result.suggestions);
+        return result.suggestions; // Resolve with the array of suggestions
+    } else if (result?.type === 'error') {
+        console.error(`Main Process: Python worker returned error: ${result.message}`);
+        throw new Error(result.message);
+    }
+    console.error(`Main Process: Unexpected response from Python worker:`, records);
+    throw new Error('Unexpected response structure from suggestion worker.');
 });
 
 // IPC Handler for requesting vagueness check only
@@ -535,75 +654,23 @@ ipcMain.handle('request-vagueness-check', async (event, term) => {
         throw new Error("Term is required for vagueness check.");
     }
 
-    const scriptPath = path.join(__dirname, '..', 'python', 'search_script.py');
-    const args = [
-        scriptPath,
-        '--vagueness-only', // Mode argument
-        '--term', term
-    ];
-
-    console.log(`Main Process: Spawning Python for vagueness check: python ${args.join(' ')}`);
-
-    return new Promise((resolve, reject) => {
-        const vaguenessProcess = spawn('python', args);
-        let stdoutData = '';
-        let stderrData = '';
-
-        vaguenessProcess.stdout.on('data', (data) => {
-            stdoutData += data.toString();
-        });
+    const records = await sendWorkerRequest('vagueness', { term });
+    const result = records.find(record => record.type === 'vagueness_result' || record.type === 'error');
 
-        vaguenessProcess.stderr.on('data', (data) => {
-            stderrData += data.toString();
-            console.error(`Python Vagueness stderr: ${data}`); // Log stderr immediately
-        });
-
-        vaguenessProcess.on('close', (code) => {
-            console.log(`Python vagueness process exited with code ${code}`);
-            if (stderrData.trim() && !stderrData.includes("DEBUG:")) {
-                 reject(new Error(`Python script error: ${stderrData.trim()}`));
-                 return;
-            }
-            if (code === 0) {
-                try {
-                    // Find the last JSON object in the output
-                    const jsonMatch = stdoutData.match(/(\{.*\})\s*$/);
-                    if (!jsonMatch) {
-                        throw new Error("No valid JSON found in the vagueness script output.");
-                    }
-                    const jsonString = jsonMatch[0];
-                    const result = JSON.parse(jsonString);
-
-                    if (result.type === 'vagueness_result') {
-                        console.log(`Main Process: Received vagueness result for "${term}":`, result);
-                        // Resolve with the relevant parts: isVague and vaguenessReasoning
-                        resolve({
-                            isVague: result.isVague,
-                            vaguenessReasoning: result.vaguenessReasoning,
-                            error: result.error // Pass along any error reported by the script
-                        });
-                    } else if (result.type === 'error') {
-                         console.error(`Main Process: Python script returned error during vagueness check: ${result.message}`);
-                         reject(new Error(result.message));
-                    } else {
-                         console.error(`Main Process: Unexpected JSON structure from Python vagueness script:`, result);
-                         reject(new Error('Unexpected response structure from vagueness script.'));
-                    }
-                } catch (e) {
-                    console.error(`Main Process: Error parsing JSON from Python vagueness script: ${e}`);
-                    console.error(`Main Process: Raw stdout: ${stdoutData}`);
-                    reject(new Error(`Failed to parse vagueness result: ${e.message}`));
-                }
-            } else {
-                reject(new Error(`Python vagueness script exited with code ${code}. Stderr: ${stderrData}`));
-            }
-        });
-
-        vaguenessProcess.on('error', (err) => {
-            console.error('Main Process: Failed to start Python vagueness process:', err);
-            reject(new Error(`Failed to start vagueness script: ${err.message}`));
-        });
-    });
+    if (result?.type === 'vagueness_result') {
+        console.log(`Main Process: Received vagueness result for "${term}":`, result);
+        // Resolve with the relevant parts: isVague and vaguenessReasoning
+        return {
+            isVague: result.isVague,
+            vaguenessReasoning: result.vaguenessReasoning,
+            error: result.error // Pass along any error reported by the script
+        };
+    } else if (result?.type === 'error') {
+        console.error(`Main Process: Python worker returned error during vagueness check: ${result.message}`);
+        throw new Error(result.message);
+    }
+    console.error(`Main Process: Unexpected response from Python worker:`, records);
+    throw new Error('Unexpected response structure from vagueness worker.');
 });
 
 
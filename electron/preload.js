@@ -2,7 +2,7 @@
 const { contextBridge, ipcRenderer } = require('electron');
 
 contextBridge.exposeInMainWorld('electronAPI', {
-    startSearch: (searchTerms) => ipcRenderer.send('start-search', searchTerms),
+    startSearch: (searchTerms, mgsTasksJson) => ipcRenderer.send('start-search', searchTerms, mgsTasksJson), // MGS tasks optional; both run in one process
     startMgsSearch: (searchTerms) => ipcRenderer.send('start-mgs-search', searchTerms), // New MGS API
     cancelSearch: () => ipcRenderer.send('cancel-search'),
     exportToWord: (data) => ipcRenderer.send('export-to-word', data), // Added for Word export
@@ -14,7 +14,6 @@ contextBridge.exposeInMainWorld('electronAPI', {
     onSearchTime: (callback) => ipcRenderer.on('search-time', callback),
     onMgsSearchTime: (callback) => ipcRenderer.on('mgs-search-time', callback), // New MGS search time channel
     onSearchFinished: (callback) => ipcRenderer.on('search-finished', callback),
-    onRequestMgsStart: (callback) => ipcRenderer.on('request-mgs-start', callback), // Added for main process to trigger MGS start
     // Removed clearOutput listener exposure as it wasn't used consistently
     removeAllListeners: (channel) => ipcRenderer.removeAllListeners(channel),
 
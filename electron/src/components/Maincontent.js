@@ -107,7 +107,7 @@ function MainContent() {
     searchProgress,
     /** @type {string} Time taken for the current search. */
     searchTime,
-    /** @type {string} Identifier for the current search type ('uspto' or 'mgs'). */
+    /** @type {string} Identifier for the current search type ('uspto', 'mgs', or 'all' while both run). */
     currentSearch, // Needed for display logic
     /** @type {(usptoTerms: string[], mgsTasksArr: object[]) => void} Function to start the search workflow. */
     startWorkflow,
@@ -260,8 +260,8 @@ function MainContent() {
           onTabChange={handleTabChange}
           resultsByCategory={resultsByCategory} // From results hook
           // Derive loading states from workflow hook
-          isUsptoLoading={isWorkflowSearching && currentSearch === 'uspto'}
-          isMgsLoading={isWorkflowSearching && currentSearch === 'mgs'}
+          isUsptoLoading={isWorkflowSearching && (currentSearch === 'uspto' || currentSearch === 'all')}
+          isMgsLoading={isWorkflowSearching && (currentSearch === 'mgs' || currentSearch === 'all')}
           // Pass suggestion-related props
           allSuggestions={allSuggestions}
           fetchSuggestionsForTerm={fetchSuggestionsForTerm}
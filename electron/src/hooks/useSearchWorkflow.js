@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 // Removed 'import type' as this is a JS file. JSDoc @typedef will still work.
 
 /**
@@ -16,7 +16,7 @@ import { useState, useEffect, useCallback } from 'react';
  */
 
 /**
- * @typedef {'uspto' | 'mgs' | null} CurrentSearchType
+ * @typedef {'uspto' | 'mgs' | 'all' | null} CurrentSearchType - 'all' while USPTO and MGS run together.
  */
 
 /**
@@ -31,7 +31,7 @@ import { useState, useEffect, useCallback } from 'react';
  * @property {boolean} isSearching - True if either USPTO or MGS search is actively running.
  * @property {number} searchProgress - The progress percentage (0-100) of the current search type.
  * @property {SearchTime} searchTime - An object containing the completion times for USPTO and MGS searches.
- * @property {CurrentSearchType} currentSearch - Indicates which search type ('uspto', 'mgs') is currently active, or null.
+ * @property {CurrentSearchType} currentSearch - Indicates which search type ('uspto', 'mgs', 'all') is currently active, or null.
  * @property {string} currentTermMessage - A message indicating the specific term being processed (if available).
  * @property {(usptoTermsList: string[], mgsTasks: MgsTask[]) => void} startWorkflow - Function to initiate the search workflow with calculated USPTO terms and MGS tasks.
  * @property {() => void} cancelWorkflow - Function to signal cancellation of the ongoing search workflow.
@@ -40,8 +40,9 @@ import { useState, useEffect, useCallback } from 'react';
 
 /**
  * Custom hook to manage the state and execution logic of the live search workflow (USPTO and MGS).
- * It listens to IPC events from the main process to track progress, errors, and completion,
- * and orchestrates the sequence of USPTO then MGS searches.
+ * It listens to IPC events from the main process to track progress, errors, and completion.
+ * USPTO and MGS run concurrently in a single search process; the workflow completes once
+ * every source it started has reported its search time.
  *
  * @returns {SearchWorkflowValue} The search workflow state and control functions.
  */
@@ -55,63 +56,39 @@ export function useSearchWorkflow() {
   /** @type {[CurrentSearchType, React.Dispatch<React.SetStateAction<CurrentSearchType>>]} */
   const [currentSearch, setCurrentSearch] = useState(null);
   const [currentTermMessage, setCurrentTermMessage] = useState('');
-  /** @type {[MgsTask[], React.Dispatch<React.SetStateAction<MgsTask[]>>]} */
-  const [pendingMgsTasks, setPendingMgsTasks] = useState([]); // Store MGS tasks for transition
+  // Sources ('uspto', 'mgs') still running in this workflow, and the latest progress of each.
+  // Refs rather than state: both sources report independently and may do so back-to-back.
+  const pendingSourcesRef = useRef([]);
+  const sourceProgressRef = useRef({});
 
   // --- Internal Workflow Logic ---
 
-  /**
-   * Internal function to initiate the MGS search via IPC.
-   * Updates the status and progress state.
-   * @param {MgsTask[]} mgsTasks - The list of tasks for the MGS search.
-   */
-  const startMgsSearchInternal = useCallback((mgsTasks) => {
-      if (mgsTasks && mgsTasks.length > 0) {
-          const numTasks = mgsTasks.length;
-          console.log(`useSearchWorkflow: Requesting MGS search for ${numTasks} tasks via IPC...`, mgsTasks);
-          // DO NOT set state here. State will be set by handleSearchStarted upon confirmation from main process.
-          // Send the structured task data as JSON via the exposed API
-          window.electronAPI.startMgsSearch(JSON.stringify(mgsTasks));
-      } else {
-          console.log("useSearchWorkflow: No MGS searches needed or tasks empty.");
-          // If MGS wasn't needed, finalize the workflow state
-          setIsSearching(false);
-          setCurrentSearch(null);
-          setCurrentTermMessage('');
-          // Only set success if not already in error/cancelled state
-          if (searchStatus.type !== 'error' && searchStatus.type !== 'cancelled') {
-              setSearchStatus({ type: 'success', message: 'Search complete.' });
-          }
-      }
-  }, [searchStatus.type]); // Dependency: searchStatus.type to avoid setting success over error/cancel
-
   /**
    * Handles the completion of a specific search type (USPTO or MGS).
-   * Records the duration and initiates the next step (MGS) or finalizes the workflow.
+   * Records the duration and finalizes the workflow once no other source is still running.
    * @param {'uspto' | 'mgs'} searchTypeCompleted - The type of search that just finished.
    * @param {string} duration - The duration string reported by the search script.
    */
   const handleSearchCompletion = useCallback((searchTypeCompleted, duration) => {
-    if (searchTypeCompleted === 'uspto') {
-      setSearchTime(prev => ({ ...prev, uspto: duration }));
-      console.log(`useSearchWorkflow: USPTO search completed in ${duration}. Waiting for main process signal to start MGS.`);
-      // Signal that USPTO part is done, transitioning state. MGS start is now triggered by 'request-mgs-start' IPC.
-      setCurrentSearch(null);
-      // Removed: startMgsSearchInternal(pendingMgsTasks);
-    } else if (searchTypeCompleted === 'mgs') {
-      setSearchTime(prev => ({ ...prev, mgs: duration }));
-      console.log(`useSearchWorkflow: MGS search completed in ${duration}. All searches finished.`);
-      // Finalize the workflow state
-      setIsSearching(false);
-      setCurrentSearch(null);
-      setCurrentTermMessage('');
-      setPendingMgsTasks([]); // Clear the stored tasks
-      // Set success only if the status wasn't already error/cancelled
-      if (searchStatus.type !== 'error' && searchStatus.type !== 'cancelled') {
-        setSearchStatus({ type: 'success', message: 'Search complete.' });
-      }
+    setSearchTime(prev => ({ ...prev, [searchTypeCompleted]: duration }));
+    const remaining = pendingSourcesRef.current.filter(source => source !== searchTypeCompleted);
+    pendingSourcesRef.current = remaining;
+
+    if (remaining.length > 0) {
+      console.log(`useSearchWorkflow: ${searchTypeCompleted.toUpperCase()} search completed in ${duration}. Still running: ${remaining.join(', ')}.`);
+      setCurrentSearch(remaining[0]); // Only one other source can be left
+      return;
+    }
+    console.log(`useSearchWorkflow: ${searchTypeCompleted.toUpperCase()} search completed in ${duration}. All searches finished.`);
+    // Finalize the workflow state
+    setIsSearching(false);
+    setCurrentSearch(null);
+    setCurrentTermMessage('');
+    // Set success only if the status wasn't already error/cancelled
+    if (searchStatus.type !== 'error' && searchStatus.type !== 'cancelled') {
+      setSearchStatus({ type: 'success', message: 'Search complete.' });
     }
-  }, [startMgsSearchInternal, pendingMgsTasks, searchStatus.type]); // Dependencies
+  }, [searchStatus.type]); // Dependencies
 
   // --- Effect for IPC Event Handlers ---
   useEffect(() => {
@@ -120,28 +97,37 @@ export function useSearchWorkflow() {
       console.log(`useSearchWorkflow: IPC Event 'search-started': ${searchType}`);
       // This event confirms the main process has successfully started the search
       setIsSearching(true);
-      setCurrentSearch(searchType); // Set the current search type based on the event
+      // A combined ('all') process with a single source to run (e.g. MGS only) reports as that source
+      const activeSearch = searchType === 'all' && pendingSourcesRef.current.length === 1 ? pendingSourcesRef.current[0] : searchType;
+      setCurrentSearch(activeSearch); // Set the current search type based on the event
       setSearchProgress(0);
       setCurrentTermMessage('');
-      setSearchStatus({ type: 'searching', message: `Running ${searchType.toUpperCase()} search...` }); // Update status based on confirmed search type
+      const label = activeSearch === 'all' ? 'USPTO and MGS searches' : `${activeSearch.toUpperCase()} search`;
+      setSearchStatus({ type: 'searching', message: `Running ${label}...` }); // Update status based on confirmed search type
     };
 
     /** Handles 'search-progress' event from main process */
     const handleSearchProgress = (event, progressData) => {
-        // Expect progressData = { progress: number, searchType: string, currentTerm?: string }
+        // Expect progressData = { progress: number, searchType: string, limit?: number, currentTerm?: string }
         if (typeof progressData !== 'object' || progressData === null) {
             console.warn("useSearchWorkflow: IPC Event 'search-progress': Received unexpected format:", progressData);
             return;
         }
-        const { progress, searchType, currentTerm } = progressData;
-        console.log(`useSearchWorkflow: IPC Event 'search-progress': ${searchType} ${progress}% ${currentTerm ? `(${currentTerm})` : ''}`);
+        const { progress, searchType, limit, currentTerm } = progressData;
+        console.log(`useSearchWorkflow: IPC Event 'search-progress': ${searchType} ${progress}%${limit ? ` (concurrency ${limit})` : ''} ${currentTerm ? `(${currentTerm})` : ''}`);
 
-        setSearchProgress(progress);
+        // Overall progress is the mean over the sources this workflow started
+        sourceProgressRef.current = { ...sourceProgressRef.current, [searchType]: progress };
+        const sources = Object.keys(sourceProgressRef.current);
+        const overall = Math.round(sources.reduce((sum, source) => sum + sourceProgressRef.current[source], 0) / sources.length);
+        setSearchProgress(overall);
         if (currentTerm) {
             setCurrentTermMessage(`Processing: "${currentTerm}"`);
         }
         // Update status message only if it matches the currently active search
-        if (currentSearch === searchType) {
+        if (currentSearch === 'all') {
+            setSearchStatus(prev => ({ ...prev, type: 'searching', message: `Searching USPTO and MGS... ${overall}%` }));
+        } else if (currentSearch === searchType) {
             setSearchStatus(prev => ({ ...prev, type: 'searching', message: `Searching ${searchType.toUpperCase()}... ${progress}%` }));
         }
     };
@@ -169,7 +155,7 @@ export function useSearchWorkflow() {
       setIsSearching(false);
       setCurrentSearch(null);
       setCurrentTermMessage('');
-      setPendingMgsTasks([]); // Clear pending tasks on error
+      pendingSourcesRef.current = [];
      };
 
      /** Combined handler for time reports from both search types */
@@ -191,34 +177,24 @@ export function useSearchWorkflow() {
     /** Handles 'search-finished' event (process exit/cancel signal) from main process */
     const handleSearchFinished = (event, { searchType, code }) => { // Expect { searchType, code }
       console.log(`useSearchWorkflow: IPC Event 'search-finished': Process for ${searchType} exited/cancelled with code ${code}.`);
-      // Check if the active search process finished unexpectedly (non-zero exit code)
+      // Check if the search process finished unexpectedly (non-zero exit code)
       // and wasn't already handled by completion, error, or cancellation flows.
-      if (isSearching && currentSearch === searchType && !['success', 'error', 'cancelled'].includes(searchStatus.type)) {
+      // One process runs every source, so its exit ends the whole workflow.
+      if (isSearching && !['success', 'error', 'cancelled'].includes(searchStatus.type)) {
+        pendingSourcesRef.current = [];
         if (code !== 0) { // Process exited with an error code
-          console.warn(`useSearchWorkflow: ${searchType.toUpperCase()} process finished unexpectedly (code ${code}) while state was ${searchStatus.type}.`);
-          if (searchType === 'uspto') {
-            // If USPTO died unexpectedly, still try to run MGS if needed
-            console.log("useSearchWorkflow: USPTO exited unexpectedly, attempting to start MGS...");
-            startMgsSearchInternal(pendingMgsTasks);
-          } else {
-            // If MGS died unexpectedly, report error and stop
-            console.error(`useSearchWorkflow: MGS process exited unexpectedly (code ${code}).`);
-            setIsSearching(false);
-            setPendingMgsTasks([]);
-            setCurrentSearch(null);
-            setCurrentTermMessage('');
-            setSearchStatus({ type: 'error', message: `${searchType.toUpperCase()} search finished unexpectedly (code ${code}).` });
-          }
+          console.error(`useSearchWorkflow: ${searchType.toUpperCase()} process exited unexpectedly (code ${code}) while state was ${searchStatus.type}.`);
+          setIsSearching(false);
+          setCurrentSearch(null);
+          setCurrentTermMessage('');
+          setSearchStatus({ type: 'error', message: `${searchType.toUpperCase()} search finished unexpectedly (code ${code}).` });
         } else {
           // Process exited normally (code 0), but completion wasn't handled by 'search-time'/'mgs-search-time'
           // This *shouldn't* typically happen if the time report always comes before close, but handle defensively.
           console.warn(`useSearchWorkflow: ${searchType.toUpperCase()} process finished normally (code 0) but completion state wasn't set. Finalizing.`);
           setIsSearching(false);
-          setPendingMgsTasks([]);
           setCurrentSearch(null);
           setCurrentTermMessage('');
-          // If USPTO finished normally here, MGS should have been triggered by handleSearchCompletion.
-          // If MGS finished normally here, the workflow is done.
           // Set success only if not already error/cancelled.
           if (searchStatus.type !== 'error' && searchStatus.type !== 'cancelled') {
              setSearchStatus({ type: 'success', message: 'Search complete (finalized by exit).' });
@@ -241,13 +217,6 @@ export function useSearchWorkflow() {
      const unsubMgsTime = window.electronAPI.onMgsSearchTime(handleMgsSearchTime);
     const unsubFinished = window.electronAPI.onSearchFinished(handleSearchFinished);
 
-    /** Handles 'request-mgs-start' event from main process after USPTO finishes */
-    const handleRequestMgsStart = (event) => {
-        console.log("useSearchWorkflow: IPC Event 'request-mgs-start': Received signal from main process.");
-        startMgsSearchInternal(pendingMgsTasks);
-    };
-    const unsubRequestMgsStart = window.electronAPI.onRequestMgsStart(handleRequestMgsStart);
-
 
     // Cleanup function to remove listeners on unmount
     return () => {
@@ -258,7 +227,6 @@ export function useSearchWorkflow() {
       if (typeof unsubTime === 'function') unsubTime();
       if (typeof unsubMgsTime === 'function') unsubMgsTime();
       if (typeof unsubFinished === 'function') unsubFinished();
-      if (typeof unsubRequestMgsStart === 'function') unsubRequestMgsStart(); // Cleanup new listener
       // Fallback for older potential API structure
       window.electronAPI.removeAllListeners?.('search-started');
       window.electronAPI.removeAllListeners?.('search-progress');
@@ -266,15 +234,14 @@ export function useSearchWorkflow() {
       window.electronAPI.removeAllListeners?.('search-time');
       window.electronAPI.removeAllListeners?.('mgs-search-time');
       window.electronAPI.removeAllListeners?.('search-finished');
-      window.electronAPI.removeAllListeners?.('request-mgs-start'); // Cleanup new listener fallback
     };
-  }, [currentSearch, handleSearchCompletion, startMgsSearchInternal, pendingMgsTasks, isSearching, searchStatus.type]); // Dependencies updated
+  }, [currentSearch, handleSearchCompletion, isSearching, searchStatus.type]); // Dependencies updated
 
   // --- Control Functions Exposed by Hook ---
 
   /**
-   * Starts the search workflow. Determines whether to start with USPTO or MGS search
-   * based on the provided lists, or sets success state if no live searches are needed.
+   * Starts the search workflow. USPTO terms and MGS tasks are sent together and searched
+   * concurrently; sets success state if no live searches are needed.
    * @param {string[]} usptoTermsList - List of terms requiring USPTO search.
    * @param {MgsTask[]} mgsTasks - List of tasks for MGS search.
    */
@@ -285,28 +252,27 @@ export function useSearchWorkflow() {
       setIsSearching(false); // Will be set true by 'search-started' event if needed
       setCurrentSearch(null);
       setCurrentTermMessage('');
-      setPendingMgsTasks(mgsTasks || []); // Store MGS tasks for potential transition
+      const hasUsptoTerms = Boolean(usptoTermsList && usptoTermsList.length > 0);
+      const hasMgsTasks = Boolean(mgsTasks && mgsTasks.length > 0);
+      pendingSourcesRef.current = [...(hasUsptoTerms ? ['uspto'] : []), ...(hasMgsTasks ? ['mgs'] : [])];
+      sourceProgressRef.current = Object.fromEntries(pendingSourcesRef.current.map(source => [source, 0]));
 
-      // Determine the starting point of the workflow
-      if (usptoTermsList && usptoTermsList.length > 0) {
-          const numTerms = usptoTermsList.length;
-          console.log(`useSearchWorkflow: Starting workflow with USPTO search for ${numTerms} terms...`, usptoTermsList);
-          setSearchStatus({ type: 'searching', message: `Starting USPTO search (${numTerms} term${numTerms > 1 ? 's' : ''})...` });
-          setCurrentSearch('uspto');
-          // Initiate USPTO search via IPC
-          window.electronAPI.startSearch(usptoTermsList.join('\n'));
-      } else if (mgsTasks && mgsTasks.length > 0) {
-          console.log("useSearchWorkflow: Starting workflow directly with MGS search.");
-          // If no USPTO terms, start MGS directly
-          setIsSearching(true); // Set searching true here as no 'search-started' will fire for USPTO
-          startMgsSearchInternal(mgsTasks);
+      if (hasUsptoTerms || hasMgsTasks) {
+          const parts = [];
+          if (hasUsptoTerms) parts.push(`USPTO (${usptoTermsList.length} term${usptoTermsList.length > 1 ? 's' : ''})`);
+          if (hasMgsTasks) parts.push(`MGS (${mgsTasks.length} task${mgsTasks.length > 1 ? 's' : ''})`);
+          console.log(`useSearchWorkflow: Starting search workflow: ${parts.join(' + ')}`, usptoTermsList, mgsTasks);
+          setSearchStatus({ type: 'searching', message: `Starting ${parts.join(' and ')} search...` });
+          setCurrentSearch(hasUsptoTerms && hasMgsTasks ? 'all' : (hasUsptoTerms ? 'uspto' : 'mgs'));
+          // One search process runs both sources; the MGS tasks travel as JSON alongside the terms
+          window.electronAPI.startSearch(hasUsptoTerms ? usptoTermsList.join('\n') : '', hasMgsTasks ? JSON.stringify(mgsTasks) : undefined);
       } else {
           console.log("useSearchWorkflow: No live searches needed (results from local/cache only).");
           setSearchStatus({ type: 'success', message: 'Results loaded from local data/cache.' });
           setIsSearching(false); // Ensure searching is false
           setCurrentSearch(null);
       }
-  }, [startMgsSearchInternal]); // Dependency
+  }, []); // No dependencies: pending sources live in refs
 
   /**
    * Cancels the currently running search workflow.
@@ -325,7 +291,7 @@ export function useSearchWorkflow() {
     setCurrentSearch(null);
     setCurrentTermMessage('');
     setSearchProgress(0);
-    setPendingMgsTasks([]); // Clear pending tasks
+    pendingSourcesRef.current = [];
     setSearchStatus({ type: 'cancelled', message: 'Search cancelled by user.' });
     // Optional: Reset search times?
     // setSearchTime({ uspto: null, mgs: null });
@@ -1,7 +1,7 @@
 const { app, net, ipcMain } = require('electron');
 const fs = require('fs');
 const path = require('path');
-const { fork } = require('child_process');
+const { fork, spawn } = require('child_process');
 const axios = require('axios');
 const cheerio = require('cheerio');
 // Use dynamic import for electron-store (ESM module)
@@ -24,6 +24,7 @@ const RECORD_COUNT_SELECTOR = '.modal-title'; // Updated Selector: Try finding t
 const RECORD_COUNT_REGEX = /\((\d+)\s+records\)/; // Regex to extract the number
 const CONVERSION_SCRIPT_PATH = path.resolve(__dirname, '../../scripts/convert-excel-to-json.cjs');
 const OUTPUT_JSON_PATH = path.resolve(__dirname, './assets/id_manual_data.json');
+const INDEX_SCRIPT_PATH = path.resolve(__dirname, '../../python/id_manual_index.py'); // Builds the local lookup index
 const DOWNLOAD_DIR = path.join(app.getPath('temp'), 'uspto-manual-update'); // Temporary download location
 const STORE_KEY_RECORD_COUNT = 'lastKnownRecordCount';
 // --- End Configuration ---
@@ -168,6 +169,35 @@ function runConversionScript(mainWindow, downloadedExcelPath) {
     });
 }
 
+// 5b. Rebuild the Python search script's local ID Manual index from the new JSON
+function runIndexImport(mainWindow, jsonPath) {
+    sendStatus(mainWindow, 'converting', 'Rebuilding local ID Manual index...');
+    return new Promise((resolve) => {
+        const indexProcess = spawn('python', [INDEX_SCRIPT_PATH, jsonPath]);
+        let stderr = '';
+
+        indexProcess.stderr.on('data', (data) => {
+            stderr += data.toString();
+        });
+
+        indexProcess.on('error', (err) => {
+            // Not fatal: searches fall back to the live site without the index
+            console.error('Failed to start index import:', err);
+            resolve(false);
+        });
+
+        indexProcess.on('close', (code) => {
+            if (code === 0) {
+                sendStatus(mainWindow, 'converting', 'Local ID Manual index rebuilt.');
+                resolve(true);
+            } else {
+                console.error(`Index import exited with code ${code}. Stderr: ${stderr || 'N/A'}`);
+                resolve(false);
+            }
+        });
+    });
+}
+
 // 6. Orchestrate the update check
 async function checkForUpdates(mainWindow, isManualTrigger = false) {
     if (isChecking) {
@@ -196,6 +226,7 @@ async function checkForUpdates(mainWindow, isManualTrigger = false) {
 
         downloadedExcelPath = await downloadExcelFile(mainWindow);
         const finalJsonPath = await runConversionScript(mainWindow, downloadedExcelPath);
+        await runIndexImport(mainWindow, finalJsonPath);
 
         // Update successful - Removed storing record count as we didn't fetch it
         // await storeRecordCount(currentRecordCount); // Removed
@@ -0,0 +1,178 @@
+# python/adaptive_limit.py
+import os
+import sys
+import time
+import asyncio
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+DEFAULT_INITIAL_LIMIT = 4 # Start small: a laptop should not open 20 Chromium pages before we know it copes
+INCREASE_STEP = 1 # Additive increase per healthy window
+DECREASE_FACTOR = 0.7 # Multiplicative decrease on errors, timeouts or a latency spike
+LATENCY_TOLERANCE = 2.5 # A window's p90 above this multiple of the uncongested p50 counts as congestion
+BASELINE_DRIFT = 1.05 # Lets the uncongested baseline rise slowly when the remote site gets slower for good
+MIN_WINDOW = 8 # Completions per adjustment window, at least (otherwise the current limit)
+ADAPTIVE_ENABLED = os.environ.get("ADAPTIVE_CONCURRENCY", "on").lower() != "off"
+
+
+def _percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+class AdaptiveLimiter:
+    """Drop-in for asyncio.Semaphore (`async with limiter:`) whose permit count adapts AIMD-style.
+
+    Each window of completions (at least `limit`) is judged by its p90 hold time against the best
+    p50 seen so far: healthy windows add one permit, congested ones multiply the limit by
+    DECREASE_FACTOR. Exceptions escaping the `async with` block, or reported through
+    record_failure() by callers that handle their own errors, shrink the limit at once (at most
+    once per window); `is_congestion`, if given, picks which escaping exceptions count. The limit stays between `minimum` and `maximum`; ADAPTIVE_CONCURRENCY=off
+    pins it at `maximum`.
+    """
+
+    def __init__(self, name: str, maximum: int, initial: Optional[int] = None, minimum: int = 1,
+                 enabled: Optional[bool] = None, is_congestion: Optional[Callable[[BaseException], bool]] = None):
+        self.name = name
+        self.is_congestion = is_congestion
+        self.enabled = ADAPTIVE_ENABLED if enabled is None else enabled
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        start = initial if initial is not None else DEFAULT_INITIAL_LIMIT
+        self.limit = max(self.minimum, min(self.maximum, start)) if self.enabled else self.maximum
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._started: Dict[asyncio.Task, float] = {}
+        self._window: List[float] = []
+        self._window_failures = 0
+        self._decreased_this_window = False
+        self._saturated = False # Whether every permit was in use at some point this window
+        self.baseline: Optional[float] = None # Best (uncongested) window p50, in seconds
+        self.completed = 0
+        self.failures = 0
+        self.increases = 0
+        self.decreases = 0
+        self.peak_limit = self.limit
+
+    # --- Permits ---
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1 # Granted on the waiter's behalf
+                self._saturated = self._saturated or self.in_flight >= self.limit
+                waiter.set_result(None)
+
+    async def acquire(self) -> bool:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self._saturated = self._saturated or self.in_flight >= self.limit
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release() # Granted just before the cancellation landed; hand it on
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    async def __aenter__(self):
+        await self.acquire()
+        task = asyncio.current_task()
+        if task is not None:
+            self._started[task] = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        started = self._started.pop(asyncio.current_task(), None)
+        self.release()
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            return False # Cancelled work says nothing about the remote site
+        if exc_type is not None:
+            if self.is_congestion is None or self.is_congestion(exc):
+                self.record_failure()
+        elif started is not None:
+            self._record_latency(time.monotonic() - started)
+        return False
+
+    # --- Control ---
+
+    def record_failure(self) -> None:
+        """An error or timeout the caller handled itself: back off straight away."""
+        task = asyncio.current_task()
+        if task is not None:
+            self._started.pop(task, None) # Its hold time says nothing about healthy latency
+        self.completed += 1
+        self.failures += 1
+        self._window_failures += 1
+        if not self._decreased_this_window:
+            self._decrease("error")
+        self._maybe_close_window()
+
+    def skip_sample(self) -> None:
+        """The permit was held but no request went out (e.g. the caller's own deadline had passed): record nothing."""
+        task = asyncio.current_task()
+        if task is not None:
+            self._started.pop(task, None)
+
+    def _record_latency(self, seconds: float) -> None:
+        self.completed += 1
+        self._window.append(seconds)
+        self._maybe_close_window()
+
+    def _maybe_close_window(self) -> None:
+        if len(self._window) + self._window_failures < max(MIN_WINDOW, int(self.limit)):
+            return
+        if self._window and not self._decreased_this_window:
+            p50 = _percentile(self._window, 0.5)
+            p90 = _percentile(self._window, 0.9)
+            self.baseline = p50 if self.baseline is None else min(self.baseline * BASELINE_DRIFT, p50)
+            if p90 > self.baseline * LATENCY_TOLERANCE:
+                self._decrease(f"p90 {p90:.2f}s vs baseline {self.baseline:.2f}s")
+            elif self._window_failures == 0 and self._saturated:
+                self._increase() # Only grow when the current limit is actually being used
+        self._window = []
+        self._window_failures = 0
+        self._decreased_this_window = False
+        self._saturated = self.in_flight >= self.limit
+
+    def _increase(self) -> None:
+        if not self.enabled or self.limit >= self.maximum:
+            return
+        self.limit = min(self.maximum, self.limit + INCREASE_STEP)
+        self.peak_limit = max(self.peak_limit, self.limit)
+        self.increases += 1
+        self._wake()
+
+    def _decrease(self, reason: str) -> None:
+        self._decreased_this_window = True
+        if not self.enabled or self.limit <= self.minimum:
+            return
+        previous = self.limit
+        self.limit = max(self.minimum, int(self.limit * DECREASE_FACTOR))
+        self.decreases += 1
+        sys.stderr.write(f"DEBUG: {self.name} concurrency {previous} -> {self.limit} ({reason}).\n")
+
+    def stats(self) -> Dict:
+        return {
+            "limit": self.limit,
+            "peakLimit": self.peak_limit,
+            "maximum": self.maximum,
+            "completed": self.completed,
+            "failures": self.failures,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "baselineP50": round(self.baseline, 3) if self.baseline is not None else None,
+        }
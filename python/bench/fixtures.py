@@ -0,0 +1,83 @@
+# python/bench/fixtures.py
+import os
+import sys
+import random
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # The search scripts' directory
+from id_manual_index import read_export
+
+# Vocabulary for synthetic ID Manual entries, shaped like real ones ("<goods>, namely, <items> for <purpose>")
+GOODS = ["bags", "boxes", "brushes", "cases", "clothing", "containers", "cups", "gloves", "hats", "jackets", "knives",
+         "lamps", "mats", "mugs", "pens", "plates", "pouches", "scarves", "shirts", "shoes", "socks", "toys", "trays", "wallets"]
+MATERIALS = ["cotton", "leather", "metal", "paper", "plastic", "rubber", "silk", "steel", "wood", "wool", "glass", "ceramic"]
+PURPOSES = ["camping", "cooking", "gardening", "hunting", "travel", "sports", "storage", "cleaning", "fishing", "school",
+            "office use", "medical use", "pets", "babies", "cosmetics", "jewelry"]
+SERVICES = ["retail store services", "online retail store services", "repair services", "rental services",
+            "installation services", "consulting services", "design services", "cleaning services"]
+
+
+def synthetic_entries(count: int = 5000, seed: int = 1) -> List[Dict]:
+    """Deterministic ID Manual-like entries: {"description", "status", "termId", "niceClass", "nice"}."""
+    rng = random.Random(seed)
+    entries, seen = [], set()
+    while len(entries) < count:
+        shape = rng.random()
+        goods, material, purpose = rng.choice(GOODS), rng.choice(MATERIALS), rng.choice(PURPOSES)
+        if shape < 0.4:
+            description = f"{material} {goods} for {purpose}"
+        elif shape < 0.7:
+            description = f"{goods}, namely, {material} {goods} for {purpose}"
+        elif shape < 0.9:
+            description = f"{rng.choice(SERVICES)} featuring {material} {goods}"
+        else:
+            description = f"{material} {goods}"
+        if description in seen:
+            continue
+        seen.add(description)
+        is_service = "services" in description
+        entries.append({
+            "description": description,
+            "status": "D" if rng.random() < 0.03 else "A",
+            "termId": f"{rng.randint(1, 999):03d}-{len(entries) + 1:04d}",
+            "niceClass": str(rng.choice([35, 37, 40, 42]) if is_service else rng.choice([8, 16, 18, 20, 21, 25, 28])),
+            "nice": rng.random() < 0.6, # Listed in the NICE classification, so shown with MGS's NICE filter on
+        })
+    return entries
+
+
+def load_entries(path: Optional[str], count: int, seed: int) -> List[Dict]:
+    """Entries from a recorded ID Manual export (JSON or CSV, as the updater writes it) or synthetic ones."""
+    if not path:
+        return synthetic_entries(count, seed)
+    rng = random.Random(seed)
+    entries = read_export(path)
+    for entry in entries: # Exports carry no NICE data; make some up, stably
+        entry["niceClass"] = str(rng.randint(1, 45))
+        entry["nice"] = rng.random() < 0.6
+    return entries
+
+
+def build_docket(entries: List[Dict], size: int, seed: int = 1) -> List[str]:
+    """`size` distinct terms mixing what a docket hits: exact entries, phrases inside entries,
+    entries with an extra word (prefix search) and terms the ID Manual has nothing for."""
+    rng = random.Random(seed + size)
+    terms, seen = [], set()
+    while len(terms) < size:
+        entry = rng.choice(entries)["description"]
+        words = entry.replace(",", "").split()
+        kind = len(terms) % 4
+        if kind == 0:
+            term = entry # Full match (or deleted)
+        elif kind == 1 and len(words) > 2:
+            start = rng.randint(0, len(words) - 2)
+            term = " ".join(words[start:start + 2]) # Part of larger descriptions
+        elif kind == 2:
+            term = f"{entry} with logo {len(terms)}" # Known start, unknown tail: exercises the prefix search
+        else:
+            term = f"zyx{len(terms)} widgets" # Nothing anywhere
+        if term in seen: # Small vocabularies run out of distinct phrases on big dockets
+            term = f"{entry} with logo {len(terms)}"
+        seen.add(term)
+        terms.append(term)
+    return terms
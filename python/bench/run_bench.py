@@ -0,0 +1,259 @@
+# python/bench/run_bench.py
+"""Offline throughput benchmark for the USPTO and MGS searches, run against the local stand-in.
+
+For each docket size a fresh `search_script.py --stream` process (with an empty result cache)
+is pointed at bench/standin_server.py through the USPTO_BASE_URL / MGS_BASE_URL / USPTO_API_URL /
+GEMINI_API_ENDPOINT overrides, then fed terms with at most --window of them outstanding. Reported
+per size: terms/sec, p50/p95/p99 per-term latency (job record written to its last result), the
+peak RSS of the search process tree (Python plus the browser it starts) and, from the process's
+SEARCH_METRICS spans, count and p50/p95 milliseconds per pipeline stage.
+
+    python bench/run_bench.py --sizes 10,100,1000 --source all --latency-ms 80 --json bench_output.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from standin_server import add_fault_arguments, base_urls, make_server, state_from_args
+from fixtures import build_docket
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEARCH_SCRIPT = os.path.join(SCRIPTS_DIR, "search_script.py")
+DEFAULT_SIZES = "10,100,1000,10000"
+DEFAULT_WINDOW = 50 # Outstanding terms; the stream keeps the search process busy without queueing everything
+RSS_SAMPLE_SECONDS = 0.2
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+
+def _children(pid: int) -> List[int]:
+    children = []
+    try:
+        for tid in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{tid}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def _proc_rss(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pid: int) -> Optional[int]:
+    """Resident bytes of the process and all its descendants (psutil if installed, else /proc); None if neither works."""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            total = 0
+            for proc in [root] + root.children(recursive=True):
+                try:
+                    total += proc.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total
+        except psutil.Error:
+            return None
+    if not os.path.isdir("/proc"):
+        return None
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total += _proc_rss(current)
+        pending.extend(_children(current))
+    return total
+
+
+def job_records(terms: List[str], source: str) -> List[Tuple[Tuple[str, str], Dict, int]]:
+    """(key, job record, results expected) per job; MGS jobs ask for both NICE settings."""
+    jobs = []
+    for term in terms:
+        if source in ("uspto", "all"):
+            jobs.append((("uspto", term), {"source": "uspto", "term": term}, 1))
+        if source in ("mgs", "all"):
+            jobs.append((("mgs", term), {"source": "mgs", "term": term, "needsNiceOn": True, "needsNiceOff": True}, 2))
+    return jobs
+
+
+async def run_docket(terms: List[str], source: str, env: Dict[str, str], window: int, workdir: str) -> Dict:
+    """Streams one docket through a fresh search process and measures it."""
+    jobs = job_records(terms, source)
+    remaining = {key: expected for key, _, expected in jobs}
+    sent: Dict[Tuple[str, str], float] = {}
+    latencies: List[float] = []
+    outcomes: Counter = Counter()
+    limits: Dict[str, int] = {}
+    stage_ms: Dict[str, List[float]] = defaultdict(list)
+    slots = asyncio.Semaphore(window)
+    peak_rss = [None]
+
+    with open(os.path.join(workdir, "search.log"), "wb") as log:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, SEARCH_SCRIPT, "--stream", cwd=workdir, env=env,
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=log, limit=2 ** 22)
+    started = time.perf_counter()
+    finished = started
+
+    async def write_jobs() -> None:
+        for key, record, _ in jobs:
+            await slots.acquire()
+            sent[key] = time.perf_counter()
+            process.stdin.write((json.dumps(record) + "\n").encode("utf-8"))
+            await process.stdin.drain()
+        process.stdin.write_eof()
+
+    async def read_results() -> None:
+        nonlocal finished
+        async for raw in process.stdout:
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if record.get("type") == "progress" and "limit" in record:
+                limits[record.get("source")] = record["limit"]
+            if record.get("type") == "metric":
+                stage_ms[record["stage"]].append(record["ms"])
+                continue
+            if record.get("type") not in ("result", "error") or "term" not in record:
+                continue
+            source_name = str(record.get("source", ""))
+            key = ("mgs" if source_name.startswith("mgs") else source_name, record["term"])
+            if key not in remaining or key not in sent:
+                continue
+            outcomes[record.get("matchType") or record.get("errorKind") or "error"] += 1
+            remaining[key] -= 1
+            if remaining[key] == 0:
+                finished = time.perf_counter()
+                latencies.append(finished - sent[key])
+                slots.release()
+
+    async def sample_rss() -> None:
+        while True:
+            rss = process_tree_rss(process.pid)
+            if rss is not None:
+                peak_rss[0] = max(peak_rss[0] or 0, rss)
+            await asyncio.sleep(RSS_SAMPLE_SECONDS)
+
+    writer = asyncio.create_task(write_jobs())
+    sampler = asyncio.create_task(sample_rss())
+    try:
+        await read_results() # Ends when the process closes stdout
+    finally:
+        for task in (writer, sampler):
+            task.cancel()
+        await asyncio.gather(writer, sampler, return_exceptions=True)
+        exit_code = await process.wait()
+
+    elapsed = finished - started
+    return {
+        "size": len(terms),
+        "jobs": len(jobs),
+        "completed": len(latencies),
+        "wallSeconds": round(elapsed, 3),
+        "termsPerSecond": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+        "latencyP50": percentile(latencies, 0.5),
+        "latencyP95": percentile(latencies, 0.95),
+        "latencyP99": percentile(latencies, 0.99),
+        "peakRssMb": round(peak_rss[0] / 2 ** 20, 1) if peak_rss[0] else None,
+        "outcomes": dict(outcomes),
+        "finalLimits": limits,
+        "stages": {stage: {"count": len(ms), "p50Ms": percentile(ms, 0.5), "p95Ms": percentile(ms, 0.95)}
+                   for stage, ms in sorted(stage_ms.items())},
+        "exitCode": exit_code,
+    }
+
+
+def search_env(urls: Dict[str, str], workdir: str, engine: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update(urls)
+    env.update({
+        "SEARCH_CACHE_PATH": os.path.join(workdir, "cache.sqlite3"), # Cold cache every run
+        "ID_MANUAL_INDEX": "off", # Measure the network path, not the local index
+        "USPTO_SEARCH_ENGINE": engine,
+        "GEMINI_API_KEY": "bench-stub", # Only ever sent to the stand-in
+        "SEARCH_METRICS": "on", # Per-stage spans for the breakdown
+        "PYTHONUNBUFFERED": "1",
+    })
+    return env
+
+
+def print_row(result: Dict) -> None:
+    def show(value, suffix=""):
+        return "-" if value is None else f"{value}{suffix}"
+    print(f"{result['size']:>7} {result['completed']:>6}/{result['jobs']:<6} {show(result['termsPerSecond']):>9} "
+          f"{show(result['latencyP50'], 's'):>9} {show(result['latencyP95'], 's'):>9} {show(result['latencyP99'], 's'):>9} "
+          f"{show(result['peakRssMb'], ' MB'):>11}  {json.dumps(result['outcomes'])}", flush=True)
+    for stage, timing in result["stages"].items(): # Spans nest (a page_acquire includes its goto), so these overlap
+        print(f"{'':>9}{stage:<18} {timing['count']:>7} x  p50 {show(timing['p50Ms'], 'ms'):>11}  p95 {show(timing['p95Ms'], 'ms'):>11}", flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Offline search benchmark against the local stand-in.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Comma-separated docket sizes (default {DEFAULT_SIZES}).")
+    parser.add_argument("--source", choices=["uspto", "mgs", "all"], default="all")
+    parser.add_argument("--engine", choices=["browser", "http"], default="browser", help="USPTO_SEARCH_ENGINE for the search process.")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help=f"Terms outstanding at once (default {DEFAULT_WINDOW}).")
+    parser.add_argument("--json", help="Also write the results to this file.")
+    parser.add_argument("--keep-logs", action="store_true", help="Keep each run's working directory (search.log, cache).")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    state = state_from_args(args)
+    server = make_server(state)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = base_urls(server)
+    print(f"Stand-in at {urls['USPTO_BASE_URL'].rsplit('/', 1)[0]} serving {len(state.entries)} entries; "
+          f"source={args.source} engine={args.engine} window={args.window}", flush=True)
+    print(f"{'terms':>7} {'done':>13} {'terms/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'peak RSS':>11}  outcomes", flush=True)
+
+    results = []
+    try:
+        for size in (int(size) for size in args.sizes.split(",") if size.strip()):
+            workdir = tempfile.mkdtemp(prefix=f"bench-{size}-")
+            try:
+                result = asyncio.run(run_docket(build_docket(state.entries, size, args.seed), args.source,
+                                                search_env(urls, workdir, args.engine), args.window, workdir))
+            finally:
+                if args.keep_logs:
+                    print(f"  logs: {workdir}", flush=True)
+                else:
+                    shutil.rmtree(workdir, ignore_errors=True)
+            results.append(result)
+            print_row(result)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"Stand-in requests: {json.dumps(dict(state.counters))}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "requests": dict(state.counters), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
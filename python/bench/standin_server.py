@@ -0,0 +1,296 @@
+# python/bench/standin_server.py
+"""Local stand-in for the USPTO ID Manual, WIPO MGS and the Gemini API, for offline benchmarks.
+
+Serves pages with the elements and selectors the search scripts rely on (div.main-search
+input.search-term, span.page-results, td[data-column], a.view-record; input#btnSearch,
+input#searchInputBox, input#checkNiceFilterSearch, span#searchButton, div#divHitList, li[cls],
+span.classBadge), answering searches from recorded or synthetic ID Manual entries. Searches can
+be slowed down (--latency-ms, --jitter-ms) and made to fail (--failure-rate: HTTP 503, the UI
+does not re-render), drop the connection (--drop-rate, page loads too) or never answer
+(--hang-rate). Gemini generateContent calls get canned vagueness answers.
+
+    python bench/standin_server.py --port 8765 --latency-ms 80
+"""
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from fixtures import load_entries # Also puts the scripts' directory on sys.path
+from term_matching import normalize_text # The live search's normalization, so matches agree with the scripts
+
+HANG_SECONDS = 600 # Longer than any deadline the scripts use
+MAX_ROWS = 100 # Listing rows returned per search
+
+USPTO_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>ID Manual (stand-in)</title></head>
+<body>
+<div class="main-search"><input class="search-term" type="text" placeholder="Search the ID Manual"></div>
+<span class="page-results"></span>
+<table id="results"><tbody></tbody></table>
+<script>
+const esc = s => String(s).replace(/[&<>"]/g, c => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c]));
+const input = document.querySelector("div.main-search input.search-term");
+input.addEventListener("keydown", async (event) => {
+    if (event.key !== "Enter") return;
+    let response;
+    try { response = await fetch("/uspto/search?q=" + encodeURIComponent(input.value)); } catch (e) { return; }
+    if (!response.ok) return; // Like the real UI after a failed request: nothing re-renders
+    const data = await response.json();
+    document.querySelector("span.page-results").textContent = data.banner;
+    document.querySelector("#results tbody").innerHTML = data.rows.map(row =>
+        `<tr><td data-column="description">${esc(row.description)}</td><td data-column="status">${esc(row.status || "")}</td>` +
+        `<td><a class="view-record" href="#">${esc(row.termId || "")}</a></td></tr>`).join("");
+});
+</script>
+</body></html>
+"""
+
+MGS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>MGS (stand-in)</title></head>
+<body>
+<input type="button" id="btnSearch" value="Search">
+<div id="searchTab" style="display: none">
+    <input id="searchInputBox" class="dummyClass" type="text">
+    <label><input type="checkbox" id="checkNiceFilterSearch"> NICE</label>
+    <span id="searchButton">Search</span>
+    <div id="divHitList"></div>
+</div>
+<script>
+const esc = s => String(s).replace(/[&<>"]/g, c => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c]));
+document.getElementById("btnSearch").addEventListener("click", () => {
+    document.getElementById("searchTab").style.display = "block";
+});
+document.getElementById("searchButton").addEventListener("click", async () => {
+    const term = document.getElementById("searchInputBox").value;
+    const nice = document.getElementById("checkNiceFilterSearch").checked ? 1 : 0;
+    let response;
+    try { response = await fetch(`/mgs/search?nice=${nice}&q=` + encodeURIComponent(term)); } catch (e) { return; }
+    if (!response.ok) return;
+    const data = await response.json();
+    document.getElementById("divHitList").innerHTML = data.items.length
+        ? "<ul>" + data.items.map(item => `<li cls="${esc(item.cls)}">${esc(item.text)}<span class="classBadge">${esc(item.cls)}</span></li>`).join("") + "</ul>"
+        : '<div id="hitListBanner">No results</div>';
+});
+</script>
+</body></html>
+"""
+
+
+class StandInState:
+    """The entries being served, the injected faults and request counters (shared by handler threads)."""
+
+    def __init__(self, entries: List[Dict], latency_ms: float = 0, jitter_ms: float = 0, failure_rate: float = 0,
+                 drop_rate: float = 0, hang_rate: float = 0, gemini_latency_ms: float = 0, seed: int = 1):
+        self.entries = entries
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.hang_rate = hang_rate
+        self.gemini_latency_ms = gemini_latency_ms
+        self.counters: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._normalized = [normalize_text(entry["description"]) for entry in entries]
+        self._by_word: Dict[str, set] = {}
+        for i, text in enumerate(self._normalized):
+            for word in text.split():
+                self._by_word.setdefault(word, set()).add(i)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def fate(self) -> str:
+        """One of "ok", "fail", "drop" or "hang" for a request, drawn by the configured rates."""
+        with self._lock:
+            roll = self._rng.random()
+        for name, rate in (("drop", self.drop_rate), ("hang", self.hang_rate), ("fail", self.failure_rate)):
+            if roll < rate:
+                return name
+            roll -= rate
+        return "ok"
+
+    def delay(self, base_ms: float) -> None:
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        if base_ms + jitter > 0:
+            time.sleep((base_ms + jitter) / 1000)
+
+    def matching(self, query: str) -> List[int]:
+        """Entries containing the query (whole words), exact matches first."""
+        normalized = normalize_text(query)
+        words = normalized.split()
+        if not words:
+            return []
+        candidates = set.intersection(*(self._by_word.get(word, set()) for word in words))
+        found = [i for i in candidates if normalized in self._normalized[i]]
+        return sorted(found, key=lambda i: (self._normalized[i] != normalized, i))
+
+    def uspto_search(self, query: str) -> Dict:
+        found = self.matching(query)
+        rows = [{key: self.entries[i][key] for key in ("description", "status", "termId")} for i in found[:MAX_ROWS]]
+        normalized = normalize_text(query)
+        if found and self._normalized[found[0]] == normalized:
+            banner = f'Displaying search results for: "{query}"'
+        elif found:
+            banner = f"Displaying all of {len(found)} listings"
+        else:
+            banner = f'No results for "{query}"' # Neither "Displaying" nor "No listings found": the scripts try prefixes
+        return {"banner": banner, "rows": rows}
+
+    def mgs_search(self, query: str, nice: bool) -> Dict:
+        found = [i for i in self.matching(query) if self.entries[i].get("nice") or not nice]
+        return {"items": [{"cls": self.entries[i].get("niceClass", ""), "text": self.entries[i]["description"]} for i in found[:MAX_ROWS]]}
+
+
+def gemini_answer(prompt: str) -> str:
+    """Canned vagueness answers: two words or fewer count as vague. Batched prompts get the JSON list they ask for."""
+    def verdict(term: str) -> str:
+        return "Vague" if len(term.split()) <= 2 else "Not Vague"
+    if "Respond ONLY with a JSON list" in prompt:
+        items = re.findall(r"^(\d+)\. (.+)$", prompt, re.MULTILINE)
+        return json.dumps([{"id": int(i), "classification": verdict(term), "reasoning": "Stand-in answer."} for i, term in items])
+    term_match = re.search(r"Trademark Description: (.+)", prompt)
+    if term_match:
+        return f"**Classification: {verdict(term_match.group(1))}**\nReasoning: Stand-in answer."
+    return "Stand-in answer."
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # Keep-alive, like the real sites
+    state: StandInState # Set on the subclass built by make_server
+
+    def log_message(self, format, *args) -> None:
+        pass # One line per request would swamp the bench output
+
+    def _send(self, status: int, body: str, content_type: str = "application/json") -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _faulted(self, kind: str) -> bool:
+        """Applies latency and any injected fault; True when the request was already dealt with."""
+        self.state.count(kind)
+        fate = self.state.fate()
+        if fate == "drop":
+            self.state.count("dropped")
+            self.close_connection = True # No response at all: net::ERR_EMPTY_RESPONSE in the browser
+            return True
+        if fate == "hang":
+            self.state.count("hung")
+            time.sleep(HANG_SECONDS)
+            self.close_connection = True
+            return True
+        self.state.delay(self.state.latency_ms)
+        if fate == "fail":
+            self.state.count("failed")
+            self._send(503, json.dumps({"error": "Service unavailable (injected)"}))
+            return True
+        return False
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        query = (params.get("q") or params.get("searchInfo") or [""])[0]
+        if url.path == "/id-master-list-public.html":
+            if not self._faulted("usptoPage"):
+                self._send(200, USPTO_PAGE, "text/html")
+        elif url.path == "/uspto/search":
+            if not self._faulted("usptoSearch"):
+                self._send(200, json.dumps(self.state.uspto_search(query)))
+        elif url.path == "/idm2-services/search/public": # What the HTTP engine (USPTO_API_URL) calls
+            if not self._faulted("usptoApi"):
+                self._send(200, json.dumps({"docs": self.state.uspto_search(query)["rows"]}))
+        elif url.path in ("/mgs", "/mgs/"):
+            if not self._faulted("mgsPage"):
+                self._send(200, MGS_PAGE, "text/html")
+        elif url.path == "/mgs/search":
+            if not self._faulted("mgsSearch"):
+                self._send(200, json.dumps(self.state.mgs_search(query, (params.get("nice") or ["0"])[0] == "1")))
+        elif url.path == "/stats":
+            self._send(200, json.dumps(dict(self.state.counters)))
+        else:
+            self._send(404, json.dumps({"error": "Not found"}))
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not re.fullmatch(r"/v1(beta)?/models/[^/:]+:generateContent", urlparse(self.path).path):
+            self._send(404, json.dumps({"error": "Not found"}))
+            return
+        self.state.count("gemini")
+        self.state.delay(self.state.gemini_latency_ms)
+        try:
+            request = json.loads(body or b"{}")
+            prompt = "\n".join(part.get("text", "") for content in request.get("contents", []) for part in content.get("parts", []))
+        except (json.JSONDecodeError, AttributeError):
+            self._send(400, json.dumps({"error": {"code": 400, "message": "Invalid JSON payload"}}))
+            return
+        self._send(200, json.dumps({
+            "candidates": [{"content": {"parts": [{"text": gemini_answer(prompt)}], "role": "model"}, "finishReason": "STOP", "index": 0}],
+        }))
+
+
+def make_server(state: StandInState, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    handler = type("BoundStandInHandler", (StandInHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True # Hung requests must not keep the process alive
+    return server
+
+
+def base_urls(server: ThreadingHTTPServer) -> Dict[str, str]:
+    """Environment overrides that point the search scripts at this server."""
+    root = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    return {
+        "USPTO_BASE_URL": f"{root}/id-master-list-public.html",
+        "USPTO_API_URL": f"{root}/idm2-services/search/public",
+        "MGS_BASE_URL": f"{root}/mgs/",
+        "GEMINI_API_ENDPOINT": root,
+    }
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--fixtures", help="Recorded ID Manual export (JSON or CSV) to serve instead of synthetic entries.")
+    parser.add_argument("--entries", type=int, default=5000, help="Synthetic entries to generate (default 5000).")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=50, help="Added to every page load and search (default 50).")
+    parser.add_argument("--jitter-ms", type=float, default=25, help="Uniform +/- jitter on the latency (default 25).")
+    parser.add_argument("--failure-rate", type=float, default=0, help="Share of requests answered with HTTP 503.")
+    parser.add_argument("--drop-rate", type=float, default=0, help="Share of requests whose connection is dropped unanswered.")
+    parser.add_argument("--hang-rate", type=float, default=0, help="Share of requests that never get an answer.")
+    parser.add_argument("--gemini-latency-ms", type=float, default=300, help="Stub Gemini response time (default 300).")
+
+
+def state_from_args(args: argparse.Namespace) -> StandInState:
+    return StandInState(load_entries(args.fixtures, args.entries, args.seed), args.latency_ms, args.jitter_ms, args.failure_rate,
+                        args.drop_rate, args.hang_rate, args.gemini_latency_ms, args.seed)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the ID Manual, MGS and Gemini.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+    server = make_server(state_from_args(args), args.host, args.port)
+    print(json.dumps(base_urls(server)), flush=True) # Export these to point the scripts here
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# python/cancellation.py
+import os
+import sys
+import signal
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Dict, Iterable
+
+# Absolute so the check does not depend on the working directory; main.js writes python/cancel_search.tmp
+CANCELLATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cancel_search.tmp")
+FILE_POLL_SECONDS = 0.2
+CLOSE_TIMEOUT_SECONDS = float(os.environ.get("CANCEL_CLOSE_TIMEOUT", 5)) # Per teardown step once cancelled
+
+
+def cancellation_requested() -> bool:
+    return os.path.exists(CANCELLATION_FILE)
+
+
+def clear_cancellation_file() -> None:
+    try:
+        os.remove(CANCELLATION_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        sys.stderr.write(f"WARN: Could not remove cancellation file: {e}\n")
+
+
+def install_signal_handlers(cancel_event: asyncio.Event) -> None:
+    """SIGTERM/SIGINT (and SIGBREAK on Windows) set cancel_event instead of killing the process."""
+    loop = asyncio.get_running_loop()
+    for name in ("SIGTERM", "SIGINT", "SIGBREAK"):
+        sig = getattr(signal, name, None)
+        if sig is None:
+            continue
+        try:
+            loop.add_signal_handler(sig, cancel_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows event loops have no add_signal_handler; Python-level handlers run on the main thread
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(cancel_event.set))
+
+
+async def _watch_file(cancel_event: asyncio.Event) -> None:
+    while not cancel_event.is_set():
+        if cancellation_requested():
+            sys.stderr.write("DEBUG: Cancellation file found.\n")
+            cancel_event.set()
+            return
+        await asyncio.sleep(FILE_POLL_SECONDS)
+
+
+@asynccontextmanager
+async def watch_cancellation(cancel_event: asyncio.Event):
+    """For the duration of a run: signals and the cancellation file both set cancel_event."""
+    install_signal_handlers(cancel_event)
+    watcher = asyncio.create_task(_watch_file(cancel_event))
+    try:
+        yield cancel_event
+    finally:
+        watcher.cancel()
+
+
+def cancelled_result(term: str, source: str) -> Dict:
+    """The result record reported for a term whose search was cancelled."""
+    return {"type": "result", "term": term, "source": source, "matchType": "cancelled", "statusText": "Search Cancelled"}
+
+
+async def as_completed_until_cancelled(tasks: Iterable[asyncio.Task], cancel_event: asyncio.Event) -> AsyncIterator[asyncio.Task]:
+    """Yields tasks as they finish. Once cancel_event is set, cancels the unfinished ones and stops."""
+    pending = set(tasks)
+    cancel_wait = asyncio.ensure_future(cancel_event.wait())
+    try:
+        while pending and not cancel_event.is_set():
+            done, _ = await asyncio.wait(pending | {cancel_wait}, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not cancel_wait:
+                    pending.discard(task)
+                    yield task
+        if pending:
+            await cancel_tasks(pending)
+    finally:
+        cancel_wait.cancel()
+
+
+async def cancel_tasks(tasks: Iterable[asyncio.Task], timeout: float = CLOSE_TIMEOUT_SECONDS) -> None:
+    """Cancels every unfinished task and waits up to `timeout` seconds for them to unwind."""
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        _, stuck = await asyncio.wait(pending, timeout=timeout)
+        if stuck:
+            sys.stderr.write(f"WARN: {len(stuck)} task(s) did not stop within {timeout:.1f}s of cancellation.\n")
+
+
+async def close_within(label: str, closing: Awaitable, timeout: float = CLOSE_TIMEOUT_SECONDS) -> None:
+    """Awaits a teardown step, giving up (and logging) after `timeout` seconds or on error."""
+    try:
+        await asyncio.wait_for(closing, timeout)
+    except asyncio.TimeoutError:
+        sys.stderr.write(f"WARN: {label} did not close within {timeout:.1f}s.\n")
+    except Exception as e:
+        sys.stderr.write(f"WARN: {label} failed to close: {e}\n")
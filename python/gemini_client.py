@@ -0,0 +1,123 @@
+# python/gemini_client.py
+import os
+import sys
+import time
+import asyncio
+from typing import Dict, List, Optional
+
+from adaptive_limit import AdaptiveLimiter
+from resilience import jittered_backoff
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+# google.api_core exception names for 429/5xx responses, for errors that carry no numeric code
+RETRYABLE_ERROR_NAMES = ("ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "InternalServerError",
+                         "DeadlineExceeded", "BadGateway", "GatewayTimeout")
+
+
+class GeminiUnavailableError(Exception):
+    """Raised when Gemini is needed but not configured (e.g. GEMINI_API_KEY is missing)."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True for rate limiting (429), server-side (5xx) failures and timeouts."""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code == 429 or 500 <= code < 600
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class GeminiClient:
+    """Async calls to a Gemini model that never block the event loop.
+
+    Calls get their own adaptive concurrency limit (separate from the browser sources', starting
+    at max_concurrency and backing off on 429/5xx and timeouts only; a bad request or key is not
+    congestion), a requests-per-minute token bucket, waited on before taking a concurrency slot,
+    and exponential backoff on the same errors. Per-call latency is recorded for stats().
+    """
+
+    def __init__(self, model, max_concurrency: Optional[int] = None, requests_per_minute: Optional[float] = None,
+                 max_retries: Optional[int] = None):
+        self.model = model
+        self.max_concurrency = max_concurrency or int(os.environ.get("GEMINI_CONCURRENCY", DEFAULT_CONCURRENCY))
+        rpm = requests_per_minute or float(os.environ.get("GEMINI_RPM", DEFAULT_REQUESTS_PER_MINUTE))
+        self.max_retries = max_retries if max_retries is not None else int(os.environ.get("GEMINI_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        self._bucket = TokenBucket(rpm / 60.0, capacity=max(1.0, min(rpm / 60.0 * 5, self.max_concurrency)))
+        self._limiter = AdaptiveLimiter("Gemini", self.max_concurrency, initial=self.max_concurrency, is_congestion=is_retryable)
+        self.latencies: List[float] = []
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+
+    async def _call(self, prompt, **kwargs):
+        if hasattr(self.model, "generate_content_async"):
+            return await self.model.generate_content_async(prompt, **kwargs)
+        # Older SDKs only have the blocking call; keep it on a worker thread
+        return await asyncio.to_thread(self.model.generate_content, prompt, **kwargs)
+
+    async def generate(self, prompt, label: str = "gemini", **kwargs) -> str:
+        """Returns the response text, retrying rate-limit and server errors with backoff."""
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire() # Rate-limited waits must not hold a concurrency slot
+            async with self._limiter:
+                self.calls += 1
+                started = time.monotonic()
+                try:
+                    response = await self._call(prompt, **kwargs)
+                    text = response.text
+                except Exception as e:
+                    elapsed = time.monotonic() - started
+                    if not is_retryable(e) or attempt == self.max_retries:
+                        self.failures += 1
+                        sys.stderr.write(f"DEBUG: {label} failed after {elapsed:.2f}s (attempt {attempt + 1}): {e}\n")
+                        raise
+                    delay = jittered_backoff(attempt, BACKOFF_BASE_SECONDS, BACKOFF_MAX_SECONDS)
+                    sys.stderr.write(f"DEBUG: {label} got a retryable error ({e}); retrying in {delay:.1f}s.\n")
+                    self.retries += 1
+                    self._limiter.record_failure() # 429s and 5xx mean we are pushing too hard
+                else:
+                    elapsed = time.monotonic() - started
+                    self.latencies.append(elapsed)
+                    sys.stderr.write(f"DEBUG: {label} completed in {elapsed:.2f}s.\n")
+                    return text
+            await asyncio.sleep(delay) # Back off without holding a concurrency slot
+
+    def stats(self) -> Dict:
+        latencies = sorted(self.latencies)
+        def percentile(p: float) -> Optional[float]:
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3) if latencies else None
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "latencyMean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "latencyP50": percentile(0.5),
+            "latencyP95": percentile(0.95),
+            "latencyMax": round(latencies[-1], 3) if latencies else None,
+            "concurrency": self._limiter.stats(),
+        }
@@ -0,0 +1,261 @@
+# python/id_manual_index.py
+import os
+import re
+import sys
+import csv
+import json
+import time
+import bisect
+import sqlite3
+from typing import Dict, List, Optional, Set
+
+from term_matching import FULL, TermMatcher, normalize_text # The live search's comparison form, so lookups agree with it
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX_PATH = os.path.join(SCRIPT_DIR, "id_manual_index.sqlite3")
+# Written by scripts/convert-excel-to-json.cjs when the updater refreshes the ID Manual
+DEFAULT_EXPORT_PATH = os.path.join(SCRIPT_DIR, "..", "electron", "src", "assets", "id_manual_data.json")
+DEFAULT_MAX_AGE_DAYS = 14 # The updater refreshes the export weekly; ID_MANUAL_MAX_AGE_DAYS overrides, 0 accepts any age
+GRAM_LENGTH = 3 # Longest token substrings indexed for single-word lookups
+
+# Header names accepted when importing a CSV export (compared case-insensitively)
+DESCRIPTION_COLUMNS = ("description", "term description", "goods and services")
+STATUS_COLUMNS = ("status",)
+TERM_ID_COLUMNS = ("termid", "term id", "term-id", "term_id")
+
+
+def _pick(record: Dict, names) -> str:
+    lowered = {str(k).strip().lower(): v for k, v in record.items()}
+    for name in names:
+        value = lowered.get(name)
+        if value not in (None, ""):
+            return str(value).strip()
+    return ""
+
+
+def read_export(path: str) -> List[Dict]:
+    """Reads an ID Manual export (the updater's JSON list, or a CSV with a header row)."""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            records = list(csv.DictReader(f))
+    else:
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+        if not isinstance(records, list):
+            raise ValueError("ID Manual export must be a JSON list of entries.")
+    entries = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        description = _pick(record, DESCRIPTION_COLUMNS)
+        if not description:
+            continue
+        entries.append({
+            "description": description,
+            "status": _pick(record, STATUS_COLUMNS),
+            "termId": _pick(record, TERM_ID_COLUMNS),
+        })
+    return entries
+
+
+def import_export(export_path: str, index_path: Optional[str] = None) -> int:
+    """Rebuilds the SQLite index from an export file; returns the number of entries imported."""
+    index_path = index_path or os.environ.get("ID_MANUAL_INDEX_PATH") or DEFAULT_INDEX_PATH
+    entries = read_export(export_path)
+    conn = sqlite3.connect(index_path)
+    try:
+        with conn:
+            conn.executescript(
+                "DROP TABLE IF EXISTS entries;"
+                "CREATE TABLE entries (id INTEGER PRIMARY KEY, normalized TEXT NOT NULL, description TEXT NOT NULL,"
+                " status TEXT, term_id TEXT);"
+                "CREATE INDEX idx_entries_normalized ON entries(normalized);"
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+            )
+            for entry_id, entry in enumerate(entries):
+                normalized = normalize_text(entry["description"])
+                conn.execute(
+                    "INSERT INTO entries (id, normalized, description, status, term_id) VALUES (?, ?, ?, ?, ?)",
+                    (entry_id, normalized, entry["description"], entry["status"], entry["termId"])
+                )
+            conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [
+                ("imported_at", str(time.time())),
+                ("source", os.path.abspath(export_path)),
+                ("entry_count", str(len(entries))),
+            ])
+    finally:
+        conn.close()
+    return len(entries)
+
+
+class LocalIdIndex:
+    """In-memory view of the imported ID Manual with a token inverted index over normalized descriptions."""
+
+    def __init__(self, index_path: Optional[str] = None, max_age_days: Optional[float] = None):
+        self.index_path = index_path or os.environ.get("ID_MANUAL_INDEX_PATH") or DEFAULT_INDEX_PATH
+        self.max_age_days = max_age_days if max_age_days is not None else float(os.environ.get("ID_MANUAL_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+        self.entries: List[Dict] = []
+        self.postings: Dict[str, Set[int]] = {}
+        self.imported_at = 0.0
+        self._vocabulary: List[str] = []
+        self._reversed_vocabulary: List[str] = []
+        self._grams: Optional[Dict[str, Set[int]]] = None # Every token substring up to GRAM_LENGTH -> vocabulary positions
+        self._by_length: Optional[List[int]] = None # Entry ids, shortest description first (for match_terms)
+        self.lookups = 0
+        self.local_answers = 0
+
+    @classmethod
+    def load(cls, index_path: Optional[str] = None, max_age_days: Optional[float] = None) -> Optional["LocalIdIndex"]:
+        """Loads the index, or returns None if it is missing or older than max_age_days."""
+        index = cls(index_path, max_age_days)
+        if not os.path.exists(index.index_path):
+            return None
+        try:
+            conn = sqlite3.connect(index.index_path)
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+                index.imported_at = float(meta.get("imported_at", 0))
+                if index.max_age_days > 0 and time.time() - index.imported_at > index.max_age_days * 86400:
+                    age_days = (time.time() - index.imported_at) / 86400
+                    sys.stderr.write(f"WARN: Local ID Manual index is {age_days:.0f} days old (limit {index.max_age_days:g}, "
+                                     f"ID_MANUAL_MAX_AGE_DAYS); ignoring it. Re-import the export to use it again.\n")
+                    return None
+                for entry_id, normalized, description, status, term_id in conn.execute(
+                        "SELECT id, normalized, description, status, term_id FROM entries ORDER BY id"):
+                    index._add(entry_id, normalized, description, status, term_id)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            sys.stderr.write(f"DEBUG: Local ID Manual index unavailable ({index.index_path}): {e}\n")
+            return None
+        index._vocabulary = sorted(index.postings)
+        index._reversed_vocabulary = sorted(token[::-1] for token in index.postings)
+        sys.stderr.write(f"DEBUG: Local ID Manual index loaded: {len(index.entries)} entries.\n")
+        return index
+
+    def _add(self, entry_id: int, normalized: str, description: str, status: Optional[str], term_id: Optional[str]) -> None:
+        # Entry ids are dense, so list position == id
+        self.entries.append({"normalized": normalized, "description": description, "status": status or "", "termId": term_id or None})
+        for token in set(normalized.split()):
+            self.postings.setdefault(token, set()).add(entry_id)
+
+    def _build_grams(self) -> None:
+        self._grams = {}
+        for position, token in enumerate(self._vocabulary):
+            for length in range(1, GRAM_LENGTH + 1):
+                for start in range(len(token) - length + 1):
+                    self._grams.setdefault(token[start:start + length], set()).add(position)
+
+    def _tokens_containing(self, word: str) -> List[str]:
+        if self._grams is None:
+            self._build_grams() # On first use: runs that never look up a single word skip it
+        if len(word) <= GRAM_LENGTH:
+            positions = self._grams.get(word, set()) # Exact: every substring this short is indexed
+        else:
+            grams = sorted((self._grams.get(word[start:start + GRAM_LENGTH], set()) for start in range(len(word) - GRAM_LENGTH + 1)), key=len)
+            positions = set(grams[0]).intersection(*grams[1:])
+        return [token for token in (self._vocabulary[position] for position in positions) if word in token]
+
+    def _tokens_with_prefix(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\uffff")
+        return self._vocabulary[start:end]
+
+    def _tokens_with_suffix(self, suffix: str) -> List[str]:
+        reversed_suffix = suffix[::-1]
+        start = bisect.bisect_left(self._reversed_vocabulary, reversed_suffix)
+        end = bisect.bisect_left(self._reversed_vocabulary, reversed_suffix + "\uffff")
+        return [token[::-1] for token in self._reversed_vocabulary[start:end]]
+
+    def _union(self, tokens: List[str]) -> Set[int]:
+        ids: Set[int] = set()
+        for token in tokens:
+            ids |= self.postings[token]
+        return ids
+
+    def containing(self, text: str) -> List[int]:
+        """Ids of entries whose normalized description contains normalized text as a substring."""
+        normalized = normalize_text(text)
+        words = normalized.split()
+        if not words:
+            return []
+        # Inner words must be whole tokens; the first word may be the tail of a token and
+        # the last word the head of one (substring semantics, as the live search uses).
+        if len(words) == 1:
+            # A single word can sit anywhere inside a token; its trigrams narrow down which tokens
+            candidates = self._union(self._tokens_containing(words[0]))
+        else:
+            candidates = self._union(self._tokens_with_suffix(words[0])) & self._union(self._tokens_with_prefix(words[-1]))
+            for word in words[1:-1]:
+                candidates &= self.postings.get(word, set())
+                if not candidates:
+                    break
+        matches = [entry_id for entry_id in candidates if normalized in self.entries[entry_id]["normalized"]]
+        # Shortest descriptions first: exact matches and the closest examples lead the listing
+        matches.sort(key=lambda entry_id: (len(self.entries[entry_id]["normalized"]), entry_id))
+        return matches
+
+    def listing(self, text: str) -> Dict:
+        """Rows for entries containing text, in the shape read from the ID Manual results table."""
+        rows = [
+            {"description": self.entries[i]["description"], "status": self.entries[i]["status"], "termId": self.entries[i]["termId"]}
+            for i in self.containing(text)
+        ]
+        return {"rows": rows, "firstTermId": rows[0]["termId"] if rows else None}
+
+    def has_listing(self, text: str) -> bool:
+        return bool(self.containing(text))
+
+    def match_terms(self, terms: List[str]) -> Dict[str, Dict]:
+        """Classifies many terms in one pass over every entry, e.g. to re-check a whole docket.
+
+        Each term gets {"matchType": "full" | "deleted" | "partial" | "none", "description", "termId"}.
+        The entry is its exact description if there is one, otherwise the shortest entry containing
+        it, i.e. the first row listing() would show.
+        """
+        results = {term: {"matchType": "none", "description": None, "termId": None} for term in terms}
+        if self._by_length is None:
+            self._by_length = sorted(range(len(self.entries)), key=lambda entry_id: (len(self.entries[entry_id]["normalized"]), entry_id))
+        order = self._by_length
+        answered: Set[str] = set()
+        # Shortest first, so a term's first hit is its exact entry whenever there is one
+        for found in TermMatcher(terms).scan((self.entries[entry_id]["normalized"] for entry_id in order), normalized=True):
+            if found.term in answered:
+                continue
+            answered.add(found.term)
+            entry = self.entries[order[found.index]]
+            match_type = "deleted" if found.kind == FULL and entry["status"] == "D" else found.kind
+            results[found.term] = {"matchType": match_type, "description": entry["description"], "termId": entry["termId"]}
+            if len(answered) == len(results):
+                break
+        return results
+
+    def stats(self) -> Dict:
+        return {"entries": len(self.entries), "lookups": self.lookups, "localAnswers": self.local_answers}
+
+
+if __name__ == "__main__":
+    # Usage: python id_manual_index.py [EXPORT_PATH]
+    #        python id_manual_index.py --match [TERMS_FILE]   (newline/semicolon separated; stdin without a file)
+    if len(sys.argv) > 1 and sys.argv[1] == "--match":
+        index = LocalIdIndex.load(max_age_days=0) # Re-checking a docket against an old import is still useful
+        if index is None:
+            print(json.dumps({"type": "error", "message": "No local ID Manual index; import an export first."}))
+            sys.exit(1)
+        if len(sys.argv) > 2:
+            with open(sys.argv[2], encoding="utf-8") as f:
+                terms_text = f.read()
+        else:
+            terms_text = sys.stdin.read()
+        terms = [term.strip() for term in re.split(r'[\n;]+', terms_text) if term.strip()]
+        for term, match in index.match_terms(terms).items():
+            print(json.dumps({"type": "match", "term": term, **match}))
+        sys.exit(0)
+
+    export_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_EXPORT_PATH
+    try:
+        count = import_export(export_path)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(json.dumps({"type": "error", "message": f"Failed to import ID Manual export: {e}"}))
+        sys.exit(1)
+    print(json.dumps({"type": "index_import", "entries": count, "source": os.path.abspath(export_path)}))
@@ -0,0 +1,187 @@
+# python/job_stream.py
+import sys
+import json
+import time
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from stream_output import emit
+from cancellation import cancel_tasks
+from adaptive_limit import AdaptiveLimiter
+
+DEFAULT_MAX_IN_FLIGHT = 200 # Records being worked on at once (all sources)
+DEFAULT_LINE_BUFFER = 1000 # Lines read but not yet scheduled before the stdin reader pauses
+
+
+def is_cancel_control(line: str) -> bool:
+    if '"cancel"' not in line: # Cheap pre-check; nearly every line is a job record
+        return False
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(record, dict) and record.get("type") == "cancel"
+
+
+def read_lines_into(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, cancel_event: Optional[asyncio.Event] = None) -> None:
+    """Thread target: feeds stdin lines to `queue`, then None at EOF.
+
+    Blocking reads happen on a thread because asyncio pipe readers are not available for stdin on
+    Windows. Each put waits for room, so a full queue stops the reads and the writer is held back
+    by the pipe buffer instead of by our memory. With `cancel_event`, a {"type": "cancel"} line
+    sets it straight away instead of queueing behind the job records.
+    """
+    for line in sys.stdin:
+        if cancel_event is not None and is_cancel_control(line):
+            loop.call_soon_threadsafe(cancel_event.set)
+            continue
+        asyncio.run_coroutine_threadsafe(queue.put(line), loop).result()
+    asyncio.run_coroutine_threadsafe(queue.put(None), loop).result() # EOF
+
+
+async def unless_cancelled(awaitable, cancel_wait: asyncio.Future):
+    """The awaitable's result, or None if `cancel_wait` finished first (the awaitable is then cancelled).
+
+    Once cancelled it returns None straight away: an item already waiting in a queue would
+    otherwise win the race, and a cancelled job would go on consuming its input.
+    """
+    if cancel_wait.done():
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close() # Never started
+        return None
+    task = asyncio.ensure_future(awaitable)
+    await asyncio.wait({task, cancel_wait}, return_when=asyncio.FIRST_COMPLETED)
+    if task.done():
+        return task.result()
+    task.cancel()
+    return None
+
+
+def parse_job_record(line: str, sources) -> Dict:
+    """Validates one NDJSON job line: {"source": "uspto"|"mgs", "term": ..., ...} or {"type": "end"}."""
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("Job record must be a JSON object.")
+    if record.get("type") == "end":
+        return record
+    if record.get("source") not in sources:
+        raise ValueError(f"Unknown source {record.get('source')!r}; expected one of {sorted(sources)}.")
+    term = record.get("term")
+    if not isinstance(term, str) or not term.strip():
+        raise ValueError("Job record needs a non-empty 'term'.")
+    return {**record, "term": term.strip()}
+
+
+class JobStream:
+    """Schedules NDJSON job records as they arrive instead of waiting for the whole job.
+
+    `handlers[source]` runs one record and emits its own results. At most `max_in_flight` records
+    run at once; while every slot is taken, lines pile up in the bounded queue and then the stdin
+    reader pauses. Progress is reported per source against the records received so far, with the
+    source's current concurrency limit when `limits` has a limiter for it. On
+    cancellation, running records are cancelled and they and any queued records are passed to
+    `on_cancelled(source, record)`.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[Dict], Awaitable[None]]], max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 on_cancelled: Optional[Callable[[str, Dict], None]] = None, limits: Optional[Dict[str, AdaptiveLimiter]] = None):
+        self.handlers = handlers
+        self.on_cancelled = on_cancelled
+        self.limits = limits or {}
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._tasks: Set[asyncio.Task] = set()
+        self.received: Counter = Counter()
+        self.completed: Counter = Counter()
+        self.rejected = 0
+        self.finished_at: Dict[str, float] = {}
+        self.cancelled: Counter = Counter()
+
+    async def run(self, lines: asyncio.Queue, cancel_event: asyncio.Event) -> None:
+        """Consumes `lines` until EOF (None), an {"type": "end"} record or cancellation, then waits for in-flight work."""
+        cancel_wait = asyncio.ensure_future(cancel_event.wait())
+        unscheduled = []
+        try:
+            while True:
+                line = await unless_cancelled(lines.get(), cancel_wait)
+                if line is None:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    record = parse_job_record(line, self.handlers)
+                except (json.JSONDecodeError, ValueError) as e:
+                    self.rejected += 1
+                    emit({"type": "error", "message": f"Invalid job record: {e}"})
+                    continue
+                if record.get("type") == "end":
+                    break
+                if not await unless_cancelled(self._slots.acquire(), cancel_wait):
+                    unscheduled.append(record) # Read just as the job was cancelled
+                    break
+                source = record["source"]
+                self.received[source] += 1
+                task = asyncio.create_task(self._run_record(source, record))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            if cancel_event.is_set():
+                await self._cancel(lines, unscheduled)
+            elif self._tasks:
+                # Input is complete; cancellation can still cut the remaining work short
+                await unless_cancelled(asyncio.wait(list(self._tasks)), cancel_wait)
+                if cancel_event.is_set():
+                    await self._cancel(lines, unscheduled)
+        finally:
+            cancel_wait.cancel()
+
+    async def _cancel(self, lines: asyncio.Queue, unscheduled) -> None:
+        await cancel_tasks(self._tasks) # Each cancelled record reports itself in _run_record
+        while not lines.empty(): # Records already read from stdin but never scheduled
+            line = lines.get_nowait()
+            try:
+                record = parse_job_record(line, self.handlers) if line and line.strip() else None
+            except (json.JSONDecodeError, ValueError):
+                record = None
+            if record is not None and record.get("type") != "end":
+                unscheduled.append(record)
+        for record in unscheduled:
+            self._report_cancelled(record["source"], record)
+
+    def _report_cancelled(self, source: str, record: Dict) -> None:
+        self.cancelled[source] += 1
+        if self.on_cancelled is not None:
+            self.on_cancelled(source, record)
+
+    async def _run_record(self, source: str, record: Dict) -> None:
+        try:
+            await self.handlers[source](record)
+        except asyncio.CancelledError:
+            self._report_cancelled(source, record)
+            raise
+        except Exception as e:
+            sys.stderr.write(f"ERROR: Uncaught exception for {source} record '{record.get('term')}': {e}\n")
+            emit({"type": "error", "term": record.get("term"), "source": source, "message": f"Unhandled error: {e}"})
+        finally:
+            self._slots.release()
+            self.completed[source] += 1
+            self.finished_at[source] = time.time()
+            progress = {
+                "type": "progress",
+                "source": source,
+                "value": int(self.completed[source] / self.received[source] * 100),
+                "completed": self.completed[source],
+                "received": self.received[source],
+            }
+            if source in self.limits:
+                progress["limit"] = self.limits[source].limit
+            emit(progress)
+
+    def report_times(self, started: float) -> None:
+        """Emits a search_time record (start of the stream to the source's last completion) per source that received work."""
+        for source in self.received:
+            elapsed = self.finished_at.get(source, time.time()) - started
+            emit({"type": "search_time", "source": source, "value": f"{elapsed:.2f} seconds"})
+
+    def stats(self) -> Dict:
+        return {"received": dict(self.received), "completed": dict(self.completed), "cancelled": dict(self.cancelled),
+                "rejected": self.rejected}
@@ -2,56 +2,76 @@
 import sys
 import asyncio
 import time
-import re
 import json
 import os
 # import argparse # No longer using argparse for this script
 from typing import List, Tuple, Optional, Dict
 
-from playwright.async_api import async_playwright
+from result_cache import ResultCache
+from page_pool import PagePool, LazyBrowserContext, arm_change_watch, wait_for_change
+from resource_policy import ResourcePolicy
+from stream_output import emit
+from adaptive_limit import AdaptiveLimiter
+from singleflight import SingleFlight
+from resilience import TermFailure, NAVIGATION_TIMEOUT_MS, breaker_for, breaker_stats, run_term
+from spans import bind_term, span
+from term_matching import FULL, TermMatcher, normalize_mgs_text
+from cancellation import (cancellation_requested, clear_cancellation_file, watch_cancellation, as_completed_until_cancelled,
+                          cancelled_result)
 
 # Global configuration
-CONCURRENT_LIMIT = 20
-search_cache: Dict[str, str] = {}
-CANCELLATION_FILE = "cancel_search.tmp" # File to signal cancellation
-MGS_BASE_URL = "https://webaccess.wipo.int/mgs/"
+CONCURRENT_LIMIT = int(os.environ.get("MGS_CONCURRENCY", 20)) # Most MGS pages/searches in flight; the adaptive limit stays at or below it
+_search_cache: Optional[ResultCache] = None # Same file as search_script.py's; keyed by term + NICE filter
+MGS_BASE_URL = os.environ.get("MGS_BASE_URL", "https://webaccess.wipo.int/mgs/") # Overridable for the bench stand-in
 DEBUG_LOG_FILE = "mgs_search_debug.log" # Path to debug log file
-
-def normalize_text(text: str) -> str:
-    """Normalize text for comparison by removing special characters and extra spaces."""
-    # Convert to lowercase
-    text = text.lower()
-    # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special characters but keep spaces
-    text = re.sub(r'[^\w\s]', '', text)
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    return text
+MGS_SEARCH_INPUT = "input#searchInputBox.dummyClass"
+# Reads the whole hit list (class attribute, item text, badge text) in one round trip
+READ_HIT_LIST_JS = """
+() => {
+    const banner = document.querySelector("div#divHitList > div#hitListBanner");
+    const items = Array.from(document.querySelectorAll("div#divHitList > ul li")).map(item => {
+        const badge = item.querySelector("span.classBadge");
+        return {
+            cls: item.getAttribute("cls"),
+            text: item.textContent || "",
+            badge: badge ? badge.textContent || "" : null
+        };
+    });
+    return { noResults: !!banner && (banner.textContent || "").includes("No results"), items: items };
+}
+"""
+
+def get_search_cache() -> ResultCache:
+    """The MGS result cache, opened on first use so importing this module opens no database."""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = ResultCache()
+    return _search_cache
 
 async def wait_for_results_update(page) -> None:
     await page.wait_for_function(
         "document.querySelector('span.page-results') && document.querySelector('span.page-results').textContent.trim() !== ''",
-        timeout=0
+        timeout=30000
     )
 
-async def search_mgs_term(term: str, context, cancel_event: asyncio.Event, semaphore: asyncio.Semaphore, nice_filter: bool) -> Tuple[str, str]:
-    """Searches for a term in the Madrid Goods & Services Manager (MGS) with debugging."""
-    if cancel_event.is_set() or os.path.exists(CANCELLATION_FILE):
-        return term, "Cancelled"
-
-    async with semaphore:
-        page = await context.new_page()
-        try:
-            # sys.stderr.write(f"DEBUG: Searching MGS for term: '{term}' with NICE filter: {nice_filter}\n") # Removed debug message
-            
-            await page.goto(MGS_BASE_URL, wait_until="networkidle", timeout=0)
-            await page.click('xpath=//input[@id="btnSearch"]')
-            await page.wait_for_selector("input#searchInputBox.dummyClass", timeout=30000)
-            
+async def open_mgs_search(page) -> None:
+    """Loads MGS and switches to the search tab; used by the page pool for fresh and stale pages."""
+    with span("goto"):
+        await page.goto(MGS_BASE_URL, wait_until="networkidle", timeout=NAVIGATION_TIMEOUT_MS)
+        await page.click('xpath=//input[@id="btnSearch"]')
+        await page.wait_for_selector(MGS_SEARCH_INPUT, timeout=30000)
+
+def create_mgs_pool(context) -> PagePool:
+    return PagePool(context, open_mgs_search, MGS_SEARCH_INPUT, size=CONCURRENT_LIMIT)
+
+async def submit_mgs_search(page, term: str, nice_filter: bool) -> None:
+    """Runs a search on a page already showing the MGS search tab and waits for the hit list to update."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError # Already loaded by the browser context
+    for attempt in range(2):
+        with span("submit"):
             # Enter search term
-            await page.fill("input#searchInputBox.dummyClass", term)
-            
+            await page.fill(MGS_SEARCH_INPUT, term)
+
             # Wait for search term to be set - Fixed function call syntax
             js_code = """
             (term) => {
@@ -60,181 +80,212 @@ async def search_mgs_term(term: str, context, cancel_event: asyncio.Event, semap
             }
             """
             await page.wait_for_function(js_code, arg=term)
-            
+
             # Handle NICE filter
             if nice_filter:
                 await page.check('input#checkNiceFilterSearch')
             else:
                 await page.uncheck('input#checkNiceFilterSearch')
-            
-            # Click search and wait for results
+
+            # Click search
+            await arm_change_watch(page, ['div#divHitList'])
             await page.click('span#searchButton')
+
+        with span("wait_for_results"):
             await page.wait_for_selector('div#divHitList', timeout=30000)
-            
-            # Additional wait for results to load - Fixed function call syntax
-            try:
-                js_code = """
-                () => {
-                    const hitList = document.querySelector('div#divHitList');
-                    return hitList && hitList.children.length > 0;
-                }
-                """
-                await page.wait_for_function(js_code)
-            except Exception as e:
-                # sys.stderr.write(f"DEBUG: Timeout waiting for results: {str(e)}\n") # Removed debug message
-                pass # Allow to proceed and check for no results banner
-
-            # --- Construct Structured Result ---
-            source_name = f"mgs-nice-{'on' if nice_filter else 'off'}"
-            result_data = {
-                "type": "result",
-                "term": term,
-                "source": source_name,
-                "matchType": "none", # Default to none
-                "classNumber": None,
-                "statusText": f"No match found (NICE {'On' if nice_filter else 'Off'})" # Default status
-            }
 
-            # Check for no results banner first
-            no_results = await page.query_selector('div#divHitList > div#hitListBanner:has-text("No results")')
-            if no_results:
-                # Keep default result_data (matchType: none)
+            # Additional wait for results to load
+            try:
+                await wait_for_change(
+                    page,
+                    "document.querySelector('div#divHitList') && document.querySelector('div#divHitList').children.length > 0",
+                    timeout=30000
+                )
+                return
+            except PlaywrightTimeoutError:
                 pass
-            else:
-                # Look for matches in results list
-                results_list = await page.query_selector('div#divHitList > ul')
-                if results_list:
-                    list_items = await results_list.query_selector_all('li')
-                    normalized_search_term = normalize_text(term)
-                    found_match = False # Flag to stop after first match
-
-                    for item in list_items:
-                        if found_match: break # Process only the first relevant match
-
-                        cls_attr = await item.get_attribute('cls')  # Get the class number
-                        class_badge = await item.query_selector('span.classBadge')
-                        full_text = await item.text_content()
-
-                        if class_badge:
-                            badge_text = await class_badge.text_content()
-                            description_text = full_text.replace(badge_text, '').strip()
-                        else:
-                            description_text = full_text.strip()
-
-                        normalized_description = normalize_text(description_text)
-
-                        # Check for exact match
-                        if normalized_search_term == normalized_description:
-                            result_data["matchType"] = "full"
-                            result_data["classNumber"] = cls_attr
-                            result_data["statusText"] = f"Full match found (Class {cls_attr}) (NICE {'On' if nice_filter else 'Off'})"
-                            found_match = True
-                        # Check if search term is contained within description (Treat as partial)
-                        elif normalized_search_term in normalized_description:
-                            result_data["matchType"] = "partial"
-                            result_data["classNumber"] = cls_attr
-                            result_data["statusText"] = f"Partial match found (Class {cls_attr}) (NICE {'On' if nice_filter else 'Off'})"
-                            found_match = True
-                    # If loop finishes without finding any match, result_data remains 'none'
-
-            # Return the structured data object
-            return result_data
+        if attempt == 0:
+            # The hit list may still show the previous term; retry on a fresh load
+            sys.stderr.write(f"DEBUG: No hit list update for '{term}' on pooled page, reloading.\n")
+            await open_mgs_search(page)
+            continue
+        return # Allow to proceed and check for no results banner
+
+def nice_label(nice_filter: bool) -> str:
+    return "on" if nice_filter else "off"
+
+def mgs_nice_filters(task_info: Dict) -> List[bool]:
+    """The NICE filter settings an MGS task asks for, NICE off first."""
+    return [nice_filter for nice_filter, key in ((False, "needsNiceOff"), (True, "needsNiceOn")) if task_info.get(key, False)]
+
+async def read_hit_list(page) -> Dict:
+    """Returns {"noResults", "items": [{"cls", "text", "badge"}]} for the hit list currently shown."""
+    with span("extraction"):
+        return await page.evaluate(READ_HIT_LIST_JS)
+
+def match_hit_list(term: str, hit_list: Dict, nice_filter: bool) -> Dict:
+    """Builds the structured result from an extracted hit list: the first full or partial match wins."""
+    state = "On" if nice_filter else "Off"
+    result_data = {
+        "type": "result",
+        "term": term,
+        "source": f"mgs-nice-{nice_label(nice_filter)}",
+        "matchType": "none", # Default to none
+        "classNumber": None,
+        "statusText": f"No match found (NICE {state})" # Default status
+    }
+    if hit_list.get("noResults"):
+        return result_data # Keep default result_data (matchType: none)
+
+    items = hit_list.get("items", [])
+    descriptions = []
+    for item in items:
+        full_text = item.get("text") or ""
+        badge_text = item.get("badge")
+        descriptions.append((full_text.replace(badge_text, '') if badge_text else full_text).strip())
+
+    # Only the first relevant item counts: an exact description is full, one containing the term partial
+    found = TermMatcher([term], normalize_mgs_text).first(descriptions)
+    if found is not None:
+        cls_attr = items[found.index].get("cls") # The class number
+        result_data["classNumber"] = cls_attr
+        if found.kind == FULL:
+            result_data["matchType"] = "full"
+            result_data["statusText"] = f"Full match found (Class {cls_attr}) (NICE {state})"
+        else:
+            result_data["matchType"] = "partial"
+            result_data["statusText"] = f"Partial match found (Class {cls_attr}) (NICE {state})"
+    # Without a match, result_data remains 'none'
+    return result_data
+
+async def search_mgs_term(term: str, pool: PagePool, cancel_event: asyncio.Event, semaphore: AdaptiveLimiter, nice_filters: List[bool],
+                          inflight: Optional[SingleFlight] = None) -> List[Dict]:
+    """Searches MGS for a term once per requested NICE filter setting and returns one result (or error) per setting.
+
+    All settings share one pooled page and one semaphore slot: after the first search the
+    checkNiceFilterSearch box is toggled in place and the search re-run, so a term needing
+    both NICE on and off costs one page checkout instead of two. The checkout runs under a
+    per-term deadline with retries (see resilience.run_term); settings it could not answer come
+    back as error records naming the stage that stalled. With `inflight`, normalization-equivalent
+    spellings needing the same settings share one lookup and each gets the results under its own spelling.
+    """
+    if cancel_event.is_set() or cancellation_requested():
+        return [cancelled_result(term, f"mgs-nice-{nice_label(nice_filter)}") for nice_filter in nice_filters]
+    if inflight is None:
+        return await lookup_mgs_term(term, pool, semaphore, nice_filters)
+    key = f"mgs:nice-{'-'.join(nice_label(nice_filter) for nice_filter in nice_filters)}:{normalize_mgs_text(term)}"
+    shared = await inflight.run(key, lambda: lookup_mgs_term(term, pool, semaphore, nice_filters))
+    return [{**result, "term": term} for result in shared]
+
+async def lookup_mgs_term(term: str, pool: PagePool, semaphore: AdaptiveLimiter, nice_filters: List[bool]) -> List[Dict]:
+    bind_term(term, "mgs")
+    results: Dict[bool, Dict] = {}
+    with span("cache_lookup"):
+        for nice_filter in nice_filters:
+            cached_data = get_search_cache().get(f"mgs:nice-{nice_label(nice_filter)}:{normalize_mgs_text(term)}")
+            if cached_data is not None:
+                cached_data["term"] = term
+                results[nice_filter] = cached_data
+    missing = [nice_filter for nice_filter in nice_filters if nice_filter not in results]
+    if not missing:
+        return [results[nice_filter] for nice_filter in nice_filters]
+
+    async def search_missing() -> None:
+        async with pool.page() as page:
+            for nice_filter in missing:
+                if nice_filter in results:
+                    continue # Answered by an earlier attempt
+                await submit_mgs_search(page, term, nice_filter)
+                result_data = match_hit_list(term, await read_hit_list(page), nice_filter)
+                get_search_cache().set(f"mgs:nice-{nice_label(nice_filter)}:{normalize_mgs_text(term)}", result_data)
+                results[nice_filter] = result_data
 
+    try:
+        await run_term(f"MGS search for '{term}'", search_missing, breaker_for(MGS_BASE_URL), semaphore)
+    except TermFailure as e:
+        failed = [nice_filter for nice_filter in missing if nice_filter not in results]
+        sys.stderr.write(f"ERROR: Error in search_mgs_term for '{term}' (NICE {', '.join(nice_label(f) for f in failed)}): {e}\n")
+        # Settings already answered on this page keep their results; the rest get structured errors
+        for nice_filter in failed:
+            results[nice_filter] = e.error_record(term, f"mgs-nice-{nice_label(nice_filter)}", "Error searching MGS")
+    return [results[nice_filter] for nice_filter in nice_filters]
+
+async def process_mgs_tasks(mgs_tasks: List[Dict], pool: PagePool, cancel_event: asyncio.Event, semaphore: AdaptiveLimiter) -> None:
+    """Runs the MGS searches requested by mgs_tasks on a pool of loaded pages, emitting results and progress."""
+    tasks: Dict[asyncio.Task, Tuple[str, List[bool]]] = {}
+    inflight = SingleFlight() # Duplicate spellings in the task list share one lookup
+    total_tasks = 0 # Total number of results (term x NICE setting) to report
+    # One lookup per term covers every NICE setting it needs
+    for task_info in mgs_tasks:
+        term = task_info.get("term")
+        nice_filters = mgs_nice_filters(task_info)
+        if term and nice_filters:
+            tasks[asyncio.create_task(search_mgs_term(term, pool, cancel_event, semaphore, nice_filters, inflight))] = (term, nice_filters)
+            total_tasks += len(nice_filters)
+
+    completed_count = 0
+
+    async for task in as_completed_until_cancelled(tasks, cancel_event):
+        try:
+            # The task returns one structured result (or error) object per NICE setting
+            for result_obj in await task:
+                # Print the structured result/error object directly
+                emit(result_obj)
+
+                # Update progress (only count non-error results for progress?)
+                if result_obj.get("type") != "error":
+                     completed_count += 1
+                     progress_percent = int((completed_count / total_tasks) * 100) if total_tasks > 0 else 100
+                     emit({"type": "progress", "source": "mgs", "value": progress_percent, "limit": semaphore.limit})
+
+        except asyncio.CancelledError:
+            # If a task is cancelled, we don't know the term easily here.
+            # The main process handles cancellation signal.
+            sys.stderr.write("DEBUG: An MGS search task was cancelled.\n")
         except Exception as e:
+            # This catches errors during task execution/awaiting if not caught inside search_mgs_term
             error_message = str(e)
-            sys.stderr.write(f"ERROR: Error in search_mgs_term for '{term}' (NICE {'On' if nice_filter else 'Off'}): {error_message}\n")
-            # Return structured error object
-            return {
-                "type": "error",
-                "term": term,
-                "source": f"mgs-nice-{'on' if nice_filter else 'off'}",
-                "message": f"Error searching MGS: {error_message}"
-            }
-        finally:
-            await page.close()
+            sys.stderr.write(f"ERROR: Unexpected error processing MGS task result: {error_message}\n")
+            # Print a generic error message
+            emit({"type": "error", "source": "mgs", "message": error_message})
+
+    sys.stderr.write(f"DEBUG: MGS term lookups: {json.dumps(inflight.stats())}\n")
+    # Lookups stopped mid-search get a cancelled result per NICE setting
+    for task, (term, nice_filters) in tasks.items():
+        if task.cancelled() or not task.done():
+            for nice_filter in nice_filters:
+                emit(cancelled_result(term, f"mgs-nice-{nice_label(nice_filter)}"))
+
 
 # Modified to accept a list of task dictionaries
 async def run_mgs_searches(mgs_tasks: List[Dict]):
-    # sys.stderr.write("DEBUG: MGS SEARCH SCRIPT STARTED\n") # Removed debug message
-    mgs_base_url = "https://webaccess.wipo.int/mgs/"
     cancel_event = asyncio.Event()
-    semaphore = asyncio.Semaphore(CONCURRENT_LIMIT)
-    results = {}
+    semaphore = AdaptiveLimiter("MGS", CONCURRENT_LIMIT)
     start_time = time.time()
 
     if os.path.exists(DEBUG_LOG_FILE): # Clear log file at start of each search
         os.remove(DEBUG_LOG_FILE)
 
+    context = LazyBrowserContext(ResourcePolicy())
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-
-            tasks = []
-            # Create tasks based on the specific needs defined in mgs_tasks
-            for task_info in mgs_tasks:
-                term = task_info.get("term")
-                needs_nice_on = task_info.get("needsNiceOn", False)
-                needs_nice_off = task_info.get("needsNiceOff", False)
-
-                if needs_nice_off:
-                    tasks.append(asyncio.create_task(search_mgs_term(term, context, cancel_event, semaphore, nice_filter=False)))
-                if needs_nice_on:
-                    tasks.append(asyncio.create_task(search_mgs_term(term, context, cancel_event, semaphore, nice_filter=True)))
-
-            completed_count = 0
-            total_tasks = len(tasks) # Total number of actual searches to perform
-
-            if total_tasks == 0: # Handle case where no tasks were generated
-                 await context.close()
-                 await browser.close()
-                 elapsed_time = time.time() - start_time
-                 print(json.dumps({"type": "mgs-search-time", "value": f"{elapsed_time:.2f} seconds"}))
-                 return {} # Return empty results if no tasks
-
-            for task in asyncio.as_completed(tasks):
-                if os.path.exists(CANCELLATION_FILE):
-                    break
-                try:
-                    # The task now returns a structured result object (or error object)
-                    result_obj = await task
-
-                    # Print the structured result/error object directly
-                    print(json.dumps(result_obj))
-
-                    # Update progress (only count non-error results for progress?)
-                    if result_obj.get("type") != "error":
-                         completed_count += 1
-                         progress_percent = int((completed_count / total_tasks) * 100) if total_tasks > 0 else 100
-                         print(json.dumps({"type": "progress", "value": progress_percent}))
-
-                except asyncio.CancelledError:
-                    # If a task is cancelled, we don't know the term easily here.
-                    # The main process handles cancellation signal.
-                    # We could potentially try to find the cancelled task's details, but skip for now.
-                    sys.stderr.write("DEBUG: An MGS search task was cancelled.\n")
-                    # Optionally print a generic cancellation message
-                    # print(json.dumps({"type": "result", "source": "mgs", "matchType": "cancelled", "statusText": "Cancelled"}))
-                except Exception as e:
-                    # This catches errors during task execution/awaiting if not caught inside search_mgs_term
-                    error_message = str(e)
-                    sys.stderr.write(f"ERROR: Unexpected error processing MGS task result: {error_message}\n")
-                    # Print a generic error message
-                    print(json.dumps({"type": "error", "source": "mgs", "message": error_message}))
-
-
-            await context.close()
-            await browser.close()
+        pool = create_mgs_pool(context)
+        async with watch_cancellation(cancel_event): # SIGTERM/SIGINT or the cancellation file
+            await process_mgs_tasks(mgs_tasks, pool, cancel_event, semaphore)
+        sys.stderr.write(f"DEBUG: MGS page pool: {pool.navigations} navigations, {pool.reuses} reuses.\n")
+        sys.stderr.write(f"DEBUG: MGS concurrency: {json.dumps(semaphore.stats())}, circuit breakers: {json.dumps(breaker_stats())}\n")
+        await pool.close()
 
     except Exception as e:
         error_message = str(e)
-        print(json.dumps({"type": "error", "message": error_message}))
+        emit({"type": "error", "message": error_message})
+    finally:
+        await context.close()
+        context.resource_policy.log_stats("MGS")
 
+    sys.stderr.write(f"DEBUG: MGS result cache stats: {json.dumps(get_search_cache().stats())}\n")
     elapsed_time = time.time() - start_time
     # Send final time report, include source
-    print(json.dumps({"type": "search_time", "source": "mgs", "value": f"{elapsed_time:.2f} seconds"}))
-    # The function doesn't need to return results as they are printed directly
-    # return results
+    emit({"type": "search_time", "source": "mgs", "value": f"{elapsed_time:.2f} seconds"})
 
 if __name__ == "__main__":
     # No command-line arguments expected for MGS search anymore,
@@ -244,8 +295,7 @@ if __name__ == "__main__":
          sys.stderr.write("ERROR: Expected invocation: python mgs_search_script.py (with MGS_TASKS_JSON env var set)\n")
          sys.exit(1)
 
-    if os.path.exists(CANCELLATION_FILE):
-        os.remove(CANCELLATION_FILE)
+    clear_cancellation_file()
 
     # Read JSON task list from environment variable
     try:
@@ -0,0 +1,64 @@
+# python/micro_batch.py
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+
+class MicroBatcher:
+    """Collects submitted items for up to `window` seconds (or until `max_batch` are waiting)
+    and resolves all of them with a single `run_batch` call.
+
+    `run_batch(items)` receives distinct items and must return a dict with a value for each one;
+    every submit() awaiting that item gets the value. If it raises, they all get the exception.
+    """
+
+    def __init__(self, run_batch: Callable[[List], Awaitable[Dict]], max_batch: int = 20, window: float = 0.5):
+        self.run_batch = run_batch
+        self.max_batch = max(1, max_batch)
+        self.window = window
+        self._pending: List = [] # (item, future) pairs waiting for the next flush
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._running.add(task) # Keep a reference until it finishes
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List) -> None:
+        items = list(dict.fromkeys(item for item, _ in batch)) # Distinct, in arrival order
+        self.batches += 1
+        self.items += len(items)
+        try:
+            results = await self.run_batch(items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for item, future in batch:
+            if future.done(): # The submitter may have been cancelled meanwhile
+                continue
+            if item in results:
+                future.set_result(results[item])
+            else:
+                future.set_exception(KeyError(f"Batch returned no result for {item!r}"))
+
+    def stats(self) -> Dict:
+        return {"batches": self.batches, "items": self.items}
@@ -0,0 +1,128 @@
+# python/nice_classifier.py
+import re
+from collections import Counter
+from typing import Dict, List
+
+try:
+    import numpy as np # Optional: only needed for local NICE class prediction
+except ImportError:
+    np = None
+
+from nice_index import split_classes, tokenize
+
+EXCLUSIONS_HEADER = "This Class does not include"
+# "-	raw natural resins (Cl. 2), semi-processed resins (Cl. 17);" -> ("raw natural resins", "2"), ...
+CROSS_REFERENCE_RE = re.compile(r"([^()]+?)\s*\(Cl\. (\d+)\)")
+CHAR_NGRAM = 4
+QUERY_CHUNK_ROWS = 512 # Terms scored per chunk; bounds memory on large dockets
+CONFIDENCE_SHARPNESS = 20.0 # Softmax temperature over cosine scores
+
+
+class NiceClassifierError(Exception):
+    """Raised when local classification is unavailable."""
+
+
+def features(text: str) -> List[str]:
+    """Word unigrams/bigrams plus character n-grams, so 'foodstuffs' still overlaps 'food'."""
+    words = tokenize(text)
+    grams = [f"w:{word}" for word in words]
+    grams.extend(f"b:{first} {second}" for first, second in zip(words, words[1:]))
+    for word in words:
+        padded = f"_{word}_"
+        grams.extend(f"c:{padded[i:i + CHAR_NGRAM]}" for i in range(max(1, len(padded) - CHAR_NGRAM + 1)))
+    return grams
+
+
+def class_documents(nice_text: str) -> Dict[int, str]:
+    """Per-class training text: each class's own wording plus the items other classes exclude in its favour."""
+    documents = {}
+    cross_references: Dict[int, List[str]] = {}
+    for number, chunk in split_classes(nice_text).items():
+        own, _, exclusions = chunk.partition(EXCLUSIONS_HEADER)
+        documents[number] = own
+        # An exclusion such as "fungicides (Cl. 5)" is evidence for class 5, not for this class
+        for item, target in CROSS_REFERENCE_RE.findall(exclusions):
+            cross_references.setdefault(int(target), []).append(item.strip(" \t-;,"))
+    for number, items in cross_references.items():
+        if number in documents:
+            documents[number] += "\n" + "\n".join(items)
+    return documents
+
+
+class NiceClassifier:
+    """TF-IDF model of the 45 NICE classes; scores a batch of terms a chunk at a time.
+
+    Terms stay sparse (a few dozen features each against a vocabulary of thousands), so a chunk is
+    scored by summing the class-matrix columns of its features rather than by a dense multiply.
+    """
+
+    def __init__(self, nice_text: str):
+        if np is None:
+            raise NiceClassifierError("numpy is not installed; local NICE classification is unavailable.")
+        documents = class_documents(nice_text)
+        self.classes = sorted(documents)
+        counts = [Counter(features(documents[number])) for number in self.classes]
+        self.vocabulary = {gram: i for i, gram in enumerate(sorted(set().union(*counts)))}
+        matrix = np.zeros((len(self.classes), len(self.vocabulary)), dtype=np.float32)
+        for row, document_counts in enumerate(counts):
+            for gram, count in document_counts.items():
+                matrix[row, self.vocabulary[gram]] = 1 + np.log(count) # Sublinear term frequency
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        self.idf = (np.log((1 + len(self.classes)) / (1 + document_frequency)) + 1).astype(np.float32)
+        self.matrix = self._normalize(matrix * self.idf)
+        self._columns = np.ascontiguousarray(self.matrix.T) # One row of class weights per feature
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return matrix / norms
+
+    def _vectorize(self, terms: List[str]):
+        """Sparse TF-IDF rows: (feature columns, weights, start of each term's entries)."""
+        columns: List[int] = []
+        counts: List[int] = []
+        starts = np.zeros(len(terms) + 1, dtype=np.int64)
+        for row, term in enumerate(terms):
+            for gram, count in Counter(features(term)).items():
+                column = self.vocabulary.get(gram)
+                if column is not None:
+                    columns.append(column)
+                    counts.append(count)
+            starts[row + 1] = len(columns)
+        columns = np.array(columns, dtype=np.int64)
+        weights = (1 + np.log(np.array(counts, dtype=np.float32))) * self.idf[columns]
+        return columns, weights, starts
+
+    def _score_chunk(self, terms: List[str]):
+        columns, weights, starts = self._vectorize(terms)
+        scores = np.zeros((len(terms), len(self.classes)), dtype=np.float32)
+        rows = np.flatnonzero(np.diff(starts)) # Terms with at least one known feature
+        if len(rows):
+            segments = starts[rows]
+            norms = np.sqrt(np.add.reduceat(weights * weights, segments))
+            scores[rows] = np.add.reduceat(self._columns[columns] * weights[:, None], segments) / norms[:, None]
+        return scores
+
+    def scores(self, terms: List[str]):
+        """Cosine similarity of every term to every class: shape (len(terms), 45)."""
+        blocks = [self._score_chunk(terms[start:start + QUERY_CHUNK_ROWS]) for start in range(0, len(terms), QUERY_CHUNK_ROWS)]
+        return np.vstack(blocks) if blocks else np.zeros((0, len(self.classes)), dtype=np.float32)
+
+    def classify(self, terms: List[str], top_k: int = 3) -> List[List[Dict]]:
+        """Ranked [{"class", "score", "confidence"}] per term, classes with a zero score left out (so empty
+        for terms sharing nothing with the NICE text)."""
+        scores = self.scores(terms)
+        results = []
+        for row in scores:
+            if not row.any():
+                results.append([])
+                continue
+            weights = np.exp(CONFIDENCE_SHARPNESS * (row - row.max()))
+            confidence = weights / weights.sum()
+            ranked = np.argsort(-row)[:top_k]
+            results.append([
+                {"class": self.classes[i], "score": round(float(row[i]), 4), "confidence": round(float(confidence[i]), 4)}
+                for i in ranked if row[i] > 0
+            ])
+        return results
@@ -0,0 +1,78 @@
+# python/nice_index.py
+import re
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CLASS_HEADER_RE = re.compile(r"^Class (\d+)\s*$", re.MULTILINE)
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Words that appear in nearly every class (or every query) and only add noise to the ranking
+STOPWORDS = frozenset("""
+a an and any are as at be by for from in include includes including into is it its not of on or other
+particular such than that the their them these this those to with without class classes cl mainly
+certain example goods services use used purposes namely
+""".split())
+
+
+def stem(token: str) -> str:
+    # Plural folding is enough for ID Manual wording (wallets/wallet, batteries/battery)
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(token) for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def split_classes(nice_text: str) -> Dict[int, str]:
+    """Splits the NICE text into {class number: heading and explanatory note} chunks."""
+    headers = list(CLASS_HEADER_RE.finditer(nice_text))
+    chunks = {}
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(nice_text)
+        chunks[int(header.group(1))] = nice_text[header.start():end].strip()
+    return chunks
+
+
+class NiceIndex:
+    """BM25 index over the per-class chunks of the NICE Classification text."""
+
+    def __init__(self, nice_text: str, k1: float = 1.5, b: float = 0.75):
+        self.chunks = split_classes(nice_text)
+        self.k1 = k1
+        self.b = b
+        self.term_counts: Dict[int, Counter] = {number: Counter(tokenize(chunk)) for number, chunk in self.chunks.items()}
+        self.lengths = {number: sum(counts.values()) for number, counts in self.term_counts.items()}
+        self.average_length = sum(self.lengths.values()) / max(1, len(self.lengths))
+        document_frequency = Counter(token for counts in self.term_counts.values() for token in counts)
+        total = len(self.chunks)
+        self.idf = {token: math.log(1 + (total - df + 0.5) / (df + 0.5)) for token, df in document_frequency.items()}
+
+    def scores(self, fields: Iterable[Tuple[Optional[str], float]]) -> Dict[int, float]:
+        """BM25 score per class for a query made of (text, weight) fields."""
+        query: Counter = Counter()
+        for text, weight in fields:
+            for token in tokenize(text or ""):
+                query[token] += weight
+        scores = {}
+        for number, counts in self.term_counts.items():
+            norm = self.k1 * (1 - self.b + self.b * self.lengths[number] / self.average_length)
+            score = 0.0
+            for token, weight in query.items():
+                tf = counts.get(token)
+                if tf:
+                    score += weight * self.idf[token] * tf * (self.k1 + 1) / (tf + norm)
+            scores[number] = score
+        return scores
+
+    def top_classes(self, fields: Iterable[Tuple[Optional[str], float]], k: int) -> List[int]:
+        """Up to k best-scoring class numbers; empty when nothing in the query matches."""
+        ranked = sorted(((score, number) for number, score in self.scores(fields).items() if score > 0), reverse=True)
+        return [number for _, number in ranked[:k]]
+
+    def context(self, class_numbers: List[int]) -> str:
+        """The chosen classes' chunks, in class order, for inclusion in a prompt."""
+        return "\n\n".join(self.chunks[number] for number in sorted(class_numbers))
@@ -0,0 +1,175 @@
+# python/page_pool.py
+import sys
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, List
+
+from cancellation import CLOSE_TIMEOUT_SECONDS, close_within
+from spans import span
+
+# Installed right before a search is submitted on a reused page. It flags any change
+# to the result elements so we never read the previous term's results by mistake.
+ARM_CHANGE_WATCH_JS = """
+(selectors) => {
+    if (window.__poolObserver) { window.__poolObserver.disconnect(); }
+    window.__poolChanged = false;
+    // Result elements may not exist yet on a fresh page, so watch the whole body and
+    // only count mutations inside (or adding) one of the result elements.
+    const touches = (node) => {
+        const el = node.nodeType === 1 ? node : node.parentElement;
+        return !!el && selectors.some(s => el.closest(s) || (node.nodeType === 1 && el.querySelector(s)));
+    };
+    const observer = new MutationObserver((records) => {
+        for (const record of records) {
+            const target = record.target.nodeType === 1 ? record.target : record.target.parentElement;
+            if ((target && selectors.some(s => target.closest(s))) || Array.from(record.addedNodes).some(touches)) {
+                window.__poolChanged = true;
+                observer.disconnect();
+                return;
+            }
+        }
+    });
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    window.__poolObserver = observer;
+}
+"""
+
+
+class PagePool:
+    """Keeps up to `size` pages loaded on a search UI so each term only re-fills the search box.
+
+    `prepare` navigates a page to the search screen; `ready_selector` must be present on a
+    healthy page. Pages that fail the health check are re-navigated before being handed out.
+    """
+
+    def __init__(self, context, prepare: Callable[[object], Awaitable[None]], ready_selector: str, size: int):
+        self.context = context
+        self.prepare = prepare
+        self.ready_selector = ready_selector
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._pages: List = []
+        self._create_lock = asyncio.Lock()
+        self.navigations = 0 # Full page loads performed (initial + re-navigations)
+        self.reuses = 0
+
+    async def _navigate(self, page) -> None:
+        self.navigations += 1
+        await self.prepare(page)
+
+    async def _is_healthy(self, page) -> bool:
+        if page.is_closed():
+            return False
+        try:
+            return await page.query_selector(self.ready_selector) is not None
+        except Exception:
+            return False
+
+    async def acquire(self):
+        """Returns a page sitting on the search screen, creating one if the pool is not full yet."""
+        page = None
+        if self._idle.empty():
+            async with self._create_lock:
+                if len(self._pages) < self.size:
+                    page = await self.context.new_page()
+                    self._pages.append(page)
+        if page is None:
+            page = await self._idle.get()
+            try:
+                healthy = await self._is_healthy(page)
+            except BaseException: # Cancelled (e.g. a term deadline) mid-check; don't lose the page
+                self._idle.put_nowait(page)
+                raise
+            if healthy:
+                self.reuses += 1
+                return page
+            sys.stderr.write("DEBUG: Pooled page went stale, re-navigating.\n")
+            if page.is_closed():
+                self._pages.remove(page)
+                page = await self.context.new_page()
+                self._pages.append(page)
+        try:
+            await self._navigate(page)
+        except BaseException: # Includes cancellation, so a timed-out load still returns the page
+            await self.release(page, stale=True)
+            raise
+        return page
+
+    async def release(self, page, stale: bool = False) -> None:
+        """Returns a page to the pool. Stale pages are re-navigated on their next acquire."""
+        if stale and not page.is_closed():
+            try:
+                await page.goto("about:blank", timeout=CLOSE_TIMEOUT_SECONDS * 1000) # Bounded: may run while cancelling
+            except Exception:
+                await page.close()
+        self._idle.put_nowait(page)
+
+    @asynccontextmanager
+    async def page(self):
+        with span("page_acquire"): # Includes navigating a fresh or stale page (its own goto span)
+            page = await self.acquire()
+        stale = False
+        try:
+            yield page
+        except BaseException:
+            stale = True # Unknown page state after a failure; reload it before reuse
+            raise
+        finally:
+            await self.release(page, stale=stale)
+
+    async def close(self) -> None:
+        """Closes every page concurrently, giving up after CLOSE_TIMEOUT_SECONDS (the context close still follows)."""
+        open_pages = [page for page in self._pages if not page.is_closed()]
+        if open_pages:
+            await close_within("Page pool", asyncio.gather(*(page.close() for page in open_pages), return_exceptions=True))
+        self._pages.clear()
+
+
+async def arm_change_watch(page, selectors: List[str]) -> None:
+    await page.evaluate(ARM_CHANGE_WATCH_JS, selectors)
+
+
+async def wait_for_change(page, ready_js: str, timeout: float) -> None:
+    """Waits until a watched element changed and `ready_js` (an expression) is truthy."""
+    await page.wait_for_function(f"window.__poolChanged === true && ({ready_js})", timeout=timeout)
+
+
+class LazyBrowserContext:
+    """Starts Playwright and Chromium on the first new_page() call.
+
+    Runs served entirely by the HTTP engine, the local index or the cache never pay for a browser.
+    `resource_policy` (e.g. a ResourcePolicy) is installed on the context when it is created.
+    """
+
+    def __init__(self, resource_policy=None):
+        self.resource_policy = resource_policy
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self._lock = asyncio.Lock()
+
+    async def get(self):
+        async with self._lock:
+            if self.context is None:
+                from playwright.async_api import async_playwright
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=True)
+                self.context = await self.browser.new_context()
+                if self.resource_policy is not None:
+                    await self.resource_policy.install(self.context)
+                sys.stderr.write("DEBUG: Browser launched.\n")
+            return self.context
+
+    async def new_page(self):
+        context = await self.get()
+        return await context.new_page()
+
+    async def close(self) -> None:
+        """Each step is bounded; stopping Playwright always runs last and takes Chromium down with its driver."""
+        if self.context is not None:
+            await close_within("Browser context", self.context.close())
+        if self.browser is not None:
+            await close_within("Browser", self.browser.close())
+        if self.playwright is not None:
+            await close_within("Playwright", self.playwright.stop())
+        self.context = self.browser = self.playwright = None
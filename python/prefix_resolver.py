@@ -0,0 +1,97 @@
+# python/prefix_resolver.py
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+# probe(prefix) returns the listing shown for prefix, or None if the search finds nothing
+Probe = Callable[[str], Awaitable[Optional[Dict]]]
+
+
+class _Probe:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class PrefixResolver:
+    """Finds the longest word prefix of a term that returns listings.
+
+    Several candidate lengths are probed at once (a k-ary search instead of a sequential binary
+    search), every probe is memoized in a word trie shared by all terms of the run, and the
+    winning probe's listing is handed back so the caller never searches the prefix again.
+    Each probe runs as its own task, so a term being cancelled only stops the probes no other
+    term is waiting on; failed or cancelled probes are forgotten and retried by later terms.
+    """
+
+    def __init__(self, probe: Probe, normalize: Callable[[str], str], fanout: int = 3):
+        self.probe = probe
+        self.normalize = normalize
+        self.fanout = max(1, fanout)
+        self._root: Dict = {}
+        self.probes = 0
+        self.memo_hits = 0
+
+    def _node(self, key_words: List[str]) -> Dict:
+        node = self._root
+        for word in key_words:
+            node = node.setdefault("children", {}).setdefault(word, {})
+        return node
+
+    @staticmethod
+    def _forget(node: Dict, probe: _Probe) -> None:
+        if node.get("probe") is probe:
+            del node["probe"]
+
+    def _settled(self, node: Dict, probe: _Probe) -> None:
+        if probe.task.cancelled() or probe.task.exception() is not None:
+            self._forget(node, probe) # Don't memoize failures; a later term may retry
+
+    async def _probe(self, prefix: str) -> Optional[Dict]:
+        node = self._node(self.normalize(prefix).split())
+        probe = node.get("probe")
+        if probe is not None: # Settled or in flight for another term; share it
+            self.memo_hits += 1
+        else:
+            probe = _Probe(asyncio.create_task(self.probe(prefix)))
+            probe.task.add_done_callback(lambda _, node=node, probe=probe: self._settled(node, probe))
+            node["probe"] = probe
+            self.probes += 1
+        probe.waiters += 1
+        try:
+            return await asyncio.shield(probe.task)
+        finally:
+            probe.waiters -= 1
+            if probe.waiters == 0 and not probe.task.done():
+                self._forget(node, probe) # New callers start over rather than join a cancelled probe
+                probe.task.cancel()
+
+    def _probe_points(self, lo: int, hi: int) -> List[int]:
+        span = hi - lo + 1
+        if span <= self.fanout:
+            return list(range(lo, hi + 1))
+        return sorted({lo + (span * (i + 1)) // (self.fanout + 1) for i in range(self.fanout)})
+
+    async def longest_prefix(self, term: str, is_cancelled: Callable[[], bool]) -> Tuple[Optional[str], Optional[Dict]]:
+        """Returns (prefix, listing) for the longest prefix with results, or (None, None)."""
+        words = term.strip().split()
+        lo, hi = 1, len(words)
+        best_length, best_listing = 0, None
+        while lo <= hi:
+            if is_cancelled():
+                return None, None
+            points = self._probe_points(lo, hi)
+            listings = await asyncio.gather(*(self._probe(" ".join(words[:length])) for length in points))
+            found = [length for length, listing in zip(points, listings) if listing]
+            if found and max(found) > best_length:
+                best_length = max(found)
+                best_listing = listings[points.index(best_length)]
+            # Results are assumed monotonic in prefix length (as the binary search was):
+            # search above the longest hit and below the shortest miss that follows it.
+            misses_above = [length for length, listing in zip(points, listings) if not listing and length > best_length]
+            lo = best_length + 1
+            hi = min(misses_above) - 1 if misses_above else hi
+        if best_length == 0:
+            return None, None
+        return " ".join(words[:best_length]), best_listing
+
+    def stats(self) -> Dict:
+        return {"probes": self.probes, "memoHits": self.memo_hits}
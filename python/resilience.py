@@ -0,0 +1,215 @@
+# python/resilience.py
+import os
+import sys
+import time
+import random
+import asyncio
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+
+from adaptive_limit import AdaptiveLimiter
+
+TERM_DEADLINE_SECONDS = float(os.environ.get("TERM_DEADLINE", 120)) # Budget for all of one term's work, retries and Gemini included
+TERM_RETRIES = int(os.environ.get("TERM_RETRIES", 2)) # Extra attempts after a transient failure
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 8.0
+NAVIGATION_TIMEOUT_MS = int(os.environ.get("NAVIGATION_TIMEOUT_MS", 60000)) # A single page load
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURES", 5)) # Consecutive failures that open a host's circuit
+BREAKER_RESET_SECONDS = float(os.environ.get("BREAKER_RESET", 30)) # Open time before one trial request is let through
+# Playwright/network failures worth another attempt on a fresh page
+TRANSIENT_ERROR_MARKERS = ("Timeout", "net::ERR_", "Target closed", "has been closed", "Navigation failed", "crashed",
+                           "ECONNRESET", "Connection reset")
+
+T = TypeVar("T")
+
+
+def jittered_backoff(attempt: int, base: float = RETRY_BASE_SECONDS, maximum: float = RETRY_MAX_SECONDS) -> float:
+    """Exponential backoff for retry `attempt` (0-based), randomised to between half and all of it."""
+    return min(maximum, base * 2 ** attempt) * (0.5 + random.random() / 2)
+
+
+def is_transient(error: BaseException) -> bool:
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    text = f"{type(error).__name__}: {error}"
+    return any(marker in text for marker in TRANSIENT_ERROR_MARKERS)
+
+
+class TermFailure(Exception):
+    """A term's lookup gave up: it ran out of time (`kind` "timeout"), out of retries ("error"), or its host's circuit is open."""
+
+    def __init__(self, kind: str, stage: str, message: str):
+        super().__init__(message)
+        self.kind = kind
+        self.stage = stage
+
+    def error_record(self, term: str, source: str, prefix: str) -> Dict:
+        """The structured error reported for the term in place of a result."""
+        return {"type": "error", "term": term, "source": source, "message": f"{prefix}: {self}",
+                "errorKind": self.kind, "stage": self.stage}
+
+
+class CircuitOpenError(TermFailure):
+    def __init__(self, host: str, retry_in: float):
+        super().__init__("circuit_open", "circuit breaker", f"{host} is failing; not trying it again for {retry_in:.0f}s")
+
+
+class CircuitBreaker:
+    """Fails fast for a host after BREAKER_FAILURE_THRESHOLD consecutive failures.
+
+    After BREAKER_RESET_SECONDS open, one caller is let through as a trial (half-open): success
+    closes the circuit, failure re-opens it for another period.
+    """
+
+    def __init__(self, host: str, threshold: int = BREAKER_FAILURE_THRESHOLD, reset_seconds: float = BREAKER_RESET_SECONDS):
+        self.host = host
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self.rejected = 0
+
+    def check(self) -> None:
+        """Raises CircuitOpenError while the host is considered down."""
+        if self.state == "closed":
+            return
+        waited = time.monotonic() - self.opened_at
+        if self.state == "open" and waited >= self.reset_seconds:
+            self.state = "half_open"
+            self.opened_at = time.monotonic() # The trial gets one period; if it never reports, another goes after it
+            sys.stderr.write(f"DEBUG: Circuit for {self.host} half-open; sending a trial request.\n")
+            return
+        if self.state == "half_open" and waited >= self.reset_seconds:
+            self.opened_at = time.monotonic()
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.host, self.reset_seconds - waited)
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            sys.stderr.write(f"DEBUG: Circuit for {self.host} closed again.\n")
+        self.state = "closed"
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == "half_open" or (self.state == "closed" and self.consecutive_failures >= self.threshold):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self.opens += 1
+            sys.stderr.write(f"WARN: Circuit for {self.host} opened after {self.consecutive_failures} consecutive failure(s).\n")
+
+    def stats(self) -> Dict:
+        return {"state": self.state, "opens": self.opens, "rejected": self.rejected}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    """The process-wide circuit breaker for the URL's host."""
+    host = urlparse(url).hostname or url
+    if host not in _breakers:
+        _breakers[host] = CircuitBreaker(host)
+    return _breakers[host]
+
+
+def breaker_stats() -> Dict:
+    return {host: breaker.stats() for host, breaker in _breakers.items()}
+
+
+class TermDeadline:
+    """One term's time budget, shared by its page work (run_term) and whatever follows it (e.g. Gemini).
+
+    The clock starts on the first start(): run_term calls it once its first permit is granted.
+    """
+
+    def __init__(self, budget: float = TERM_DEADLINE_SECONDS):
+        self.budget = budget
+        self.expires_at: Optional[float] = None
+
+    def start(self) -> None:
+        if self.expires_at is None:
+            self.expires_at = asyncio.get_running_loop().time() + self.budget
+
+    def remaining(self) -> float:
+        """Seconds left (starting the clock if it has not started yet)."""
+        self.start()
+        return max(0.0, self.expires_at - asyncio.get_running_loop().time())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and self.remaining() <= 0
+
+
+class _StageTracker:
+    def __init__(self):
+        self.stage = "starting"
+
+
+_stage_tracker: ContextVar[Optional[_StageTracker]] = ContextVar("stage_tracker", default=None)
+
+
+def mark_stage(stage: str) -> None:
+    """Records the step a term's lookup is on, so a timeout can say where it stalled. No-op outside run_term."""
+    tracker = _stage_tracker.get()
+    if tracker is not None:
+        tracker.stage = stage
+
+
+def current_stage() -> Optional[str]:
+    tracker = _stage_tracker.get()
+    return tracker.stage if tracker is not None else None
+
+
+async def run_term(label: str, operation: Callable[[], Awaitable[T]], breaker: CircuitBreaker, limiter: AdaptiveLimiter,
+                   deadline: Optional[TermDeadline] = None, retries: int = TERM_RETRIES) -> T:
+    """Runs `operation` for one term under `limiter`, with a deadline and bounded retries.
+
+    The `deadline` clock (a fresh TERM_DEADLINE_SECONDS one by default) starts when the first
+    permit is granted (queueing for a permit is not the term's fault) and covers every attempt
+    and the backoff between them. Transient failures are retried with jittered backoff, releasing
+    the permit while waiting. Every failure is reported to the host's `breaker`; while it is open,
+    the term fails at once without taking a permit. A budget spent queueing for a retry's permit
+    is not the host's failure and is not reported. Raises TermFailure naming the stage that was
+    running when time ran out or the last error hit.
+    """
+    deadline = deadline or TermDeadline()
+    tracker = _StageTracker()
+    token = _stage_tracker.set(tracker) # Tasks the operation creates inherit the tracker
+    error = None
+    try:
+        for attempt in range(retries + 1):
+            breaker.check()
+            async with limiter:
+                if deadline.expired():
+                    limiter.skip_sample() # Nothing was sent, so this says nothing about the host
+                    break
+                deadline.start()
+                try:
+                    result = await asyncio.wait_for(operation(), deadline.remaining())
+                except asyncio.TimeoutError as e:
+                    breaker.record_failure()
+                    if deadline.expired():
+                        raise TermFailure("timeout", tracker.stage, f"{label} stalled at '{tracker.stage}' ({deadline.budget:g}s deadline)") from e
+                    error = e # The operation's own timeout, not ours
+                except Exception as e:
+                    breaker.record_failure()
+                    error = e
+                else:
+                    breaker.record_success()
+                    return result
+                if not is_transient(error) or attempt == retries:
+                    attempts = f" after {attempt + 1} attempts" if attempt else ""
+                    raise TermFailure("error", tracker.stage, f"{label} failed at '{tracker.stage}'{attempts}: {error}") from error
+                limiter.record_failure() # Leaving the block normally would count the failed attempt as a latency sample
+            delay = jittered_backoff(attempt)
+            if delay >= deadline.remaining():
+                break
+            sys.stderr.write(f"DEBUG: {label} hit a transient error at '{tracker.stage}' ({error}); retrying in {delay:.1f}s.\n")
+            await asyncio.sleep(delay)
+        raise TermFailure("timeout", tracker.stage, f"{label} stalled at '{tracker.stage}' ({deadline.budget:g}s deadline)") from error
+    finally:
+        _stage_tracker.reset(token)
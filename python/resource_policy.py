@@ -0,0 +1,101 @@
+# python/resource_policy.py
+import os
+import sys
+from collections import Counter
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Resource types the search screens do not need to render results or accept input
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet", "texttrack", "manifest"})
+# Analytics and tag-manager hosts common on government and IP-office sites; subdomains match too
+TRACKER_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "dap.digitalgov.gov", "analytics.usa.gov", "siteimproveanalytics.com", "siteimproveanalytics.io",
+    "hotjar.com", "nr-data.net", "newrelic.com", "clarity.ms", "facebook.net", "matomo.cloud",
+)
+# Per-site allowlists: URL prefixes (host + path) whose listed resource types are always fetched.
+# First-party stylesheets stay: readiness checks wait for *visible* elements and CSS decides
+# visibility. Third-party stylesheets are still blocked.
+SITE_ALLOWLISTS: Dict[str, frozenset] = {
+    "idm-tmng.uspto.gov/": frozenset({"stylesheet"}),
+    "webaccess.wipo.int/mgs/": frozenset({"stylesheet"}),
+}
+# Rough transfer size of one blocked request, by resource type (aborted requests never report
+# their own), for an order-of-magnitude estimate of the bytes blocking saved
+TYPICAL_BYTES = {"image": 20000, "media": 250000, "font": 25000, "stylesheet": 15000, "texttrack": 2000,
+                 "manifest": 1000, "script": 30000}
+TYPICAL_BYTES_OTHER = 1000 # Tracker beacons, pings and XHRs
+
+
+def _is_tracker(host: str) -> bool:
+    return any(host == tracker or host.endswith("." + tracker) for tracker in TRACKER_HOSTS)
+
+
+def should_block(url: str, resource_type: str) -> bool:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return False # data:, blob:, about: never hit the network
+    host = (parts.hostname or "").lower()
+    if _is_tracker(host):
+        return True
+    if resource_type not in BLOCKED_RESOURCE_TYPES:
+        return False
+    location = host + (parts.path or "/")
+    return not any(location.startswith(prefix) and resource_type in types for prefix, types in SITE_ALLOWLISTS.items())
+
+
+class ResourcePolicy:
+    """Context-wide request routing that aborts non-essential resources and trackers.
+
+    Counts blocked requests by resource type, with an estimate of the bytes they would have
+    transferred (TYPICAL_BYTES; aborted requests have no size of their own), so runs can report
+    what blocking saved. For the traffic that remained it counts allowed requests and the
+    content-length of their responses; chunked or compressed responses often send none and are
+    counted as undeclared. Set BLOCK_RESOURCES=off to disable.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self.enabled = enabled if enabled is not None else os.environ.get("BLOCK_RESOURCES", "on").lower() != "off"
+        self.blocked: Counter = Counter()
+        self.allowed = 0
+        self.declared_bytes = 0
+        self.undeclared_responses = 0
+
+    async def install(self, context) -> None:
+        if not self.enabled:
+            return
+        await context.route("**/*", self._route)
+        context.on("response", self._count_response)
+
+    async def _route(self, route) -> None:
+        request = route.request
+        if should_block(request.url, request.resource_type):
+            self.blocked[request.resource_type] += 1
+            await route.abort("blockedbyclient")
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    def _count_response(self, response) -> None:
+        try:
+            self.declared_bytes += int(response.headers["content-length"])
+        except (KeyError, ValueError):
+            self.undeclared_responses += 1
+
+    def estimated_saved_bytes(self) -> int:
+        return sum(TYPICAL_BYTES.get(resource_type, TYPICAL_BYTES_OTHER) * count for resource_type, count in self.blocked.items())
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "blockedRequests": sum(self.blocked.values()),
+            "blockedByType": dict(self.blocked),
+            "estimatedSavedBytes": self.estimated_saved_bytes(),
+            "allowedRequests": self.allowed,
+            "declaredFetchedBytes": self.declared_bytes,
+            "undeclaredResponses": self.undeclared_responses,
+        }
+
+    def log_stats(self, label: str) -> None:
+        if self.enabled:
+            sys.stderr.write(f"DEBUG: {label} resource policy: {self.stats()}\n")
@@ -0,0 +1,149 @@
+# python/result_cache.py
+import os
+import sys
+import json
+import time
+import sqlite3
+from typing import Optional, Dict
+
+# Default location sits next to the scripts so it does not depend on the working directory
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "search_cache.sqlite3")
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60 # One week; the ID Manual / MGS change slowly
+DEFAULT_MAX_ENTRIES = 50000
+# Writes between exact COUNT(*)s; in between the entry count is kept by hand. Other processes
+# sharing the file (concurrent runs, --workers) also add entries, so it is re-synced now and then.
+RECOUNT_EVERY = 1000
+
+
+class ResultCache:
+    """Persistent, size-bounded result cache backed by SQLite (TTL + LRU eviction)."""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None, table: str = "search_results"):
+        self.path = path or os.environ.get("SEARCH_CACHE_PATH") or DEFAULT_CACHE_PATH
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.environ.get("SEARCH_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        self.max_entries = max_entries if max_entries is not None else int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        self.table = table
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._count: Optional[int] = None # Entries in the table, as far as this process knows
+        self._writes_since_count = 0
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(self.path, timeout=5, isolation_level=None) # Autocommit
+            self._conn.execute("PRAGMA journal_mode=WAL") # Lets concurrent script runs read while one writes
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table}_last_access ON {self.table}(last_access)")
+        except sqlite3.Error as e:
+            # A broken cache must never break a search; run uncached instead
+            sys.stderr.write(f"DEBUG: Result cache disabled ({self.path}): {e}\n")
+            self._conn = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None and self.max_entries > 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached value for key, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        try:
+            row = self._conn.execute(f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, created_at = row
+            if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                self._forget(self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,)).rowcount)
+                self.misses += 1
+                return None
+            self._conn.execute(f"UPDATE {self.table} SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return json.loads(value)
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            sys.stderr.write(f"DEBUG: Result cache read failed for '{key}': {e}\n")
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Dict) -> None:
+        """Store value under key and evict least recently used entries beyond max_entries."""
+        if not self.enabled:
+            return
+        now = time.time()
+        encoded = json.dumps(value)
+        try:
+            inserted = self._conn.execute(
+                f"INSERT OR IGNORE INTO {self.table} (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, encoded, now, now)
+            ).rowcount
+            if not inserted:
+                self._conn.execute(f"UPDATE {self.table} SET value = ?, created_at = ?, last_access = ? WHERE key = ?",
+                                   (encoded, now, now, key))
+            self._writes_since_count += 1
+            if self._count is None or self._writes_since_count >= RECOUNT_EVERY:
+                self._count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+                self._writes_since_count = 0
+            elif inserted:
+                self._count += 1
+            overflow = self._count - self.max_entries
+            if overflow > 0:
+                evicted = self._conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                ).rowcount
+                self._count -= evicted
+                self.evictions += evicted
+        except sqlite3.Error as e:
+            sys.stderr.write(f"DEBUG: Result cache write failed for '{key}': {e}\n")
+
+    def _forget(self, deleted: int) -> None:
+        if self._count is not None:
+            self._count = max(0, self._count - deleted)
+
+    def delete(self, key: str) -> None:
+        if not self.enabled:
+            return
+        try:
+            self._forget(self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,)).rowcount)
+        except sqlite3.Error as e:
+            sys.stderr.write(f"DEBUG: Result cache delete failed for '{key}': {e}\n")
+
+    def clear(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._count = 0
+        except sqlite3.Error as e:
+            sys.stderr.write(f"DEBUG: Result cache clear failed: {e}\n")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this process plus the current entry count."""
+        size = 0
+        if self.enabled:
+            try:
+                size = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": size,
+            "maxEntries": self.max_entries,
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,1049 +1,406 @@
 # script.py
+import time
+_startup_marks = [("start", time.perf_counter())] # Reported by --startup-profile
 import sys
 import asyncio
-import time
 import re
 import json
 import os
+import hashlib
 from typing import List, Tuple, Optional, Dict
-
-from playwright.async_api import async_playwright
-import google.generativeai as genai
 import logging # Import logging for better error handling in parsing
+# playwright, google.generativeai, httpx and numpy are imported on first use: each mode only pays for what it needs
+_startup_marks.append(("stdlib", time.perf_counter()))
+
+from result_cache import ResultCache
+from page_pool import PagePool, LazyBrowserContext, arm_change_watch, wait_for_change
+from resource_policy import ResourcePolicy
+from uspto_http import UsptoHttpClient, UsptoHttpError
+from id_manual_index import DEFAULT_MAX_AGE_DAYS, LocalIdIndex
+from prefix_resolver import PrefixResolver
+from gemini_client import GeminiClient, GeminiUnavailableError, DEFAULT_CONCURRENCY as GEMINI_DEFAULT_CONCURRENCY, DEFAULT_REQUESTS_PER_MINUTE as GEMINI_DEFAULT_RPM
+from micro_batch import MicroBatcher
+from nice_index import NiceIndex
+from stream_output import emit, current_request_id
+from adaptive_limit import AdaptiveLimiter
+from singleflight import SingleFlight
+from resilience import (TermDeadline, TermFailure, NAVIGATION_TIMEOUT_MS, breaker_for, breaker_stats, run_term)
+from spans import bind_term, span
+from term_matching import FULL, TermMatcher, is_subsequence, normalize_mgs_text, normalize_text
+from mgs_search_script import create_mgs_pool, process_mgs_tasks, search_mgs_term, mgs_nice_filters, nice_label, get_search_cache as get_mgs_search_cache, CONCURRENT_LIMIT as MGS_CONCURRENT_LIMIT
+from job_stream import JobStream, read_lines_into, DEFAULT_LINE_BUFFER, DEFAULT_MAX_IN_FLIGHT
+from shard_coordinator import ShardCoordinator, worker_env
+from cancellation import (cancellation_requested, clear_cancellation_file, watch_cancellation, as_completed_until_cancelled,
+                          cancelled_result)
+_startup_marks.append(("local_modules", time.perf_counter()))
 
-# --- NICE Classification Data ---
-NICE_CLASSIFICATION_TEXT = """
-Class 1
-Chemicals for use in industry, science and photography, as well as in agriculture, horticulture and forestry; unprocessed artificial resins, unprocessed plastics; fire extinguishing and fire prevention compositions; tempering and soldering preparations; substances for tanning animal skins and hides; adhesives for use in industry; putties and other paste fillers; compost, manures, fertilizers; biological preparations for use in industry and science.
-Explanatory Note
-Class 1 includes mainly chemical products for use in industry, science and agriculture, including those which go to the making of products belonging to other classes.
-This Class includes, in particular:
--	sensitized paper;
--	tyre repairing compositions;
--	salt for preserving, other than for foodstuffs;
--	certain additives for use in the food industry, for example, pectin, lecithin, enzymes and chemical preservatives;
--	certain ingredients for use in the manufacture of cosmetics and pharmaceuticals, for example, vitamins, preservatives and antioxidants;
--	certain filtering materials, for example, mineral substances, vegetable substances and ceramic materials in particulate form.
-This Class does not include, in particular:
--	raw natural resins (Cl. 2), semi-processed resins (Cl. 17);
--	chemical preparations for medical or veterinary purposes (Cl. 5);
--	fungicides, herbicides and preparations for destroying vermin (Cl. 5);
--	adhesives for stationery or household purposes (Cl. 16);
--	salt for preserving foodstuffs (Cl. 30);
--	straw mulch (Cl. 31).
-
-Class 2
-Paints, varnishes, lacquers; preservatives against rust and against deterioration of wood; colorants, dyes; inks for printing, marking and engraving; raw natural resins; metals in foil and powder form for use in painting, decorating, printing and art.
-Explanatory Note
-Class 2 includes mainly paints, colorants and preparations used for protection against corrosion.
-This Class includes, in particular:
--	paints, varnishes and lacquers for industry, handicrafts and arts;
--	thinners, thickeners, fixatives and siccatives for paints, varnishes and lacquers;
--	mordants for wood and leather;
--	anti-rust oils and oils for the preservation of wood;
--	dyestuffs for clothing;
--	colorants for foodstuffs and beverages.
-This Class does not include, in particular:
--	unprocessed artificial resins (Cl. 1), semi-processed resins (Cl. 17);
--	mordants for metals (Cl. 1);
--	laundry blueing and laundry bleaching preparations (Cl. 3);
--	cosmetic dyes (Cl. 3);
--	paint boxes (articles for use in school) (Cl. 16);
--	inks for stationery purposes (Cl. 16);
--	insulating paints and varnishes (Cl. 17).
-
-Class 3
-Non-medicated cosmetics and toiletry preparations; non-medicated dentifrices; perfumery, essential oils; bleaching preparations and other substances for laundry use; cleaning, polishing and abrasive preparations.
-Explanatory Note
-Class 3 includes mainly non-medicated toiletry preparations, as well as cleaning preparations for use in the home and other environments.
-This Class includes, in particular:
--	sanitary preparations being toiletries;
--	tissues impregnated with cosmetic lotions;
--	deodorants for human beings or for animals;
--	room fragrancing preparations;
--	nail art stickers;
--	polishing wax;
--	sandpaper.
-This Class does not include, in particular:
--	ingredients for use in the manufacture of cosmetics, for example, vitamins, preservatives and antioxidants (Cl. 1);
--	degreasing preparations for use in manufacturing processes (Cl. 1);
--	chemical chimney cleaners (Cl. 1);
--	deodorants, other than for human beings or for animals (Cl. 5);
--	medicated shampoos, soaps, lotions and dentifrices (Cl. 5);
--	emery boards, emery files, sharpening stones and grindstones (hand tools) (Cl. 8);
--	cosmetic and cleaning instruments, for example, make-up brushes (Cl. 21), cloths, pads and rags for cleaning (Cl. 21).
-
-Class 4
-Industrial oils and greases, wax; lubricants; dust absorbing, wetting and binding compositions; fuels and illuminants; candles and wicks for lighting.
-Explanatory Note
-Class 4 includes mainly industrial oils and greases, fuels and illuminants.
-This Class includes, in particular:
--	oils for the preservation of masonry or of leather;
--	raw wax, industrial wax;
--	electrical energy;
--	motor fuels, biofuels;
--	non-chemical additives for fuels;
--	wood for use as fuel.
-This Class does not include, in particular:
--	certain special industrial oils and greases, for example, oils for tanning leather (Cl. 1), oils for the preservation of wood, anti-rust oils and greases (Cl. 2), essential oils (Cl. 3);
--	massage candles for cosmetic purposes (Cl. 3) and medicated massage candles (Cl. 5);
--	certain special waxes, for example, grafting wax for trees (Cl. 1), tailors' wax, polishing wax, depilatory wax (Cl. 3), dental wax (Cl. 5), sealing wax (Cl. 16);
--	wicks adapted for oil stoves (Cl. 11) and for cigarette lighters (Cl. 34).
-
-Class 5
-Pharmaceuticals, medical and veterinary preparations; sanitary preparations for medical purposes; dietetic food and substances adapted for medical or veterinary use, food for babies; dietary supplements for human beings and animals; plasters, materials for dressings; material for stopping teeth, dental wax; disinfectants; preparations for destroying vermin; fungicides, herbicides.
-Explanatory Note
-Class 5 includes mainly pharmaceuticals and other preparations for medical or veterinary purposes.
-This Class includes, in particular:
--	sanitary preparations for personal hygiene, other than toiletries;
--	diapers for babies and for incontinence;
--	deodorants, other than for human beings or for animals;
--	medicated shampoos, soaps, lotions and dentifrices;
--	dietary supplements intended to supplement a normal diet or to have health benefits;
--	meal replacements and dietetic food and beverages adapted for medical or veterinary use.
-This Class does not include, in particular:
--	ingredients for use in the manufacture of pharmaceuticals, for example, vitamins, preservatives and antioxidants (Cl. 1);
--	sanitary preparations being non-medicated toiletries (Cl. 3);
--	deodorants for human beings or for animals (Cl. 3);
--	support bandages, orthopaedic bandages (Cl. 10);
--	meal replacements and dietetic food and beverages not specified as being for medical or veterinary use, which should be classified in the appropriate food or beverage classes, for example, low-fat potato crisps (Cl. 29), high-protein cereal bars (Cl. 30), isotonic beverages (Cl. 32).
-
-Class 6
-Common metals and their alloys, ores; metal materials for building and construction; transportable buildings of metal; non-electric cables and wires of common metal; small items of metal hardware; metal containers for storage or transport; safes.
-Explanatory Note
-Class 6 includes mainly unwrought and partly wrought common metals, including ores, as well as certain goods made of common metals.
-This Class includes, in particular:
--	metals in foil or powder form for further processing, for example, for 3D printers;
--	metal building materials, for example, materials of metal for railway tracks, pipes and tubes of metal;
--	small items of metal hardware, for example, bolts, screws, nails, furniture casters, window fasteners;
--	transportable buildings or structures of metal, for example, prefabricated houses, swimming pools, cages for wild animals, skating rinks;
--	certain dispensing apparatus of metal, automatic or non-automatic, for example, towel dispensers, queue ticket dispensers, dispensers for dog waste bags, toilet paper dispensers;
--	certain goods made of common metals not otherwise classified by function or purpose, for example, all-purpose boxes of common metal, statues, busts and works of art of common metal.
-This Class does not include, in particular:
--	metals and ores used as chemicals in industry or scientific research for their chemical properties, for example, bauxite, mercury, antimony, alkaline and alkaline-earth metals (Cl. 1);
--	metals in foil and powder form for use in painting, decorating, printing and art (Cl. 2);
--	certain dispensing apparatus that are classified according to their function or purpose, for example, fluid dispensing machines for industrial use (Cl. 7), ticket dispensing terminals, electronic (Cl. 9), dosage dispensers for medical use (Cl. 10), adhesive tape dispensers (Cl. 16);
--	electric cables (Cl. 9) and non-electric cables and ropes, not of metal (Cl. 22);
--	pipes being parts of sanitary installations (Cl. 11), flexible pipes, tubes and hoses, not of metal (Cl. 17) and rigid pipes, not of metal (Cl. 19);
--	cages for household pets (Cl. 21);
--	certain goods made of common metals that are classified according to their function or purpose, for example, hand tools, hand-operated (Cl. 8), paper clips (Cl. 16), furniture (Cl. 20), kitchen utensils (Cl. 21), household containers (Cl. 21).
-
-Class 7
-Machines, machine tools, power-operated tools; motors and engines, except for land vehicles; machine coupling and transmission components, except for land vehicles; agricultural implements, other than hand-operated hand tools; incubators for eggs; automatic vending machines.
-Explanatory Note
-Class 7 includes mainly machines and machine tools, motors and engines.
-This Class includes, in particular:
--	parts of motors and engines of all kinds, for example, starters, mufflers and cylinders for motors and engines of any type;
--	electric cleaning and polishing apparatus, for example, electric shoe polishers, electric machines and apparatus for carpet shampooing and vacuum cleaners;
--	3D printers;
--	industrial robots;
--	certain special vehicles not for transportation purposes, for example, road sweeping machines, road making machines, bulldozers, snow ploughs, as well as rubber tracks as parts of those vehicles' crawlers.
-This Class does not include, in particular:
--	hand tools and implements, hand-operated (Cl. 8);
--	humanoid robots with artificial intelligence, laboratory robots, teaching robots, security surveillance robots (Cl. 9), surgical robots (Cl. 10), robotic cars (Cl. 12), robotic drums (Cl. 15), toy robots (Cl. 28);
--	motors and engines for land vehicles (Cl. 12);
--	treads for vehicles, as well as tyres for all kinds of vehicle wheels (Cl. 12);
--	certain special machines, for example, automated teller machines (Cl. 9), respirators for artificial respiration (Cl. 10), refrigerating apparatus and machines (Cl. 11).
-
-Class 8
-Hand tools and implements, hand-operated; cutlery; side arms, except firearms; razors.
-Explanatory Note
-Class 8 includes mainly hand-operated tools and implements for performing tasks, such as drilling, shaping, cutting and piercing.
-This Class includes, in particular:
--	hand-operated agricultural, gardening and landscaping tools;
--	hand-operated tools for carpenters, artists and other craftspersons, for example, hammers, chisels and gravers;
--	handles for hand-operated hand tools, such as knives and scythes;
--	electric and non-electric hand implements for personal grooming and body art, for example, razors, implements for hair curling, tattooing, and for manicure and pedicure;
--	hand-operated pumps;
--	table cutlery, such as knives, forks and spoons, including those made of precious metals.
-This Class does not include, in particular:
--	machine tools and implements driven by a motor (Cl. 7);
--	surgical cutlery (Cl. 10);
--	pumps for bicycle tyres (Cl. 12), pumps specially adapted for use with balls for games (Cl. 28);
--	side arms being firearms (Cl. 13);
--	paper knives and paper shredders for office use (Cl. 16);
--	handles for objects that are classified in various classes according to their function or purpose, for example, walking stick handles, umbrella handles (Cl. 18), broom handles (Cl. 21);
--	serving utensils, for example, sugar tongs, ice tongs, pie servers and serving ladles, and kitchen utensils, for example, mixing spoons, pestles and mortars, nutcrackers and spatulas (Cl. 21);
--	fencing weapons (Cl. 28).
-
-Class 9
-Scientific, research, navigation, surveying, photographic, cinematographic, audiovisual, optical, weighing, measuring, signalling, detecting, testing, inspecting, life-saving and teaching apparatus and instruments; apparatus and instruments for conducting, switching, transforming, accumulating, regulating or controlling the distribution or use of electricity; apparatus and instruments for recording, transmitting, reproducing or processing sound, images or data; recorded and downloadable media, computer software, blank digital or analogue recording and storage media; mechanisms for coin-operated apparatus; cash registers, calculating devices; computers and computer peripheral devices; diving suits, divers' masks, ear plugs for divers, nose clips for divers and swimmers, gloves for divers, breathing apparatus for underwater swimming; fire-extinguishing apparatus.
-Explanatory Note
-Class 9 includes mainly apparatus and instruments for scientific or research purposes, audiovisual and information technology equipment, as well as safety and life-saving equipment.
-This Class includes, in particular:
--	apparatus and instruments for scientific research in laboratories;
--	training apparatus and simulators, for example, resuscitation mannequins, simulators for the steering and control of vehicles;
--	apparatus and instruments for controlling and monitoring aircraft, watercraft and unmanned vehicles, for example, navigational instruments, transmitters, compasses for measuring, GPS apparatus, automatic steering apparatus for vehicles;
--	safety and security apparatus and instruments, for example, safety nets, signalling lights, traffic-light apparatus, fire engines, sound alarms, security token hardware for user authentication;
--	clothing that protects against serious or life-threatening injuries, for example, clothing for protection against accidents, irradiation and fire, bullet-proof clothing, protective helmets, head guards for sports, mouth guards for sports, protective suits for aviators, knee-pads for workers;
--	optical apparatus and instruments, for example, eyeglasses, contact lenses, magnifying glasses, mirrors for inspecting work, peepholes;
--	magnets;
--	smartwatches, wearable activity trackers;
--	joysticks for use with computers, other than for video games, virtual reality headsets, smartglasses;
--	eyeglass cases, cases for smartphones, cases especially made for photographic apparatus and instruments;
--	automated teller machines, invoicing machines, material testing instruments and machines;
--	batteries and chargers for electronic cigarettes;
--	electric and electronic effects units for musical instruments;
--	laboratory robots, teaching robots, security surveillance robots, humanoid robots with artificial intelligence.
-This Class does not include, in particular:
--	joysticks being parts of machines, other than for game machines (Cl. 7), vehicle joysticks (Cl. 12), joysticks for video games, controllers for toys and game consoles (Cl. 28);
--	coin-operated apparatus that are classified in various classes according to their function or purpose, for example, coin-operated washing machines (Cl. 7), coin-operated billiard tables (Cl. 28);
--	industrial robots (Cl. 7), surgical robots (Cl. 10), toy robots (Cl. 28);
--	pulse meters, heart rate monitoring apparatus, body composition monitors (Cl. 10);
--	laboratory lamps, laboratory burners (Cl. 11);
--	diving lights (Cl. 11);
--	smart products whose main function remains the same, for example, smart refrigerators (Cl. 11), smart suitcases (Cl. 18), smart clothing (Cl. 25), smart toys (Cl. 28);
--	explosive fog signals, signal rocket flares (Cl. 13);
--	histological sections for teaching purposes, biological samples for use in microscopy as teaching materials (Cl. 16);
--	clothing and equipment worn for the practice of certain sports, for example, protective paddings being parts of sports suits, fencing masks, boxing gloves (Cl. 28).
-
-Class 10
-Surgical, medical, dental and veterinary apparatus and instruments; artificial limbs, eyes and teeth; orthopaedic articles; suture materials; therapeutic and assistive devices adapted for persons with disabilities; massage apparatus; apparatus, devices and articles for nursing infants; sexual activity apparatus, devices and articles.
-Explanatory Note
-Class 10 includes mainly surgical, medical, dental and veterinary apparatus, instruments and articles generally used for the diagnosis, treatment or improvement of function or condition of persons and animals.
-This Class includes, in particular:
--	support bandages, orthopaedic bandages;
--	special clothing for medical purposes, for example, compression garments, stockings for varices, strait jackets, orthopaedic footwear;
--	articles, instruments and devices for menstruation, contraception and childbirth, for example, menstrual cups, pessaries, condoms, childbirth mattresses, forceps;
--	therapeutic and prosthetic articles and devices for implantation made of artificial or synthetic materials, for example, surgical implants comprised of artificial materials, artificial breasts, brain pacemakers, biodegradable bone fixation implants;
--	furniture especially made for medical purposes, for example, armchairs for medical or dental purposes, air mattresses for medical purposes, operating tables.
-This Class does not include, in particular:
--	medical dressings and absorbent sanitary articles, for example, plasters, bandages and gauze for dressings, breast-nursing pads, diapers for babies and for incontinence, tampons (Cl. 5);
--	surgical implants comprised of living tissue (Cl. 5);
--	tobacco-free cigarettes for medical purposes (Cl. 5) and electronic cigarettes (Cl. 34);
--	wheelchairs and mobility scooters (Cl. 12);
--	massage tables, nursing pillows (Cl. 20).
-
-Class 11
-Apparatus and installations for lighting, heating, cooling, steam generating, cooking, drying, ventilating, water supply and sanitary purposes.
-Explanatory Note
-Class 11 includes mainly environmental control apparatus and installations, in particular, for the purposes of lighting, cooking, cooling and sanitizing.
-This Class includes, in particular:
--	air-conditioning apparatus and installations;
--	ovens, other than for laboratory use, for example, dental ovens, microwave ovens, bakers' ovens;
--	stoves being heating apparatus;
--	solar thermal collectors;
--	chimney flues, chimney blowers, hearths, domestic fireplaces;
--	sterilizers, incinerators;
--	lighting apparatus and installations, for example, luminous tubes for lighting, searchlights, luminous house numbers, vehicle reflectors, lights for vehicles;
--	lamps, for example, electric lamps, gas lamps, laboratory lamps, oil lamps, street lamps, safety lamps;
--	tanning beds;
--	bath installations, bath fittings, bath plumbing fixtures;
--	toilets, urinals;
--	fountains, chocolate fountains;
--	electrically heated pads, cushions and blankets, not for medical purposes;
--	hot water bottles;
--	electrically heated clothing;
--	electric appliances for making yogurt, bread-making machines, coffee machines, ice-cream making machines;
--	ice machines and apparatus.
-This Class does not include, in particular:
--	steam producing apparatus being parts of machines (Cl. 7);
--	air condensers (Cl. 7);
--	current generators, generators of electricity (Cl. 7);
--	soldering lamps (Cl. 7), optical lamps, darkroom lamps (Cl. 9), lamps for medical purposes (Cl. 10);
--	ovens for laboratory use (Cl. 9);
--	photovoltaic cells (Cl. 9);
--	signalling lights (Cl. 9);
--	electrically heated pads, cushions and blankets, for medical purposes (Cl. 10);
--	portable baby baths (Cl. 21);
--	non-electric portable coolers (Cl. 21);
--	cooking utensils that do not have an integrated heat source, for example, non-electric griddles and grills, non-electric waffle irons, non-electric pressure cookers (Cl. 21);
--	footmuffs, not electrically heated (Cl. 25).
-
-Class 12
-Vehicles; apparatus for locomotion by land, air or water.
-Explanatory Note
-Class 12 includes mainly vehicles and apparatus for the transport of people or goods by land, air or water.
-This Class includes, in particular:
--	motors and engines for land vehicles;
--	couplings and transmission components for land vehicles;
--	air cushion vehicles;
--	remote control vehicles, other than toys;
--	parts of vehicles, for example, bumpers, windscreens, steering wheels;
--	treads for vehicles, as well as tyres for all kinds of vehicle wheels.
-This Class does not include, in particular:
--	railway material of metal (Cl. 6);
--	motors, engines, couplings and transmission components, other than for land vehicles (Cl. 7);
--	parts of all kinds of motors and engines, for example, starters, mufflers and cylinders for motors and engines (Cl. 7);
--	rubber tracks being parts of crawlers on construction, mining, agricultural and other heavy-duty machines (Cl. 7);
--	tricycles for infants and scooters, being toys (Cl. 28);
--	certain special vehicles or wheeled apparatus not for transportation purposes, for example, self-propelled road sweeping machines (Cl. 7), fire engines (Cl. 9), tea carts (Cl. 20);
--	certain parts of vehicles, for example, electric batteries, mileage recorders and radios for vehicles (Cl. 9), lights for automobiles and bicycles (Cl. 11), automobile carpets (Cl. 27).
-
-Class 13
-Firearms; ammunition and projectiles; explosives; fireworks.
-Explanatory Note
-Class 13 includes mainly firearms and pyrotechnic products.
-This Class includes, in particular:
--	rescue flares, explosive or pyrotechnic;
--	flare pistols;
--	sprays for personal defence purposes;
--	explosive fog signals, signal rocket flares;
--	air pistols being weapons;
--	bandoliers for weapons;
--	sporting firearms, hunting firearms.
-This Class does not include, in particular:
--	grease for weapons (Cl. 4);
--	blades being weapons (Cl. 8);
--	side arms, other than firearms (Cl. 8);
--	non-explosive fog signals, rescue laser signalling flares (Cl. 9);
--	telescopic sights for firearms (Cl. 9);
--	flaming torches (Cl. 11);
--	Christmas crackers (Cl. 28);
--	percussion caps being toys (Cl. 28);
--	toy air pistols (Cl. 28);
--	matches (Cl. 34).
-
-Class 14
-Precious metals and their alloys; jewellery, precious and semi-precious stones; horological and chronometric instruments.
-Explanatory Note
-Class 14 includes mainly precious metals and certain goods made of precious metals or coated therewith, as well as jewellery, clocks and watches, and component parts therefor.
-This Class includes, in particular:
--	jewellery, including imitation jewellery, for example, paste jewellery;
--	cuff links, tie pins, tie clips;
--	key rings, key chains and charms therefor;
--	jewellery charms;
--	jewellery boxes;
--	component parts for jewellery, clocks and watches, for example, clasps and beads for jewellery, movements for clocks and watches, clock hands, watch springs, watch crystals.
-This Class does not include, in particular:
--	smartwatches (Cl. 9);
--	charms, other than for jewellery, key rings or key chains (Cl. 26);
--	objects of art not made of precious metals or coated therewith that are classified according to the material of which they are made, for example, works of art of metal (Cl. 6), of stone, concrete or marble (Cl. 19), of wood, wax, plaster or plastic (Cl. 20), of porcelain, ceramic, earthenware, terra-cotta or glass (Cl. 21);
--	certain goods made of precious metals or coated therewith that are classified according to their function or purpose, for example, metals in foil and powder form for use in painting, decorating, printing and art (Cl. 2), dental amalgams of gold (Cl. 5), cutlery (Cl. 8), electric contacts (Cl. 9), pen nibs of gold (Cl. 16), teapots (Cl. 21), gold and silver embroidery (Cl. 26), cigar boxes (Cl. 34).
-
-Class 15
-Musical instruments; music stands and stands for musical instruments; conductors' batons.
-Explanatory Note
-Class 15 includes mainly musical instruments, their parts and their accessories.
-This Class includes, in particular:
--	mechanical musical instruments and their accessories, for example, barrel organs, mechanical pianos, intensity regulators for mechanical pianos, robotic drums;
--	musical boxes;
--	electrical and electronic musical instruments;
--	strings, reeds, pegs and pedals for musical instruments;
--	tuning forks, tuning hammers;
--	colophony (rosin) for stringed musical instruments.
-This Class does not include, in particular:
--	apparatus for the recording, transmission, amplification and reproduction of sound, for example, electric and electronic effects units for musical instruments, wah-wah pedals, audio interfaces, audio mixers, equalisers being audio apparatus, subwoofers (Cl. 9);
--	downloadable music files (Cl. 9);
--	downloadable electronic sheet music (Cl. 9), printed sheet music (Cl. 16);
--	juke boxes, musical (Cl. 9);
--	metronomes (Cl. 9);
--	musical greeting cards (Cl. 16).
-
-Class 16
-Paper and cardboard; printed matter; bookbinding material; photographs; stationery and office requisites, except furniture; adhesives for stationery or household purposes; drawing materials and materials for artists; paintbrushes; instructional and teaching materials; plastic sheets, films and bags for wrapping and packaging; printers' type, printing blocks.
-Explanatory Note
-Class 16 includes mainly paper, cardboard and certain goods made of those materials, as well as office requisites.
-This Class includes, in particular:
--	paper knives and paper cutters;
--	cases, covers and devices for holding or securing paper, for example, document files, money clips, holders for cheque books, paper-clips, passport holders, scrapbooks;
--	certain office machines, for example, typewriters, duplicators, franking machines for office use, pencil sharpeners;
--	painting articles for use by artists and interior and exterior painters, for example, artists' watercolour saucers, painters' easels and palettes, paint rollers and trays;
--	certain disposable paper products, for example, bibs, handkerchiefs and table linen of paper;
--	certain goods made of paper or cardboard not otherwise classified by function or purpose, for example, paper bags, envelopes and containers for packaging, statues, figurines and works of art of paper or cardboard, such as figurines of papier mâché, framed or unframed lithographs, paintings and watercolours.
-This Class does not include, in particular:
--	paints (Cl. 2);
--	hand tools for artists, for example, spatulas, sculptors' chisels (Cl. 8);
--	teaching apparatus, for example, audiovisual teaching apparatus, resuscitation mannequins (Cl. 9), and toy models (Cl. 28);
--	certain goods made of paper or cardboard that are classified according to their function or purpose, for example, photographic paper (Cl. 1), abrasive paper (Cl. 3), paper blinds (Cl. 20), table cups and plates of paper (Cl. 21), bed linen of paper (Cl. 24), paper clothing (Cl. 25), cigarette paper (Cl. 34).
-
-Class 17
-Unprocessed and semi-processed rubber, gutta-percha, gum, asbestos, mica and substitutes for all these materials; plastics and resins in extruded form for use in manufacture; packing, stopping and insulating materials; flexible pipes, tubes and hoses, not of metal.
-Explanatory Note
-Class 17 includes mainly electrical, thermal and acoustic insulating materials and plastics for use in manufacture in the form of sheets, blocks and rods, as well as certain goods made of rubber, gutta-percha, gum, asbestos, mica or substitutes therefor.
-This Class includes, in particular:
--	rubber material for recapping tyres;
--	floating anti-pollution barriers;
--	adhesive tapes, other than stationery and not for medical or household purposes;
--	plastic films, other than for wrapping and packaging, for example, anti-dazzle films for windows;
--	elastic threads and threads of rubber or plastic, not for textile use;
--	certain goods made of the materials in this class not otherwise classified by function or purpose, for example, foam supports for flower arrangements, padding and stuffing materials of rubber or plastics, rubber stoppers, shock-absorbing buffers of rubber, rubber bags or envelopes for packaging.
-This Class does not include, in particular:
--	fire hose (Cl. 9);
--	pipes being parts of sanitary installations (Cl. 11) and rigid pipes of metal (Cl. 6) and not of metal (Cl. 19);
--	insulating glass for building (Cl. 19);
--	certain goods made of the materials in this class that are classified according to their function or purpose, for example, gum resins (Cl. 2), rubber for dental purposes (Cl. 5), asbestos screens for firefighters (Cl. 9), adhesive rubber patches for repairing inner tubes (Cl. 12), erasers (Cl. 16).
-
-Class 18
-Leather and imitations of leather; animal skins and hides; luggage and carrying bags; umbrellas and parasols; walking sticks; whips, harness and saddlery; collars, leashes and clothing for animals.
-Explanatory Note
-Class 18 includes mainly leather, imitations of leather and certain goods made of those materials.
-This Class includes, in particular:
--	luggage and carrying bags, for example, suitcases, trunks, travelling bags, sling bags for carrying infants, school bags;
--	luggage or baggage tags;
--	business card cases and pocket wallets;
--	boxes and cases of leather or leatherboard.
-This Class does not include, in particular:
--	walking sticks or canes for medical purposes (Cl. 10);
--	clothing, footwear and headwear of leather for human beings (Cl. 25);
--	bags and cases adapted to the product they are intended to contain, for example, bags adapted for laptops (Cl. 9), bags and cases for cameras and photographic equipment (Cl. 9), cases for musical instruments (Cl. 15), golf bags with or without wheels, bags especially designed for skis and surfboards (Cl. 28);
--	certain goods made of leather, imitations of leather, animal skins and hides that are classified according to their function or purpose, for example, leather strops (Cl. 8), polishing leather (Cl. 21), chamois leather for cleaning (Cl. 21), leather belts for clothing (Cl. 25).
-
-Class 19
-Materials, not of metal, for building and construction; rigid pipes, not of metal, for building; asphalt, pitch, tar and bitumen; transportable buildings, not of metal; monuments, not of metal.
-Explanatory Note
-Class 19 includes mainly materials, not of metal, for building and construction.
-This Class includes, in particular:
--	semi-worked woods for use in building, for example, beams, planks, panels;
--	wood veneers;
--	building glass, for example, glass tiles, insulating glass for building, safety glass;
--	glass granules for marking out roads;
--	granite, marble, gravel;
--	terra-cotta for use as a building material;
--	roofing, not of metal, incorporating photovoltaic cells;
--	gravestones and tombs, not of metal;
--	statues, busts and works of art of stone, concrete or marble;
--	letter boxes of masonry;
--	geotextiles;
--	coatings being building materials;
--	scaffolding, not of metal;
--	transportable buildings or structures, not of metal, for example, aquaria, aviaries, flagpoles, porches, swimming pools.
-This Class does not include, in particular:
--	cement preservatives, cement-waterproofing preparations (Cl. 1);
--	fireproofing preparations (Cl. 1);
--	wood preservatives (Cl. 2);
--	oils for releasing form work for building (Cl. 4);
--	letter boxes of metal (Cl. 6) and not of metal or masonry (Cl. 20);
--	statues, busts and works of art of common metal (Cl. 6), of precious metal (Cl. 14), of wood, wax, plaster or plastic (Cl. 20), of porcelain, ceramic, earthenware, terra-cotta or glass (Cl. 21);
--	certain pipes, not of metal, not for building, for example, pipes being parts of sanitary installations (Cl. 11), flexible pipes, tubes and hoses, not of metal (Cl. 17);
--	substances for insulating buildings against moisture (Cl. 17);
--	glass for vehicle windows (semi-finished product) (Cl. 21);
--	birdcages (Cl. 21);
--	mats and matting, linoleum and other materials for covering existing floors (Cl. 27);
--	unsawn or undressed timber (Cl. 31).
-
-Class 20
-Furniture, mirrors, picture frames; containers, not of metal, for storage or transport; unworked or semi-worked bone, horn, whalebone or mother-of-pearl; shells; meerschaum; yellow amber.
-Explanatory Note
-Class 20 includes mainly furniture and parts therefor, as well as certain goods made of wood, cork, reed, cane, wicker, horn, bone, whalebone, shell, amber, mother-of-pearl, meerschaum and substitutes for all these materials, or of plastic.
-This Class includes, in particular:
--	metal furniture, furniture for camping, gun racks, newspaper display stands;
--	indoor window blinds and shades;
--	bedding, for example, mattresses, bed bases, pillows;
--	looking glasses, furniture and toilet mirrors;
--	registration plates, not of metal;
--	small items of hardware, not of metal, for example, bolts, screws, dowels, furniture casters, collars for fastening pipes;
--	letter boxes, not of metal or masonry;
--	certain dispensing apparatus, not of metal, automatic or non-automatic, for example, towel dispensers, queue ticket dispensers, dispensers for dog waste bags, toilet paper dispensers.
-This Class does not include, in particular:
--	special furniture for laboratories (Cl. 9) or for medical use (Cl. 10);
--	outdoor blinds of metal (Cl. 6), not of metal and not of textile (Cl. 19), of textile (Cl. 22);
--	bed linen, eiderdowns and sleeping bags (Cl. 24);
--	certain dispensing apparatus that are classified according to their function or purpose, for example, fluid dispensing machines for industrial use (Cl. 7), ticket dispensing terminals, electronic (Cl. 9), dosage dispensers for medical use (Cl. 10), adhesive tape dispensers (Cl. 16);
--	certain mirrors for specific uses, for example, mirrors used in optical goods (Cl. 9), mirrors used in surgery or dentistry (Cl. 10), rearview mirrors (Cl. 12), sighting mirrors for guns (Cl. 13);
--	certain goods made of wood, cork, reed, cane, wicker, horn, bone, whalebone, shell, amber, mother-of-pearl, meerschaum and substitutes for all these materials, or of plastic, that are classified according to their function or purpose, for example, beads for making jewellery (Cl. 14), wooden floor boards (Cl. 19), baskets for domestic use (Cl. 21), plastic cups (Cl. 21), reed mats (Cl. 27).
-
-Class 21
-Household or kitchen utensils and containers; cookware and tableware, except forks, knives and spoons; combs and sponges; brushes, except paintbrushes; brush-making materials; articles for cleaning purposes; unworked or semi-worked glass, except building glass; glassware, porcelain and earthenware.
-Explanatory Note
-Class 21 includes mainly small, hand-operated utensils and apparatus for household and kitchen use, as well as cosmetic utensils, glassware and certain goods made of porcelain, ceramic, earthenware, terra-cotta or glass.
-This Class includes, in particular:
--	household and kitchen utensils, for example, fly swatters, clothes-pegs, mixing spoons, basting spoons and corkscrews, as well as serving utensils, for example, sugar tongs, ice tongs, pie servers and serving ladles;
--	household, kitchen and cooking containers, for example, vases, bottles, piggy banks, pails, cocktail shakers, and non-electric kettles, pressure cookers, cooking pots and pans;
--	small hand-operated kitchen apparatus for mincing, grinding, pressing or crushing, for example, garlic presses, nutcrackers, pestles and mortars;
--	dish stands and decanter stands;
--	cosmetic utensils, for example, electric and non-electric combs and toothbrushes, dental floss, foam toe separators for use in pedicures, powder puffs, fitted vanity cases;
--	gardening articles, for example, gardening gloves, window-boxes, watering cans and nozzles for watering hose;
--	indoor aquaria, terrariums and vivariums.
-This Class does not include, in particular:
--	cleaning preparations (Cl. 3);
--	containers for storage and transport of goods, of metal (Cl. 6), not of metal (Cl. 20);
--	small apparatus for mincing, grinding, pressing or crushing, which are driven by electricity (Cl. 7);
--	razors and shaving apparatus, hair and nail clippers, electric and non-electric implements for manicure and pedicure, for example, manicure sets, emery boards, cuticle nippers (Cl. 8);
--	table cutlery (Cl. 8) and hand-operated cutting tools for kitchen use, for example, vegetable shredders, pizza cutters, cheese slicers (Cl. 8);
--	lice combs, tongue scrapers (Cl. 10);
--	cooking utensils, electric (Cl. 11);
--	toilet mirrors (Cl. 20);
--	certain goods made of glass, porcelain and earthenware that are classified according to their function or purpose, for example, porcelain for dental prostheses (Cl. 5), spectacle lenses (Cl. 9), glass wool for insulation, acrylic or organic glass, semi-processed (Cl. 17), earthenware tiles (Cl. 19), building glass (Cl. 19), glass fibres for textile use (Cl. 22).
-
-Class 22
-Ropes and string; nets; tents and tarpaulins; awnings of textile or synthetic materials; sails; sacks for the transport and storage of materials in bulk; padding, cushioning and stuffing materials, except of paper, cardboard, rubber or plastics; raw fibrous textile materials and substitutes therefor.
-Explanatory Note
-Class 22 includes mainly canvas and other materials for making sails, rope, padding, cushioning and stuffing materials and raw fibrous textile materials.
-This Class includes, in particular:
--	cords and twines made of natural or artificial textile fibres, paper or plastics;
--	commercial fishing nets, hammocks, rope ladders;
--	vehicle covers, not fitted;
--	certain sacks and bags not otherwise classified by function or purpose, for example, mesh bags for washing laundry, body bags, mail bags;
--	packaging bags of textile;
--	animal fibres and raw textile fibres, for example, animal hair, cocoons, jute, raw or treated wool, raw silk.
-This Class does not include, in particular:
--	metal ropes (Cl. 6);
--	strings for musical instruments (Cl. 15) and for sports rackets (Cl. 28);
--	padding and stuffing materials of paper or cardboard (Cl. 16), rubber or plastics (Cl. 17);
--	certain nets and bags that are classified according to their function or purpose, for example, safety nets (Cl. 9), luggage nets for vehicles (Cl. 12), garment bags for travel (Cl. 18), hair nets (Cl. 26), golf bags (Cl. 28), nets for sports (Cl. 28);
--	packaging bags, not of textile, which are classified according to the material of which they are made, for example, packaging bags of paper or plastics (Cl. 16), of rubber (Cl. 17), of leather (Cl. 18).
-
-Class 23
-Yarns and threads for textile use.
-Explanatory Note
-Class 23 includes mainly natural or synthetic yarns and threads for textile use.
-This Class includes, in particular:
--	fibreglass, elastic, rubber and plastic threads for textile use;
--	threads for embroidery, darning and sewing, including those of metal;
--	spun silk, spun cotton, spun wool.
-This Class does not include, in particular:
--	certain threads for specific uses, for example, identification threads for electric wires (Cl. 9), surgical thread (Cl. 10), threads of precious metal being jewellery (Cl. 14);
--	threads, other than for textile use, that are classified according to the material of which they are made, for example, threads for binding of metal (Cl. 6) and not of metal (Cl. 22), elastic threads, threads of rubber or plastic (Cl. 17), fibreglass threads (Cl. 21).
-
-Class 24
-Textiles and substitutes for textiles; household linen; curtains of textile or plastic.
-Explanatory Note
-Class 24 includes mainly fabrics and fabric covers for household use.
-This Class includes, in particular:
--	household linen, for example, bedspreads, pillow shams, towels of textile;
--	bed linen of paper;
--	sleeping bags, sleeping bag liners;
--	mosquito nets.
-This Class does not include, in particular:
--	electrically heated blankets, for medical purposes (Cl. 10) and not for medical purposes (Cl. 11);
--	table linen of paper (Cl. 16);
--	asbestos safety curtains (Cl. 17), bamboo curtains and bead curtains for decoration (Cl. 20);
--	horse blankets (Cl. 18);
--	certain textiles and fabrics for specific uses, for example, fabrics for bookbinding (Cl. 16), insulating fabrics (Cl. 17), geotextiles (Cl. 19).
-
-Class 25
-Clothing, footwear, headwear.
-Explanatory Note
-Class 25 includes mainly clothing, footwear and headwear for human beings.
-This Class includes, in particular:
--	parts of clothing, footwear and headwear, for example, cuffs, pockets, ready-made linings, heels and heelpieces, cap peaks, hat frames (skeletons);
--	clothing and footwear for sports, for example, ski gloves, sports singlets, cyclists' clothing, judo and karate uniforms, football shoes, gymnastic shoes, ski boots;
--	masquerade costumes;
--	paper clothing, paper hats for use as clothing;
--	bibs, not of paper;
--	pocket squares;
--	footmuffs, not electrically heated.
-This Class does not include, in particular:
--	small items of hardware used in shoemaking, for example, shoe pegs and shoe dowels of metal (Cl. 6) and not of metal (Cl. 20), as well as haberdashery accessories and fastenings for clothing, footwear and headwear, for example, clasps, buckles, zippers, ribbons, hatbands, hat and shoe trimmings (Cl. 26);
--	certain clothing, footwear and headwear for special use, for example, protective helmets, including for sports (Cl. 9), clothing for protection against fire (Cl. 9), clothing especially for operating rooms (Cl. 10), orthopaedic footwear (Cl. 10), as well as clothing and footwear that are essential for the practice of certain sports, for example, baseball gloves, boxing gloves, ice skates (Cl. 28);
--	electrically heated clothing (Cl. 11);
--	electrically heated footmuffs (Cl. 11), fitted footmuffs for pushchairs and prams (Cl. 12);
--	bibs of paper (Cl. 16);
--	handkerchiefs of paper (Cl. 16) and of textile (Cl. 24);
--	clothing for animals (Cl. 18);
--	carnival masks (Cl. 28);
--	dolls' clothes (Cl. 28);
--	paper party hats (Cl. 28).
-
-Class 26
-Lace, braid and embroidery, and haberdashery ribbons and bows; buttons, hooks and eyes, pins and needles; artificial flowers; hair decorations; false hair.
-Explanatory Note
-Class 26 includes mainly dressmakers' articles, natural or synthetic hair for wear, and hair adornments, as well as small decorative items intended to adorn a variety of objects, not included in other classes.
-This Class includes, in particular:
--	wigs, toupees, false beards;
--	barrettes, hair bands;
--	ribbons and bows being haberdashery or used as hair decorations, made of any material;
--	ribbons and bows for gift wrapping, not of paper;
--	hair nets;
--	buckles, zippers;
--	charms, other than for jewellery, key rings or key chains;
--	artificial Christmas garlands and wreaths, including those incorporating lights;
--	certain articles for curling hair, for example, electric and non-electric hair curlers, other than hand implements, hair curling pins, hair curling paper.
-This Class does not include, in particular:
--	false eyelashes (Cl. 3);
--	hooks being small items of metal hardware (Cl. 6) or hardware, not of metal (Cl. 20), curtain hooks (Cl. 20);
--	certain special types of needles, for example, tattoo needles (Cl. 8), needles for surveying compasses (Cl. 9), needles for medical purposes (Cl. 10), needles for pumps for inflating balls for games (Cl. 28);
--	hand implements for curling hair, for example, curling tongs, eyelash curlers (Cl. 8);
--	hair prostheses (Cl. 10);
--	jewellery charms, charms for key rings or key chains (Cl. 14);
--	certain ribbons and bows, for example, paper ribbons and bows, other than haberdashery or hair decorations (Cl. 16), rhythmic gymnastics ribbons (Cl. 28);
--	yarns and threads for textile use (Cl. 23);
--	Christmas trees of synthetic material (Cl. 28).
-
-Class 27
-Carpets, rugs, mats and matting, linoleum and other materials for covering existing floors; wall hangings, not of textile.
-Explanatory Note
-Class 27 includes mainly products intended to be added as coverings to previously constructed floors and walls.
-This Class includes, in particular:
--	automobile carpets;
--	mats being floor coverings, for example, bath mats, door mats, gymnastic mats, yoga mats;
--	artificial turf;
--	wallpaper, including textile wallpaper.
-This Class does not include, in particular:
--	floors, floorings and floor tiles of metal (Cl. 6) and not of metal (Cl. 19), wooden floor boards (Cl. 19);
--	electrically heated carpets (Cl. 11);
--	geotextiles (Cl. 19);
--	mats for infant playpens (Cl. 20);
--	wall hangings of textile (Cl. 24).
-
-Class 28
-Games, toys and playthings; video game apparatus; gymnastic and sporting articles; decorations for Christmas trees.
-Explanatory Note
-Class 28 includes mainly toys, apparatus for playing games, sports equipment, amusement and novelty items, as well as certain articles for Christmas trees.
-This Class includes, in particular:
--	amusement and game apparatus, including controllers therefor;
--	novelty toys for playing jokes and for parties, for example, carnival masks, paper party hats, confetti, party poppers and Christmas crackers;
--	hunting and fishing tackle, for example, fishing rods, landing nets for anglers, decoys, hunting game calls;
--	equipment for various sports and games.
-This Class does not include, in particular:
--	Christmas tree candles (Cl. 4), electric lights for Christmas trees (Cl. 11), confectionery and chocolate decorations for Christmas trees (Cl. 30);
--	diving equipment (Cl. 9);
--	sex toys and love dolls (Cl. 10);
--	clothing for gymnastics and sports (Cl. 25);
--	certain gymnastic and sporting articles, for example, protective helmets, goggles and mouthguards for sports (Cl. 9), sporting firearms (Cl. 13), gymnasium mats (Cl. 27), as well as certain fishing and hunting equipment, for example, hunting knives, harpoons (Cl. 8), hunting firearms (Cl. 13), commercial fishing nets (Cl. 22), that are classified according to other functions or purposes.
-
-Class 29
-Meat, fish, poultry and game; meat extracts; preserved, frozen, dried and cooked fruits and vegetables; jellies, jams, compotes; eggs; milk, cheese, butter, yogurt and other milk products; oils and fats for food.
-Explanatory Note
-Class 29 includes mainly foodstuffs of animal origin, as well as vegetables and other horticultural comestible products which are prepared or preserved for consumption.
-This Class includes, in particular:
--	meat-, fish-, fruit- or vegetable-based food;
--	edible insects;
--	milk beverages with milk predominating;
--	milk substitutes, for example, almond milk, coconut milk, peanut milk, rice milk, soya milk;
--	preserved mushrooms;
--	pulses and nuts prepared for human consumption;
--	seeds prepared for human consumption, not being seasonings or flavourings.
-This Class does not include, in particular:
--	oils and fats, other than for food, for example, essential oils (Cl. 3), industrial oil (Cl. 4), castor oil for medical purposes (Cl. 5);
--	baby food (Cl. 5);
--	dietetic food and substances adapted for medical use (Cl. 5);
--	dietary supplements (Cl. 5);
--	salad dressings (Cl. 30);
--	processed seeds for use as a seasoning (Cl. 30);
--	chocolate-coated nuts (Cl. 30);
--	fresh and unprocessed fruits, vegetables, nuts and seeds (Cl. 31);
--	foodstuffs for animals (Cl. 31);
--	live animals (Cl. 31);
--	seeds for planting (Cl. 31).
-
-Class 30
-Coffee, tea, cocoa and substitutes therefor; rice, pasta and noodles; tapioca and sago; flour and preparations made from cereals; bread, pastries and confectionery; chocolate; ice cream, sorbets and other edible ices; sugar, honey, treacle; yeast, baking-powder; salt, seasonings, spices, preserved herbs; vinegar, sauces and other condiments; ice (frozen water).
-Explanatory Note
-Class 30 includes mainly foodstuffs of plant origin, except fruits and vegetables, prepared or preserved for consumption, as well as auxiliaries intended for the improvement of the flavour of food.
-This Class includes, in particular:
--	beverages with coffee, cocoa, chocolate or tea base;
--	cereals prepared for human consumption, for example, oat flakes, corn chips, husked barley, bulgur, muesli;
--	pizza, pies, sandwiches;
--	chocolate-coated nuts;
--	flavourings, other than essential oils, for food or beverages.
-This Class does not include, in particular:
--	salt for industrial purposes (Cl. 1);
--	food or beverage flavourings being essential oils (Cl. 3);
--	medicinal teas and dietetic food and substances adapted for medical use (Cl. 5);
--	baby food (Cl. 5);
--	dietary supplements (Cl. 5);
--	yeast for pharmaceutical purposes (Cl. 5), yeast for animal consumption (Cl. 31);
--	milk beverages flavoured with coffee, cocoa, chocolate or tea (Cl. 29);
--	soups, bouillon (Cl. 29);
--	raw cereals (Cl. 31);
--	fresh herbs (Cl. 31);
--	foodstuffs for animals (Cl. 31).
-
-Class 31
-Raw and unprocessed agricultural, aquacultural, horticultural and forestry products; raw and unprocessed grains and seeds; fresh fruits and vegetables, fresh herbs; natural plants and flowers; bulbs, seedlings and seeds for planting; live animals; foodstuffs and beverages for animals; malt.
-Explanatory Note
-Class 31 includes mainly land and sea products not having been subjected to any form of preparation for consumption, live animals and plants, as well as foodstuffs for animals.
-This Class includes, in particular:
--	unprocessed cereals;
--	fresh fruits and vegetables, even after washing or waxing;
--	plant residue;
--	unprocessed algae;
--	unsawn timber;
--	fertilised eggs for hatching;
--	fresh mushrooms and truffles;
--	litter for animals, for example, aromatic sand, sanded paper for pets.
-This Class does not include, in particular:
--	cultures of micro-organisms and leeches for medical purposes (Cl. 5);
--	dietary supplements for animals and medicated animal feed (Cl. 5);
--	semi-worked woods (Cl. 19);
--	artificial fishing bait (Cl. 28);
--	rice (Cl. 30);
--	tobacco (Cl. 34).
-
-Class 32
-Beers; non-alcoholic beverages; mineral and aerated waters; fruit beverages and fruit juices; syrups and other preparations for making non-alcoholic beverages.
-Explanatory Note
-Class 32 includes mainly non-alcoholic beverages, as well as beer.
-This Class includes, in particular:
--	de-alcoholised beverages;
--	soft drinks;
--	rice-based and soya-based beverages, other than milk substitutes;
--	energy drinks, isotonic beverages, protein-enriched sports beverages;
--	non-alcoholic essences and fruit extracts for making beverages.
-This Class does not include, in particular:
--	flavourings for beverages being essential oils (Cl. 3) or other than essential oils (Cl. 30);
--	dietetic beverages adapted for medical purposes (Cl. 5);
--	milk beverages with milk predominating, milk shakes (Cl. 29);
--	milk substitutes, for example, almond milk, coconut milk, peanut milk, rice milk, soya milk (Cl. 29);
--	lemon juice for culinary purposes, tomato juice for cooking (Cl. 29);
--	beverages with coffee, cocoa, chocolate or tea base (Cl. 30);
--	beverages for pets (Cl. 31);
--	alcoholic beverages, except beer (Cl. 33).
-
-Class 33
-Alcoholic beverages, except beers; alcoholic preparations for making beverages.
-Explanatory Note
-Class 33 includes mainly alcoholic beverages, essences and extracts.
-This Class includes, in particular:
--	wines, fortified wines;
--	alcoholic cider, perry;
--	spirits, liqueurs;
--	alcoholic essences, alcoholic fruit extracts, bitters.
-This Class does not include, in particular:
--	medicinal beverages (Cl. 5);
--	de-alcoholised beverages (Cl. 32);
--	beers (Cl. 32);
--	non-alcoholic mixers used to make alcoholic beverages, for example, soft drinks, soda water (Cl. 32).
-
-Class 34
-Tobacco and tobacco substitutes; cigarettes and cigars; electronic cigarettes and oral vaporizers for smokers; smokers' articles; matches.
-Explanatory Note
-Class 34 includes mainly tobacco and articles used for smoking, as well as certain accessories and containers related to their use.
-This Class includes, in particular:
--	tobacco substitutes, not for medical purposes;
--	flavourings, other than essential oils, for use in electronic cigarettes, oral vaporizers for smokers;
--	herbs for smoking;
--	snuff;
--	certain accessories and containers related to the use of tobacco and articles for smoking, for example, lighters for smokers, ashtrays for smokers, tobacco jars, snuff boxes, cigar humidors.
-This Class does not include, in particular:
--	tobacco-free cigarettes for medical purposes (Cl. 5);
--	batteries and chargers for electronic cigarettes (Cl. 9);
--	ashtrays for automobiles (Cl. 12).
-
-Class 35
-Advertising; business management, organization and administration; office functions.
-Explanatory Note
-Class 35 includes mainly services involving business management, operation, organization and administration of a commercial or industrial enterprise, as well as advertising, marketing and promotional services. For the purposes of classification, the sale of goods is not considered to be a service.
-This Class includes, in particular:
--	the bringing together, for the benefit of others, of a variety of goods, excluding the transport thereof, enabling customers to conveniently view and purchase those goods; such services may be provided by retail stores, wholesale outlets, through vending machines, mail order catalogues or by means of electronic media, for example, through websites or television shopping programmes;
--	advertising, marketing and promotional services, for example, distribution of samples, development of advertising concepts, writing and publication of publicity texts;
--	shop window dressing;
--	public relations services;
--	production of teleshopping programmes;
--	organization of trade fairs and exhibitions for commercial or advertising purposes;
--	search engine optimization for sales promotion;
--	commercial assistance services, for example, personnel recruitment, negotiation of business contracts for others, cost price analysis, import-export agency services;
--	administration services relating to business transactions and financial records, for example, book-keeping, drawing up of statements of accounts, business and financial auditing, business appraisals, tax preparation and filing services;
--	commercial administration of the licensing of the goods and services of others;
--	services consisting of the registration, transcription, composition, compilation or systematization of written communications and registrations, and also the compilation of mathematical or statistical data;
--	office functions, for example, appointment scheduling and reminder services, data search in computer files for others, computerized file management, telephone switchboard services.
-This Class does not include, in particular:
--	financial services, for example, financial analysis, financial management, financial sponsorship (Cl. 36);
--	real estate management (Cl. 36);
--	stock brokerage services (Cl. 36);
--	transportation logistics (Cl. 39);
--	energy auditing (Cl. 42);
--	graphic design of promotional materials (Cl. 42);
--	legal services in relation to the negotiation of contracts for others (Cl. 45);
--	licensing of intellectual property, legal administration of licences, copyright management (Cl. 45);
--	registration of domain names (Cl. 45).
-
-Class 36
-Financial, monetary and banking services; insurance services; real estate services.
-Explanatory Note
-Class 36 includes mainly services relating to banking and other financial transactions, financial valuation services, as well as insurance and real estate activities.
-This Class includes, in particular:
--	financial transaction and payment services, for example, exchanging money, electronic funds transfer, processing of credit card and debit card payments, issuance of travellers' cheques;
--	financial management and research;
--	financial appraisals, for example, jewellery, art and real estate appraisal, repair costs evaluation;
--	cheque verification;
--	financing and credit services, for example, loans, issuance of credit cards, hire- or lease-purchase financing;
--	crowdfunding;
--	safe deposit services;
--	financial sponsorship;
--	real estate agency services, real estate management, rental of apartments, rent collection;
--	insurance underwriting, actuarial services;
--	brokerage services, for example, securities, insurance and real estate brokerage, brokerage of carbon credits, pawnbrokerage.
-This Class does not include, in particular:
--	administration services relating to business transactions and financial records, for example, book-keeping, drawing up of statements of accounts, business and financial auditing, business appraisals, tax preparation and filing services (Cl. 35);
--	sponsorship search, promotion of goods and services through sponsorship of sports events (Cl. 35);
--	cash replenishment of automated teller machines (Cl. 39);
--	freight brokerage, transport brokerage (Cl. 39);
--	quality evaluation of wool and standing timber (Cl. 42).
-
-Class 37
-Construction services; installation and repair services; mining extraction, oil and gas drilling.
-Explanatory Note
-Class 37 includes mainly services in the field of construction, as well as services involving the restoration of objects to their original condition or their preservation without altering their physical or chemical properties.
-This Class includes, in particular:
--	construction and demolition of buildings, roads, bridges, dams or transmission lines, as well as services in the field of construction, for example, interior and exterior painting, plastering, plumbing, heating equipment installation, and roofing;
--	shipbuilding;
--	rental of construction tools, machines and equipment, for example, rental of bulldozers, rental of cranes;
--	various repair services, for example, those in the fields of electricity, computer hardware, furniture, instruments, tools;
--	various restoration services, for example, building restoration, furniture restoration and restoration of works of art;
--	maintenance services for preserving an object in its original condition without changing any of its properties, for example, furniture maintenance, vehicle maintenance, swimming-pool maintenance and maintenance of computer hardware;
--	cleaning of different objects, for example, windows, vehicles, clothing, as well as the laundering and pressing of clothing.
-This Class does not include, in particular:
--	physical storage of goods (Cl. 39);
--	transformation of an object or substance that involves a process of change in its essential properties, for example, the cutting, dyeing, fireproofing of cloth (Cl. 40), the casting, plating, treating of metal (Cl. 40), custom tailoring, dressmaking, embroidering (Cl. 40), food and drink preservation (Cl. 40);
--	installation, maintenance and updating of computer software (Cl. 42), creation and hosting of websites (Cl. 42);
--	construction drafting and architectural services (Cl. 42).
-
-Class 38
-Telecommunications services.
-Explanatory Note
-Class 38 includes mainly services that allow at least one party to communicate with another, as well as services for the broadcasting and transmission of data.
-This Class includes, in particular:
--	transmission of digital files and electronic mail;
--	providing user access to global computer networks;
--	radio and television broadcasting;
--	video-on-demand transmission;
--	providing internet chatrooms and online forums;
--	telephone and voice mail services;
--	teleconferencing and videoconferencing services.
-This Class does not include, in particular:
--	radio advertising (Cl. 35);
--	telemarketing services (Cl. 35);
--	content or subject matter that may be contained in the communication activity, for example, downloadable image files (Cl. 9), providing business information via a website (Cl. 35), providing films and television programmes, not downloadable, via video-on-demand services (Cl. 41);
--	services conducted using telecommunication connections, for example, online retail services for downloadable digital music (Cl. 35), online banking (Cl. 36);
--	production of radio and television programmes (Cl. 41);
--	telecommunications technology consultancy (Cl. 42);
--	online social networking services (Cl. 45).
-
-Class 39
-Transport; packaging and storage of goods; travel arrangement.
-Explanatory Note
-Class 39 includes mainly services for the transport of people, animals or goods from one place to another by rail, road, water, air or pipeline and services necessarily connected with such transport, as well as the storing of goods in any kind of storage facility, warehouses or other types of building for their preservation or guarding.
-This Class includes, in particular:
--	operation of stations, bridges, railways, ferries and other transport facilities;
--	rental of vehicles for transportation, as well as chauffeuring and piloting services;
--	rental services related to transport, storage and travel, for example, parking place rental, garage rental, rental of storage containers;
--	operation of maritime tugs, unloading, operation of ports and docks, and salvaging of wrecked ships and their cargoes;
--	packaging, bottling, wrapping and delivering of goods;
--	replenishing vending machines and automated teller machines;
--	services for providing information about journeys or the transport of goods by brokers and tourist agencies, as well as for providing information relating to fares, timetables and methods of transport;
--	inspection of vehicles or goods for the purpose of transport;
--	distribution of energy and electricity, as well as distribution and supply of water.
-This Class does not include, in particular:
--	advertising travel or transport (Cl. 35);
--	insurance services during the transport of people or goods (Cl. 36);
--	maintenance and repair of vehicles or other items connected with the transport of people or goods (Cl. 37);
--	conducting guided tours (Cl. 41);
--	electronic data storage (Cl. 42);
--	reservation of hotel rooms or other temporary accommodation by travel agents or brokers (Cl. 43).
-
-Class 40
-Treatment of materials; recycling of waste and trash; air purification and treatment of water; printing services; food and drink preservation.
-Explanatory Note
-Class 40 includes mainly services rendered by the mechanical or chemical processing, transformation or production of objects or inorganic or organic substances, including custom manufacturing services. For the purposes of classification, the production or manufacturing of goods is considered a service only in cases where it is effected for the account of another person to their order and specification. If the production or manufacturing is not being performed to fulfil an order for goods which meet the customer's particular needs, requirements, or specifications, then it is generally ancillary to the maker's primary commercial activity or goods in trade. If the substance or object is marketed to third parties by the person who processed, transformed or produced it, then this would generally not be considered a service.
-This Class includes, in particular:
--	transformation of an object or substance and any process involving a change in its essential properties, for example, dyeing a garment; such transformation services are also classified in Class 40 if they are provided in the framework of repair or maintenance work, for example, chromium plating of motor vehicle bumpers;
--	services of material treatment which may be present during the production of any substance or object other than a building, for example, services which involve cutting, shaping, polishing by abrasion or metal coating;
--	joining of materials, for example, soldering or welding;
--	processing and treatment of foodstuffs, for example, fruit crushing, flour milling, food and drink preservation, food smoking, freezing of foods;
--	custom manufacturing of goods to the order and specification of others (bearing in mind that certain offices require that the goods produced be indicated), for example, custom manufacturing of automobiles;
--	quilting, embroidering, custom tailoring, textile dyeing, applying finishes to textiles.
-This Class does not include, in particular:
--	services that do not entail a change in the essential properties of the object or substance, for example, furniture maintenance or repair (Cl. 37);
--	services in the field of construction, for example, painting and plastering (Cl. 37);
--	cleaning services, for example, laundering, window cleaning, cleaning of interior and exterior surfaces of buildings (Cl. 37);
--	rustproofing, for example, anti-rust treatment for vehicles (Cl. 37);
--	certain customization services, for example, the custom painting of automobiles (Cl. 37);
--	decorating of food, food sculpting (Cl. 43).
-
-Class 41
-Education; providing of training; entertainment; sporting and cultural activities.
-Explanatory Note
-Class 41 includes mainly services consisting of all forms of education or training, services having the basic aim of the entertainment, amusement or recreation of people, as well as the presentation of works of visual art or literature to the public for cultural or educational purposes.
-This Class includes, in particular:
--	organization of exhibitions for cultural or educational purposes, arranging and conducting of conferences, congresses and symposiums;
--	translation and language interpretation services;
--	publication of books and texts, other than publicity texts;
--	news reporters services, photographic reporting;
--	photography;
--	film direction and production services, other than for advertising films;
--	cultural, educational or entertainment services provided by amusement parks, circuses, zoos, art galleries and museums;
--	sports and fitness training services;
--	training of animals;
--	online gaming services;
--	gambling services, organization of lotteries;
--	ticket reservation and booking services for entertainment, educational and sporting events;
--	certain writing services, for example, screenplay writing, songwriting.
-This Class does not include, in particular:
--	organization of exhibitions for commercial or advertising purposes (Cl. 35);
--	writing and publication of publicity texts (Cl. 35);
--	news agency services (Cl. 38);
--	radio and television broadcasting (Cl. 38);
--	videoconferencing services (Cl. 38);
--	technical writing (Cl. 42);
--	day-nursery and crèche services (Cl. 43);
--	health spa services (Cl. 44);
--	planning and arranging wedding ceremonies (Cl. 45).
-
-Class 42
-Scientific and technological services and research and design relating thereto; industrial analysis, industrial research and industrial design services; quality control and authentication services; design and development of computer hardware and software.
-Explanatory Note
-Class 42 includes mainly services provided by persons in relation to the theoretical and practical aspects of complex fields of activities, for example, scientific laboratory services, engineering, computer programming, architectural services or interior design.
-This Class includes, in particular:
--	services of engineers and scientists who undertake evaluations, estimates, research and reports in the scientific and technological fields, including technological consultancy;
--	computer and technology services for securing computer data and personal and financial information and for the detection of unauthorized access to data and information, for example, computer virus protection services, data encryption services, electronic monitoring of personally identifying information to detect identity theft via the internet;
--	software as a service (SaaS), platform as a service (PaaS);
--	scientific research services for medical purposes;
--	architectural and urban planning services;
--	certain design services, for example, industrial design, design of computer software and systems, interior design, packaging design, graphic arts design, dress designing;
--	surveying (engineering);
--	oil, gas and mining exploration services.
-This Class does not include, in particular:
--	certain research services, for example, business research (Cl. 35), marketing research (Cl. 35), financial research (Cl. 36), research in the field of education (Cl. 41), genealogical research (Cl. 45), legal research (Cl. 45);
--	business auditing (Cl. 35);
--	computerized file management (Cl. 35);
--	financial evaluation services (Cl. 36);
--	mining extraction, oil and gas drilling (Cl. 37);
--	installation, maintenance and repair of computer hardware (Cl. 37);
--	sound engineering services (Cl. 41);
--	certain design services, for example, landscape design (Cl. 44);
--	medical and veterinary services (Cl. 44);
--	legal services (Cl. 45).
-
-Class 43
-Services for providing food and drink; temporary accommodation.
-Explanatory Note
-Class 43 includes mainly services provided in relation to the preparation of food and drink for consumption, as well as services for providing temporary accommodation.
-This Class includes, in particular:
--	temporary accommodation reservations, for example, hotel reservations;
--	boarding for animals;
--	rental of meeting rooms, tents and transportable buildings;
--	retirement home services;
--	day-nursery and crèche services;
--	decorating of food, food sculpting;
--	rental of cooking apparatus;
--	rental of chairs, tables, table linen, glassware;
--	hookah lounge services;
--	personal chef services.
-This Class does not include, in particular:
--	business management of hotels (Cl. 35);
--	rental services for real estate, such as houses or flats, for residential use (Cl. 36);
--	housekeeping (cleaning) services (Cl. 37);
--	travel and transport reservation services (Cl. 39);
--	beer brewing and wine making for others, custom manufacturing of bread (Cl. 40);
--	food smoking, food and drink preservation (Cl. 40);
--	educational, instruction and entertainment services, including those that might involve ancillary lodging or food and drink, provided by, for example, boarding schools, nursery schools, sport camps, discotheques and nightclubs (Cl. 41);
--	providing museum facilities (Cl. 41);
--	convalescent home and rest home services (Cl. 44);
--	babysitting, pet sitting (Cl. 45).
-
-Class 44
-Medical services; veterinary services; hygienic and beauty care for human beings or animals; agriculture, aquaculture, horticulture and forestry services.
-Explanatory Note
-Class 44 includes mainly medical care, including alternative medicine, hygienic and beauty care given by persons or establishments to human beings and animals, as well as services relating to the fields of agriculture, aquaculture, horticulture and forestry.
-This Class includes, in particular:
--	hospital services;
--	telemedicine services;
--	dentistry, optometry and mental health services;
--	medical clinic services and medical analysis services for diagnostic and treatment purposes provided by medical laboratories, such as x-ray examinations and taking of blood samples;
--	therapy services, for example, physiotherapy and speech therapy;
--	pharmacy advice and preparation of prescriptions by pharmacists;
--	blood bank and human tissue bank services;
--	convalescent home and rest home services;
--	dietary and nutritional advice;
--	health spa services;
--	artificial insemination and in vitro fertilization services;
--	animal breeding;
--	animal grooming;
--	body piercing and tattooing;
--	services relating to gardening, for example, plant nursery services, landscape design, landscape gardening, lawn care;
--	services relating to floral art, for example, flower arranging, wreath making;
--	weed killing, vermin and pest control for agriculture, aquaculture, horticulture and forestry.
-This Class does not include, in particular:
--	rental of pastures (Cl. 36);
--	vermin and pest control, other than for agriculture, aquaculture, horticulture and forestry (Cl. 37);
--	installation and repair services for irrigation devices (Cl. 37);
--	ambulance transport (Cl. 39);
--	slaughtering of animals and taxidermy (Cl. 40);
--	timber felling and processing (Cl. 40);
--	animal training services (Cl. 41);
--	health clubs for physical exercise (Cl. 41);
--	scientific research services for medical purposes (Cl. 42);
--	boarding for animals (Cl. 43);
--	retirement homes (Cl. 43);
--	funerary undertaking (Cl. 45).
-
-Class 45
-Legal services; security services for the physical protection of tangible property and individuals; dating services, online social networking services; funerary services; babysitting.
-Explanatory Note
-Class 45 includes mainly legal and security services, as well as certain personal and social services rendered by others to meet the needs of individuals.
-This Class includes, in particular:
--	arbitration and mediation services;
--	registration of domain names;
--	legal and regulatory compliance auditing services;
--	investigation and surveillance services relating to the physical safety of individuals and security of tangible property, for example, guard services, detective agency services, personal background investigations, security screening of baggage;
--	services provided to individuals in relation to social events, for example, chaperoning, planning and arranging of wedding ceremonies;
--	conducting religious ceremonies, burial services;
--	pet sitting, dog walking services;
--	clothing rental.
-This Class does not include, in particular:
--	certain rental services rendered by others to meet the needs of individuals, where the services provided by means of the rented objects belong to another class, for example, rental of apartments (Cl. 36), car rental (Cl. 39), rental of temporary accommodation (Cl. 43);
--	escorting of travellers (Cl. 39);
--	secure transport, for example, guarded transport of valuables, armoured car transport (Cl. 39);
--	party planning (Cl. 41);
--	services consisting of all forms of education, including religious education (Cl. 41);
--	services having the basic aim of the entertainment, amusement or recreation of people (Cl. 41);
--	computer and internet security consultancy and data encryption services (Cl. 42);
--	providing medical, hygienic or beauty care for human beings or animals (Cl. 44).
-"""
 
 # Global configuration
-CONCURRENT_LIMIT = 20
-search_cache: Dict[str, str] = {}
-CANCELLATION_FILE = "cancel_search.tmp" # File to signal cancellation
-MGS_BASE_URL = "https://webaccess.wipo.int/mgs/"
+CONCURRENT_LIMIT = int(os.environ.get("USPTO_CONCURRENCY", 20)) # Most USPTO pages/searches in flight; the adaptive limit stays at or below it
+_search_cache: Optional[ResultCache] = None # Persistent across runs; main.js spawns a fresh process per search
+GEMINI_MODEL_NAME = 'gemini-1.5-flash-latest' # Using latest flash model
+LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", 30 * 24 * 60 * 60)) # Answers only go stale when the model or prompt changes
+_llm_cache: Optional[ResultCache] = None # Gemini answers, keyed by model, prompt version and normalized inputs (see llm_cache_key)
+# Bump when a prompt's wording changes so cached answers to the old prompt are not reused
+VAGUENESS_PROMPT_VERSION = "1"
+SUGGEST_PROMPT_VERSION = "2"
+NICE_CONTEXT_CLASSES = int(os.environ.get("NICE_CONTEXT_CLASSES", 5)) # Classes sent with a suggestion prompt
+# "full" sends the whole NICE text with every suggestion prompt instead of the best-matching classes
+NICE_FULL_CONTEXT = os.environ.get("NICE_CONTEXT", "").lower() == "full"
+_nice_index: Optional[NiceIndex] = None
+_nice_classifier = None # NiceClassifier, built on first use
+_nice_classifier_loaded = False
+USPTO_BASE_URL = os.environ.get("USPTO_BASE_URL", "https://idm-tmng.uspto.gov/id-master-list-public.html") # Overridable for the bench stand-in
+USPTO_SEARCH_INPUT = "div.main-search input.search-term"
+USPTO_RESULT_SELECTORS = ["span.page-results", "table"] # Elements re-rendered by a search
+RESULTS_TIMEOUT_MS = 30000 # Bounded so a pooled page that never re-renders gets reloaded
+VAGUENESS_BATCH_SIZE = 20 # Terms per batched vagueness request
+VAGUENESS_BATCH_WINDOW = 0.5 # Seconds to wait for more terms before sending a partial batch
+PREFIX_PROBE_FANOUT = 3 # Prefix lengths probed at once per term when the full term finds nothing
+STREAM_MAX_IN_FLIGHT = int(os.environ.get("STREAM_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT)) # --stream records worked on at once
+# "browser" drives the ID Manual UI; "http" queries its data service and falls back to the browser
+USPTO_SEARCH_ENGINE = os.environ.get("USPTO_SEARCH_ENGINE", "browser").lower()
+SEARCH_WORKERS = int(os.environ.get("SEARCH_WORKERS", 1)) # Default for --workers; above 1 a search job is sharded across processes
+EMPTY_LISTING = {"rows": [], "firstTermId": None}
+USE_LOCAL_INDEX = os.environ.get("ID_MANUAL_INDEX", "on").lower() != "off"
+# An index imported longer ago than this is skipped (with a warning) and the network answers instead; 0 accepts any age
+ID_MANUAL_MAX_AGE_DAYS = float(os.environ.get("ID_MANUAL_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+_local_index: Optional[LocalIdIndex] = None
+_local_index_loaded = False
+READ_DESCRIPTION_ROWS_JS = """
+() => {
+    const rows = Array.from(document.querySelectorAll("td[data-column='description']")).map(cell => {
+        const row = cell.parentElement;
+        const status = row ? row.querySelector("td[data-column='status']") : null;
+        const link = row ? row.querySelector("a.view-record") : null;
+        return {
+            description: cell.textContent || "",
+            status: status ? status.textContent : null,
+            termId: link ? link.textContent : null
+        };
+    });
+    const firstLink = document.querySelector("a.view-record");
+    return { rows: rows, firstTermId: firstLink ? firstLink.textContent : null };
+}
+"""
 
-# Gemini API Configuration
+# Gemini API Configuration (the SDK is imported and configured on first use; see get_gemini_client)
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
-if not GEMINI_API_KEY:
-    # Use stderr for error messages that shouldn't be parsed as JSON results
-    sys.stderr.write("ERROR: GEMINI_API_KEY environment variable not set.\n")
-    # Optionally, print a JSON error message to stdout as well if the main process expects it
-    print(json.dumps({"type": "error", "message": "GEMINI_API_KEY environment variable not set."}))
-    sys.exit(1) # Exit if the key is missing
-
-try:
-    genai.configure(api_key=GEMINI_API_KEY)
-    # Consider making the model name configurable too, but hardcoding for now
-    gemini_model = genai.GenerativeModel('gemini-1.5-flash-latest') # Using latest flash model
-    sys.stderr.write("DEBUG: Gemini configured successfully.\n")
-except Exception as gemini_config_error:
-    sys.stderr.write(f"ERROR: Failed to configure Gemini: {gemini_config_error}\n")
-    print(json.dumps({"type": "error", "message": f"Failed to configure Gemini: {gemini_config_error}"}))
-    sys.exit(1)
-
-
-def is_subsequence(small: List[str], big: List[str]) -> bool:
-    it = iter(big)
-    return all(word in it for word in it)
-
-def normalize_text(text: str) -> str:
-    text = text.replace('-', '').replace(',', '')
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    return text.lower()
+GEMINI_API_ENDPOINT = os.environ.get('GEMINI_API_ENDPOINT') # e.g. the bench stub; talks REST instead of gRPC when set
+_gemini_client: Optional[GeminiClient] = None
+_startup_marks.append(("globals", time.perf_counter()))
+
+
+def search_cancelled(cancel_event: asyncio.Event) -> bool:
+    return cancel_event.is_set() or cancellation_requested()
 
 async def wait_for_results_update(page) -> None:
-    await page.wait_for_function(
+    await wait_for_change(
+        page,
         "document.querySelector('span.page-results') && document.querySelector('span.page-results').textContent.trim() !== ''",
-        timeout=0
+        timeout=RESULTS_TIMEOUT_MS
     )
 
-async def binary_search_partial(term: str, page, base_url: str, cancel_event: asyncio.Event) -> Optional[str]:
-    # Split individual term into words (not the whole input string)
-    words = term.strip().split()  # Remove potential whitespace and split into words
-    lo, hi = 1, len(words)
-    best: Optional[str] = None
-    while lo <= hi:
-        if cancel_event.is_set() or os.path.exists(CANCELLATION_FILE): # Check for cancellation file
-            return None
-        mid = (lo + hi) // 2
-        prefix = " ".join(words[:mid])
-        await page.goto(base_url, wait_until="networkidle", timeout=0)
-        await page.wait_for_selector("div.main-search input.search-term", timeout=30000)
-        await page.fill("div.main-search input.search-term", prefix)
-        await page.press("div.main-search input.search-term", "Enter")
+async def open_uspto_search(page) -> None:
+    """Loads the ID Manual search screen; used by the page pool for fresh and stale pages."""
+    with span("goto"):
+        await page.goto(USPTO_BASE_URL, wait_until="networkidle", timeout=NAVIGATION_TIMEOUT_MS)
+        await page.wait_for_selector(USPTO_SEARCH_INPUT, timeout=30000)
+
+async def submit_uspto_search(page, query: str) -> str:
+    """Runs a search on a page already showing the ID Manual UI and returns the span.page-results text."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError # Already loaded by the browser context
+    for attempt in range(2):
+        with span("submit"):
+            await page.wait_for_selector(USPTO_SEARCH_INPUT, timeout=30000)
+            await page.fill(USPTO_SEARCH_INPUT, query)
+            await arm_change_watch(page, USPTO_RESULT_SELECTORS)
+            await page.press(USPTO_SEARCH_INPUT, "Enter")
         try:
-            await wait_for_results_update(page)
-        except asyncio.TimeoutError:
-            partial_content = ""
-        else:
-            partial_content = (await page.text_content("span.page-results")) or ""
-        if partial_content and "Displaying" in partial_content:
-            best = prefix
-            lo = mid + 1
+            with span("wait_for_results"):
+                await wait_for_results_update(page)
+        except PlaywrightTimeoutError:
+            if attempt == 0:
+                # Results identical to the previous search may not re-render; retry on a fresh load
+                sys.stderr.write(f"DEBUG: No result update for '{query}' on pooled page, reloading.\n")
+                await open_uspto_search(page)
+                continue
+            return ""
+        with span("extraction"):
+            return (await page.text_content("span.page-results")) or ""
+    return ""
+
+async def read_description_rows(page) -> Dict:
+    """Reads every listing row (description, status, term ID) from the results table in one round trip."""
+    with span("extraction"):
+        return await page.evaluate(READ_DESCRIPTION_ROWS_JS)
+
+def classify_results_banner(term: str, content: str) -> str:
+    """Maps the span.page-results text to search_term's initial result type."""
+    full_match_prefix = "Displaying search results for:"
+    all_records_prefix = "Displaying all of"
+
+    if content and full_match_prefix in content:
+        displayed_term_match = re.search(rf"{re.escape(full_match_prefix)}\s*\"(.+?)\"", content)
+        if displayed_term_match:
+            displayed_term = displayed_term_match.group(1).strip()
+            if normalize_text(term) == normalize_text(displayed_term):
+                return "full_match_prefix"
+            return "larger_description_prefix"
+        return "larger_description_prefix_fail"
+    elif content and all_records_prefix in content:
+        return "larger_description_general"
+    elif content and "Displaying" not in content and "No listings found" not in content:
+        return "needs_prefix_search"
+    return ""
+
+def match_template_rows(partial: str, rows: List[Dict]) -> Optional[Dict]:
+    """Returns the first row whose description contains the prefix's words in order."""
+    partial_words = normalize_text(partial).split()
+    for row in rows:
+        cell_words = normalize_text(row["description"].strip()).split()
+        if is_subsequence(partial_words, cell_words):
+            return row
+    return None
+
+def match_description_rows(term: str, listing: Dict) -> Dict:
+    """Looks for the term among listing descriptions: exact (possibly deleted) or contained matches."""
+    match = {
+        "foundFull": False,
+        "isDeleted": False,
+        "foundInDescription": False,
+        "descriptionText": None,
+        "termId": (listing.get("firstTermId") or "").strip() or "Not found",
+    }
+    rows = listing["rows"]
+    for found in TermMatcher([term]).scan(row["description"].strip() for row in rows):
+        row = rows[found.index]
+        cell_text = row["description"].strip()
+        status_text = (row.get("status") or "").strip()
+        row_term_id = (row.get("termId") or "").strip()
+
+        if found.kind == FULL:
+            match["foundFull"] = True
+            match["foundInDescription"] = True
+            match["descriptionText"] = cell_text # Store the exact matching description
+            if status_text == "D":
+                match["isDeleted"] = True
+                # description_text remains the matched text even if deleted
+                break # Exit loop once deleted full match found
+            # If not deleted, store ID and break
+            if row_term_id:
+                match["termId"] = row_term_id
+            break # Exit loop once full match found
+
+        else: # Contained in a larger description
+            match["foundInDescription"] = True
+            if match["descriptionText"] is None: # Only store the first partial match example
+                match["descriptionText"] = cell_text
+            # Get Term ID for the first partial match found
+            if match["termId"] == "Not found" and row_term_id:
+                match["termId"] = row_term_id
+            # Don't break here, continue searching for a full match
+    return match
+
+def resolve_outcome(term: str, initial_result_type: str, listing: Dict, partial: Optional[str] = None) -> Dict:
+    """Combines the initial result type with the listing rows into the facts search_term reports on."""
+    rows = listing["rows"]
+    outcome = {
+        "initialResultType": initial_result_type,
+        "partial": partial,
+        "foundFull": False,
+        "isDeleted": False,
+        "foundInDescription": False,
+        "descriptionText": None,
+        "termId": "Not found",
+        "firstDescription": rows[0]["description"].strip() if rows else None,
+    }
+    if initial_result_type == "no_match":
+        return outcome
+
+    if partial:
+        template_row = match_template_rows(partial, rows)
+        if template_row:
+            outcome["initialResultType"] = "template_match"
+            outcome["descriptionText"] = template_row["description"].strip()
+            outcome["termId"] = (template_row.get("termId") or "").strip() or "Not found"
+            return outcome
+        outcome["initialResultType"] = "partial"
+
+    outcome.update(match_description_rows(term, listing))
+    # If no description found yet, and it was a binary search partial, use that partial text
+    if not outcome["foundInDescription"] and outcome["initialResultType"] == "partial" and partial:
+        outcome["descriptionText"] = partial # Use the prefix as the example
+    return outcome
+
+async def resolve_uspto_browser(term: str, lookup: "UsptoLookup", cancel_event: asyncio.Event) -> Dict:
+    """Searches the ID Manual UI on pooled pages and resolves the term's outcome."""
+    async with lookup.pool.page() as page:
+        content = await submit_uspto_search(page, term)
+        initial_result_type = classify_results_banner(term, content)
+        if initial_result_type != "needs_prefix_search":
+            return resolve_outcome(term, initial_result_type, await read_description_rows(page))
+
+    # The page goes back to the pool first: prefix probes each borrow their own page
+    with span("prefix_search"): # Spans nest: the probes' own submit/wait/extraction spans fall inside this one
+        partial, listing = await lookup.browser_prefixes.longest_prefix(term, lambda: search_cancelled(cancel_event))
+    if not partial:
+        return resolve_outcome(term, "no_match", EMPTY_LISTING)
+    return resolve_outcome(term, "partial", listing, partial)
+
+def get_local_index() -> Optional[LocalIdIndex]:
+    """Loads the imported ID Manual index once per process (None if disabled, missing or stale)."""
+    global _local_index, _local_index_loaded
+    if not _local_index_loaded:
+        _local_index_loaded = True
+        if USE_LOCAL_INDEX:
+            _local_index = LocalIdIndex.load(max_age_days=ID_MANUAL_MAX_AGE_DAYS)
+    return _local_index
+
+async def resolve_uspto_local(term: str, lookup: "UsptoLookup", cancel_event: asyncio.Event) -> Optional[Dict]:
+    """Resolves the term from the local ID Manual index; None means it is a miss and the network should decide."""
+    index = lookup.local_index
+    index.lookups += 1
+    listing = index.listing(term)
+    if listing["rows"]:
+        outcome = resolve_outcome(term, "larger_description_general", listing)
+    else:
+        partial, listing = await lookup.local_prefixes.longest_prefix(term, lambda: search_cancelled(cancel_event))
+        if not partial:
+            return None # Nothing local at all; let the live search confirm "no match"
+        outcome = resolve_outcome(term, "partial", listing, partial)
+    index.local_answers += 1
+    return outcome
+
+async def resolve_uspto_http(term: str, lookup: "UsptoLookup", cancel_event: asyncio.Event) -> Dict:
+    """Resolves the term's outcome from the ID Manual service, without a browser."""
+    with span("http_request"):
+        listing = await lookup.http_client.search(term)
+    if listing["rows"]:
+        # The service has no results banner; a non-empty listing is what "Displaying all of" shows
+        return resolve_outcome(term, "larger_description_general", listing)
+
+    with span("prefix_search"):
+        partial, listing = await lookup.http_prefixes.longest_prefix(term, lambda: search_cancelled(cancel_event))
+    if not partial:
+        return resolve_outcome(term, "no_match", EMPTY_LISTING)
+    return resolve_outcome(term, "partial", listing, partial)
+
+
+class UsptoLookup:
+    """The USPTO lookup paths for one run, each with a prefix memo shared by all of the run's terms,
+    plus the run's in-flight term lookups so duplicate spellings are searched once."""
+
+    def __init__(self, pool: PagePool, http_client: Optional[UsptoHttpClient] = None):
+        self.pool = pool
+        self.http_client = http_client
+        self.local_index = get_local_index()
+        self.browser_prefixes = PrefixResolver(self._probe_browser, normalize_text, fanout=PREFIX_PROBE_FANOUT)
+        self.http_prefixes = PrefixResolver(self._probe_http, normalize_text, fanout=PREFIX_PROBE_FANOUT)
+        # Local probes are in-memory, so plain bisection does the least work
+        self.local_prefixes = PrefixResolver(self._probe_local, normalize_text, fanout=1)
+        self.inflight = SingleFlight()
+
+    async def _probe_browser(self, prefix: str) -> Optional[Dict]:
+        async with self.pool.page() as page:
+            if "Displaying" not in await submit_uspto_search(page, prefix):
+                return None
+            # Read the rows now so the winning prefix never has to be searched again
+            return await read_description_rows(page)
+
+    async def _probe_http(self, prefix: str) -> Optional[Dict]:
+        listing = await self.http_client.search(prefix)
+        return listing if listing["rows"] else None
+
+    async def _probe_local(self, prefix: str) -> Optional[Dict]:
+        listing = self.local_index.listing(prefix)
+        return listing if listing["rows"] else None
+
+    def stats(self) -> Dict:
+        return {
+            "browserPrefixes": self.browser_prefixes.stats(),
+            "httpPrefixes": self.http_prefixes.stats(),
+            "localPrefixes": self.local_prefixes.stats(),
+            "termLookups": self.inflight.stats(),
+        }
+
+# Shared by the single-term and batched vagueness prompts
+VAGUENESS_GUIDELINES = """You are a United States Trademark Examiner. Your task is to analyze trademark descriptions and determine if they are likely to be considered vague and unacceptable according to USPTO guidelines.
+
+A vague trademark description is one that is:
+- Overly broad, encompassing too many unrelated goods or services.
+- Indefinite or unclear in meaning.
+- Primarily describes the function or purpose of goods/services rather than the goods/services themselves.
+- Lacks clarity or uses jargon unfamiliar to the general public.
+
+Here are some examples of vague and non-vague descriptions:
+Vague Example 1: 'Goods and services in Class 9'
+Not Vague Example 1: 'Downloadable software for editing videos'
+Vague Example 2: 'Miscellaneous products'
+Not Vague Example 2: 'Leather wallets'"""
+
+def get_search_cache() -> ResultCache:
+    """The USPTO result cache, opened on first use so importing this module (or a sharding parent) opens no database."""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = ResultCache()
+    return _search_cache
+
+def get_llm_cache() -> ResultCache:
+    """The Gemini answer cache, opened on first use."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = ResultCache(table="llm_responses", ttl_seconds=LLM_CACHE_TTL)
+    return _llm_cache
+
+def llm_cache_key(kind: str, version: str, template: str, *inputs: Optional[str]) -> str:
+    """Content-addressed key: any change to the model, prompt version, shared template text or inputs misses."""
+    template_hash = hashlib.sha256(template.encode("utf-8")).hexdigest()
+    payload = json.dumps([GEMINI_MODEL_NAME, kind, version, template_hash, list(inputs)])
+    return f"{kind}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+def vagueness_cache_key(term: str) -> str:
+    # Single and batched prompts share the guidelines, so either one's answer serves both
+    return llm_cache_key("vagueness", VAGUENESS_PROMPT_VERSION, VAGUENESS_GUIDELINES, normalize_text(term))
+
+def suggest_cache_key(term: str, reason: str, example: Optional[str], nice_context: str) -> str:
+    # Whitespace-only normalization: suggestions must start with the example's exact wording
+    from nice_text import NICE_CLASSIFICATION_TEXT
+    return llm_cache_key("suggest", SUGGEST_PROMPT_VERSION, NICE_CLASSIFICATION_TEXT, nice_context,
+                         *(" ".join(text.split()) if text else None for text in (term, reason, example)))
+
+def cached_vagueness(term: str) -> Optional[Tuple[str, str]]:
+    cached = get_llm_cache().get(vagueness_cache_key(term))
+    if cached is None:
+        return None
+    return cached["classification"], cached["reasoning"]
+
+def store_vagueness(term: str, classification: str, reasoning: str) -> None:
+    if classification in ("Vague", "Not Vague"): # Never cache errors or unparsed answers
+        get_llm_cache().set(vagueness_cache_key(term), {"classification": classification, "reasoning": reasoning})
+
+def get_gemini_client() -> GeminiClient:
+    """Configures Gemini on first use, so runs that never need the LLM skip the SDK import and the API key."""
+    global _gemini_client
+    if _gemini_client is None:
+        if not GEMINI_API_KEY:
+            raise GeminiUnavailableError("GEMINI_API_KEY environment variable not set.")
+        import google.generativeai as genai
+        if GEMINI_API_ENDPOINT:
+            genai.configure(api_key=GEMINI_API_KEY, transport="rest", client_options={"api_endpoint": GEMINI_API_ENDPOINT})
         else:
-            hi = mid - 1
-    return best
+            genai.configure(api_key=GEMINI_API_KEY)
+        # Async calls with their own concurrency and rate limits
+        _gemini_client = GeminiClient(genai.GenerativeModel(GEMINI_MODEL_NAME))
+        sys.stderr.write("DEBUG: Gemini configured successfully.\n")
+    return _gemini_client
+
+def gemini_stats() -> Dict:
+    return _gemini_client.stats() if _gemini_client is not None else {"calls": 0}
 
 def list_gemini_models(): # Debug function - keep it, redirect output to stderr
+    import google.generativeai as genai
+    get_gemini_client() # Configures the API key
     sys.stderr.write("DEBUG: Listing available Gemini models:\n")
     for model in genai.list_models():
         sys.stderr.write(f"DEBUG: Model: {model.name}\n")
@@ -1058,21 +415,9 @@ def normalize_vagueness_result(classification: str, reasoning: str) -> Tuple[str
     reasoning = reasoning.strip()
     return classification, reasoning
 
-def analyze_vagueness_gemini(description_text): # Keep Gemini analysis function as is, it's backend logic
+async def analyze_vagueness_gemini(description_text): # Keep Gemini analysis function as is, it's backend logic
     prompt = f"""
-You are a United States Trademark Examiner. Your task is to analyze trademark descriptions and determine if they are likely to be considered vague and unacceptable according to USPTO guidelines.
-
-A vague trademark description is one that is:
-- Overly broad, encompassing too many unrelated goods or services.
-- Indefinite or unclear in meaning.
-- Primarily describes the function or purpose of goods/services rather than the goods/services themselves.
-- Lacks clarity or uses jargon unfamiliar to the general public.
-
-Here are some examples of vague and non-vague descriptions:
-Vague Example 1: 'Goods and services in Class 9'
-Not Vague Example 1: 'Downloadable software for editing videos'
-Vague Example 2: 'Miscellaneous products'
-Not Vague Example 2: 'Leather wallets'
+{VAGUENESS_GUIDELINES}
 
 Now, analyze the following trademark description and **first, clearly classify it as either "Vague" or "Not Vague".  Then, briefly explain your reasoning** based on the criteria for vagueness outlined above.
 
@@ -1082,12 +427,15 @@ Trademark Description: {description_text}
 Reasoning: [AI's Explanation]
 """
     sys.stderr.write(f"DEBUG: analyze_vagueness_gemini called with description: {description_text}\n")
+    cached = cached_vagueness(description_text)
+    if cached is not None:
+        sys.stderr.write(f"DEBUG: Vagueness analysis cache hit for '{description_text}'\n")
+        return cached
     # list_gemini_models() # Commented out for less verbose debug output
 
     try:
         sys.stderr.write(f"DEBUG: Sending prompt to Gemini API: {prompt}\n")
-        response = gemini_model.generate_content(prompt)
-        ai_response_text = response.text
+        ai_response_text = await get_gemini_client().generate(prompt, label=f"Vagueness analysis for '{description_text}'")
         sys.stderr.write(f"DEBUG: Gemini API Response Text: {ai_response_text}\n")
 
         classification = "Unknown"
@@ -1133,6 +481,7 @@ Reasoning: [AI's Explanation]
             sys.stderr.write(f"DEBUG: [VAGUENESS_ANALYSIS] Post-normalized Reasoning: {reasoning}\n")
 
         sys.stderr.write(f"DEBUG: Gemini Analysis - Classification: {classification}, Reasoning: {reasoning}\n")
+        store_vagueness(description_text, classification, reasoning)
         return classification, reasoning
 
     except Exception as e:
@@ -1141,17 +490,176 @@ Reasoning: [AI's Explanation]
         # Fallback logic removed for simplicity in debugging, directly return error
         return "Error", f"Gemini API Error: {error_message}"
 
+VAGUENESS_BATCH_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "id": {"type": "INTEGER"},
+                "classification": {"type": "STRING", "enum": ["Vague", "Not Vague"]},
+                "reasoning": {"type": "STRING"},
+            },
+            "required": ["id", "classification", "reasoning"],
+        },
+    },
+}
+
+def build_vagueness_batch_prompt(terms: List[str]) -> str:
+    lines = [
+        VAGUENESS_GUIDELINES,
+        "",
+        "Now, analyze EACH of the following trademark descriptions. For each one, classify it as either \"Vague\" or \"Not Vague\" and briefly explain your reasoning based on the criteria for vagueness outlined above.",
+        "",
+    ]
+    lines.extend(f"{i}. {term}" for i, term in enumerate(terms))
+    lines.extend([
+        "",
+        "Respond ONLY with a JSON list containing one object per description: {\"id\": <number above>, \"classification\": \"Vague\" or \"Not Vague\", \"reasoning\": <explanation>}.",
+    ])
+    return "\n".join(lines)
+
+def parse_vagueness_batch(ai_response_text: str, count: int) -> Dict[int, Tuple[str, str]]:
+    """Maps description ids to (classification, reasoning); malformed or unknown entries are dropped."""
+    answers: Dict[int, Tuple[str, str]] = {}
+    try:
+        parsed = json.loads(ai_response_text)
+    except json.JSONDecodeError:
+        json_match = re.search(r"\[.*\]", ai_response_text, re.DOTALL) # Tolerate stray text around the list
+        if not json_match:
+            return answers
+        try:
+            parsed = json.loads(json_match.group(0))
+        except json.JSONDecodeError:
+            return answers
+    if not isinstance(parsed, list):
+        return answers
+    for item in parsed:
+        if not isinstance(item, dict):
+            continue
+        item_id, classification = item.get("id"), str(item.get("classification", ""))
+        if isinstance(item_id, int) and 0 <= item_id < count and classification.lower() in ("vague", "not vague"):
+            answers[item_id] = normalize_vagueness_result(classification, str(item.get("reasoning", "")))
+    return answers
+
+async def analyze_vagueness_batch(terms: List[str]) -> Dict[str, Tuple[str, str]]:
+    """Classifies several terms with one Gemini request; terms it leaves out are analyzed one by one."""
+    results: Dict[str, Tuple[str, str]] = {}
+    for term in terms:
+        cached = cached_vagueness(term)
+        if cached is not None:
+            results[term] = cached
+    terms = [term for term in terms if term not in results]
+    if len(terms) <= 1:
+        for term in terms:
+            results[term] = await analyze_vagueness_gemini(term)
+        return results
+    prompt = build_vagueness_batch_prompt(terms)
+    try:
+        ai_response_text = await get_gemini_client().generate(prompt, label=f"Vagueness batch of {len(terms)} terms",
+                                                        generation_config=VAGUENESS_BATCH_CONFIG)
+    except Exception as e:
+        sys.stderr.write(f"DEBUG: Error in analyze_vagueness_batch: {e}\n")
+        results.update({term: ("Error", f"Gemini API Error: {e}") for term in terms})
+        return results
+    answers = parse_vagueness_batch(ai_response_text, len(terms))
+    for i, term in enumerate(terms):
+        if i in answers:
+            results[term] = answers[i]
+            store_vagueness(term, *answers[i])
+    missing = [term for term in terms if term not in results]
+    if missing:
+        sys.stderr.write(f"DEBUG: Vagueness batch left out {len(missing)} of {len(terms)} terms; analyzing them individually.\n")
+        for term, result in zip(missing, await asyncio.gather(*(analyze_vagueness_gemini(term) for term in missing))):
+            results[term] = result
+    return results
+
+# Terms needing analysis are gathered from concurrent search_term calls into shared requests
+vagueness_batcher = MicroBatcher(analyze_vagueness_batch, max_batch=VAGUENESS_BATCH_SIZE, window=VAGUENESS_BATCH_WINDOW)
+
+def get_nice_index() -> NiceIndex:
+    global _nice_index
+    if _nice_index is None:
+        from nice_text import NICE_CLASSIFICATION_TEXT
+        _nice_index = NiceIndex(NICE_CLASSIFICATION_TEXT)
+    return _nice_index
+
+def get_nice_classifier():
+    """Builds the local NICE classifier once per process (None if numpy is unavailable)."""
+    global _nice_classifier, _nice_classifier_loaded
+    if not _nice_classifier_loaded:
+        _nice_classifier_loaded = True
+        from nice_classifier import NiceClassifier, NiceClassifierError # Imports numpy
+        from nice_text import NICE_CLASSIFICATION_TEXT
+        try:
+            _nice_classifier = NiceClassifier(NICE_CLASSIFICATION_TEXT)
+        except NiceClassifierError as e:
+            sys.stderr.write(f"DEBUG: {e}\n")
+    return _nice_classifier
+
+def classify_terms(terms: List[str], top_k: int = 3) -> List[Dict]:
+    """Local NICE class predictions for a batch of terms, as "classification" records."""
+    classifier = get_nice_classifier()
+    if classifier is None:
+        from nice_classifier import NiceClassifierError
+        raise NiceClassifierError("numpy is not installed; local NICE classification is unavailable.")
+    return [{"type": "classification", "term": term, "classes": classes}
+            for term, classes in zip(terms, classifier.classify(terms, top_k))]
+
+def check_suggestion_classes(suggestions: List[Dict]) -> List[Dict]:
+    """Fills missing suggestion classes from the local classifier and flags ones it disagrees with."""
+    classifier = get_nice_classifier()
+    if classifier is None or not suggestions:
+        return suggestions
+    for suggestion, predicted in zip(suggestions, classifier.classify([s["suggestion"] for s in suggestions])):
+        if not predicted:
+            continue
+        if suggestion["class"] is None:
+            suggestion["class"] = predicted[0]["class"]
+            suggestion["classSource"] = "local"
+        elif suggestion["class"] not in [p["class"] for p in predicted]:
+            suggestion["localClasses"] = [p["class"] for p in predicted] # Worth a second look
+            sys.stderr.write(f"WARN: Gemini put '{suggestion['suggestion']}' in class {suggestion['class']}, local classifier suggests {suggestion['localClasses']}\n")
+    return suggestions
+
+def select_nice_classes(original_term: str, vagueness_reason: str, example_description: Optional[str],
+                        full_context: bool = False) -> Optional[List[int]]:
+    """Classes most relevant to the suggestion request, or None to send the full NICE text."""
+    if full_context or NICE_FULL_CONTEXT:
+        return None
+    # The term decides the class far more than the (mostly generic) vagueness reason
+    fields = [(original_term, 2.0), (example_description, 1.0), (vagueness_reason, 0.5)]
+    classes = get_nice_index().top_classes(fields, NICE_CONTEXT_CLASSES)
+    return classes or None # No lexical overlap at all: let the model see every class
+
 # --- New Function for Suggesting Alternatives ---
-def suggest_alternatives_gemini(original_term: str, vagueness_reason: str, example_description: Optional[str]):
+async def suggest_alternatives_gemini(original_term: str, vagueness_reason: str, example_description: Optional[str],
+                                      full_nice_context: bool = False):
     """Uses Gemini AI to suggest alternative phrasings and classify them according to NICE."""
     sys.stderr.write(f"DEBUG: suggest_alternatives_gemini called with term='{original_term}', reason='{vagueness_reason}', example='{example_description}'\n")
+    from nice_text import NICE_CLASSIFICATION_TEXT
+    nice_classes = select_nice_classes(original_term, vagueness_reason, example_description, full_nice_context)
+    nice_context = "full" if nice_classes is None else ",".join(map(str, nice_classes))
+    sys.stderr.write(f"DEBUG: NICE context for suggestions: {nice_context}\n")
+    cache_key = suggest_cache_key(original_term, vagueness_reason, example_description, nice_context)
+    cached = get_llm_cache().get(cache_key)
+    if cached is not None:
+        sys.stderr.write(f"DEBUG: Suggestion cache hit for '{original_term}'\n")
+        return cached["suggestions"]
 
     # --- Construct the Enhanced Prompt ---
+    if nice_classes is None:
+        nice_intro = "\nFIRST, here is the full text of the NICE Classification (Classes 1-45) including Explanatory Notes:"
+        nice_text = NICE_CLASSIFICATION_TEXT
+    else:
+        nice_intro = "\nFIRST, here are the NICE Classification classes most relevant to this description, including their Explanatory Notes:"
+        nice_text = get_nice_index().context(nice_classes)
     prompt_lines = [
         "You are an expert assistant helping users refine trademark descriptions to meet USPTO ID Manual standards and classify them according to the NICE classification.",
-        "\nFIRST, here is the full text of the NICE Classification (Classes 1-45) including Explanatory Notes:",
+        nice_intro,
         "--- START NICE CLASSIFICATION ---",
-        NICE_CLASSIFICATION_TEXT,
+        nice_text,
         "--- END NICE CLASSIFICATION ---",
         f"\nSECOND, the user provided the description: \"{original_term}\"",
         f"This description was flagged as potentially vague for the following reason: \"{vagueness_reason}\""
@@ -1183,10 +691,8 @@ def suggest_alternatives_gemini(original_term: str, vagueness_reason: str, examp
         #     {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
         #     {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
         # ]
-        # response = gemini_model.generate_content(prompt, safety_settings=safety_settings)
-        response = gemini_model.generate_content(prompt)
-
-        ai_response_text = response.text
+        # ai_response_text = await get_gemini_client().generate(prompt, safety_settings=safety_settings)
+        ai_response_text = await get_gemini_client().generate(prompt, label=f"Suggestions for '{original_term}'")
         sys.stderr.write(f"DEBUG: Gemini API Suggestion Response Text:\n{ai_response_text}\n")
 
         # --- Parse the JSON response ---
@@ -1225,7 +731,10 @@ def suggest_alternatives_gemini(original_term: str, vagueness_reason: str, examp
              return {"error": f"Failed to parse AI response: {parse_error}"}
 
 
+        suggestions_with_class = check_suggestion_classes(suggestions_with_class)
         sys.stderr.write(f"DEBUG: Extracted Suggestions with Class: {suggestions_with_class}\n")
+        if suggestions_with_class:
+            get_llm_cache().set(cache_key, {"suggestions": suggestions_with_class})
         return suggestions_with_class # Return the list of objects
 
     except Exception as e:
@@ -1236,380 +745,480 @@ def suggest_alternatives_gemini(original_term: str, vagueness_reason: str, examp
         return {"error": f"Failed to get suggestions: {error_message}"}
 
 
-async def search_mgs_term(term: str, context, cancel_event: asyncio.Event, semaphore: asyncio.Semaphore, nice_filter: bool) -> Tuple[str, str]:
-    """Searches for a term in the Madrid Goods & Services Manager (MGS) with debugging."""
-    if cancel_event.is_set() or os.path.exists(CANCELLATION_FILE):
+async def search_term(term: str, lookup: UsptoLookup, cancel_event: asyncio.Event, semaphore: AdaptiveLimiter) -> Tuple[str, str]:
+    if search_cancelled(cancel_event):
+        emit(cancelled_result(term, "uspto"))
         return term, "Cancelled"
+    # Normalization-equivalent spellings in flight at once share one lookup; each is reported under its own spelling
+    shared = await lookup.inflight.run(f"uspto:{normalize_text(term)}", lambda: lookup_term(term, lookup, cancel_event, semaphore))
+    result_data = {**shared, "term": term}
+    with span("serialization"):
+        sys.stderr.write(f"DEBUG: [FINAL_OUTPUT] Term: {term}, Structured Result: {json.dumps(result_data, indent=2)}\n")
+        emit(result_data)
+
+    # Return term and statusText (though statusText isn't really used by caller anymore)
+    return term, result_data.get("statusText", "Error")
+
+
+async def lookup_term(term: str, lookup: UsptoLookup, cancel_event: asyncio.Event, semaphore: AdaptiveLimiter) -> Dict:
+    """Resolves one term to its result (or error) record: cache, then local index, HTTP, browser, then Gemini.
+
+    The browser search and the Gemini analysis share one TERM_DEADLINE budget; a term answered
+    without the browser starts its clock at the analysis.
+    """
+    bind_term(term, "uspto")
+    deadline = TermDeadline()
+    cache_key = f"uspto:{normalize_text(term)}"
+    with span("cache_lookup"):
+        cached_data = get_search_cache().get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
+    outcome = None
+    if lookup.local_index is not None:
+        outcome = await resolve_uspto_local(term, lookup, cancel_event)
+
+    if outcome is None and lookup.http_client is not None and not lookup.http_client.disabled:
+        try:
+            outcome = await resolve_uspto_http(term, lookup, cancel_event)
+        except UsptoHttpError as e:
+            sys.stderr.write(f"DEBUG: HTTP engine failed for '{term}', falling back to browser: {e}\n")
 
-    async with semaphore:
-        page = await context.new_page()
+    if outcome is None:
         try:
-            await page.goto(MGS_BASE_URL, wait_until="networkidle", timeout=0)
-            search_tab_selector = 'xpath=//input[@id="btnSearch"]'
-            await page.click(search_tab_selector)
-            await page.wait_for_selector("input#searchInputBox.dummyClass", timeout=30000)
-            await page.fill("input#searchInputBox.dummyClass", term)
-            nice_filter_checkbox_selector = 'input#checkNiceFilterSearch'
-            if nice_filter:
-                await page.check(nice_filter_checkbox_selector)
-            else:
-                await page.uncheck(nice_filter_checkbox_selector)
-            await page.click('span#searchButton')
-
-            results_container_selector = 'div#divHitList'
-            await page.wait_for_selector(results_container_selector, timeout=30000)
-
-            no_results_banner = await page.query_selector('div#divHitList > div#hitListBanner:has-text("No results")')
-            if no_results_banner:
-                return term, f"MGS No Match (NICE {'On' if nice_filter else 'Off'})"
-
-            full_match_found = False
-            results_list = await page.query_selector('div#divHitList > ul')
-            if results_list:
-                list_items = await results_list.query_selector_all('li')
-                for item in list_items:
-                    item_html_content = await item.inner_html()  # Capture raw HTML of the list item
-                    description_text = (await item.text_content()).strip()
-                    normalized_description_text = normalize_text(description_text)
-                    normalized_term = normalize_text(term)
-                    match = (normalized_description_text == normalized_term)
-
-                    sys.stderr.write(f"DEBUG: MGS - Term: '{term}', NICE Filter: {'ON' if nice_filter else 'OFF'}\n")
-                    sys.stderr.write(f"DEBUG: MGS - List Item HTML: {item_html_content}\n") # Log raw HTML
-                    sys.stderr.write(f"DEBUG: MGS - Extracted Description Text: '{description_text}'\n") # Log extracted text
-                    sys.stderr.write(f"DEBUG: MGS - Normalized Description Text: '{normalized_description_text}'\n") # Log normalized text
-                    sys.stderr.write(f"DEBUG: MGS - Normalized Search Term: '{normalized_term}'\n") # Log normalized search term
-                    sys.stderr.write(f"DEBUG: MGS - Comparison Result: '{match}'\n") # Log comparison result
-
-                    if match:
-                        full_match_found = True
-                        break
-
-            if full_match_found:
-                return term, f"MGS Full Match (NICE {'On' if nice_filter else 'Off'})"
-            else:
-                return term, f"MGS No Full Match (NICE {'On' if nice_filter else 'Off'})"
+            outcome = await run_term(f"USPTO search for '{term}'", lambda: resolve_uspto_browser(term, lookup, cancel_event),
+                                     breaker_for(USPTO_BASE_URL), semaphore, deadline)
+        except TermFailure as e:
+            sys.stderr.write(f"ERROR: {e}\n")
+            return e.error_record(term, "uspto", "Error searching USPTO")
+
+    initial_result_type = outcome["initialResultType"]
+    partial = outcome["partial"]
+    found_full_description_match = outcome["foundFull"]
+    is_deleted_description = outcome["isDeleted"]
+    found_in_description = outcome["foundInDescription"]
+    description_text = outcome["descriptionText"]
+    term_id_number = outcome["termId"]
+
+    vagueness_classification = "Not Analyzed"
+    vagueness_reason = ""
+
+    # Always perform vagueness analysis unless it's a non-deleted full match
+    if not (found_full_description_match and not is_deleted_description):
+        # *** Always analyze the original term for vagueness ***
+        text_to_analyze = term
+
+        sys.stderr.write(f"DEBUG: Analyzing original term for vagueness: '{text_to_analyze}'\n")
+
+        with span("gemini"): # Includes the wait for the rest of the micro-batch
+            try:
+                vagueness_classification, vagueness_reason = await asyncio.wait_for(
+                    vagueness_batcher.submit(text_to_analyze), deadline.remaining())
+            except asyncio.TimeoutError: # The batch goes on for the other terms in it
+                vagueness_classification = "Error" # Not cached, so the next run retries it
+                vagueness_reason = f"Vagueness analysis did not finish within the term's {deadline.budget:g}s deadline"
+                sys.stderr.write(f"WARN: {vagueness_reason}: '{term}'\n")
+
+        sys.stderr.write(f"DEBUG: Vagueness Analysis Results: Classification='{vagueness_classification}', Reason='{vagueness_reason}'\n")
+
+    # --- Construct Structured Result ---
+    result_data = {
+        "type": "result",
+        "term": term,
+        "source": "uspto",
+        "matchType": "unknown", # Default value, will be overwritten
+        "termId": term_id_number if term_id_number != "Not found" else None,
+        "descriptionExample": None, # Initialize
+        "isVague": None, # Initialize as None
+        "vaguenessReasoning": None, # Initialize as None
+        "statusText": "" # Initialize as empty
+    }
+
+    # Determine matchType and set descriptionExample and statusText
+    if is_deleted_description:
+        result_data["matchType"] = "deleted"
+        result_data["descriptionExample"] = description_text # Show the deleted description
+        result_data["statusText"] = f"Deleted description found (Term ID: {term_id_number})"
+    elif found_full_description_match:
+        result_data["matchType"] = "full"
+        result_data["descriptionExample"] = description_text # Show the matched description
+        result_data["statusText"] = f"Full match found (Term ID: {term_id_number})"
+    elif initial_result_type == "template_match":
+        result_data["matchType"] = "partial"
+        result_data["descriptionExample"] = description_text # Example from template
+        result_data["statusText"] = f"Apart of a larger description (Example: {description_text}, Term ID: {term_id_number})"
+    elif found_in_description:
+         result_data["matchType"] = "partial"
+         result_data["descriptionExample"] = description_text # Example from partial match
+         result_data["statusText"] = f"Apart of a larger description (Example: {description_text or 'N/A'}, Term ID: {term_id_number})"
+    elif initial_result_type == "partial" and partial:
+         result_data["matchType"] = "partial"
+         result_data["descriptionExample"] = partial # Example is the prefix
+         result_data["statusText"] = f"Partial prefix match found: '{partial}' (Term ID: {term_id_number}). Consider checking broader term."
+    elif initial_result_type == "larger_description_general":
+         result_data["matchType"] = "partial" # Treat as partial
+         # Use the first description as example
+         first_desc_text = outcome["firstDescription"]
+         result_data["descriptionExample"] = first_desc_text
+         result_data["statusText"] = f"General description listing found (Example: {first_desc_text or 'N/A'}, Term ID: {term_id_number})"
+    elif initial_result_type == "no_match":
+         result_data["matchType"] = "none"
+         result_data["statusText"] = "No match found"
+    else: # Fallback
+         result_data["matchType"] = "unknown"
+         result_data["statusText"] = f"Unknown match type (Initial: {initial_result_type})"
+
+    # Add vagueness info if analysis was performed and successful
+    if vagueness_classification not in ["Not Analyzed", "Error"]:
+        result_data["isVague"] = (vagueness_classification == "Vague")
+        result_data["vaguenessReasoning"] = vagueness_reason
+        # Optionally adjust statusText based on vagueness for non-full/non-deleted matches
+        if result_data["matchType"] not in ["full", "deleted"]:
+             if result_data["isVague"]:
+                  result_data["statusText"] += " - Potentially Vague"
+             else:
+                  result_data["statusText"] += " - Likely Acceptable"
+
+
+    # Update cache with the structured data (skip if Gemini failed so the next run retries it)
+    if vagueness_classification != "Error":
+        get_search_cache().set(cache_key, result_data)
+    return result_data
+
 
+def create_uspto_pool(context) -> PagePool:
+    return PagePool(context, open_uspto_search, USPTO_SEARCH_INPUT, size=CONCURRENT_LIMIT)
+
+
+def create_http_client() -> Optional[UsptoHttpClient]:
+    """Returns an ID Manual HTTP client when the HTTP engine is selected and available."""
+    if USPTO_SEARCH_ENGINE != "http":
+        return None
+    try:
+        return UsptoHttpClient(max_connections=CONCURRENT_LIMIT)
+    except UsptoHttpError as e:
+        sys.stderr.write(f"DEBUG: {e} Using the browser engine.\n")
+        return None
+
+
+async def process_search_terms(terms: List[str], pool: PagePool, cancel_event: asyncio.Event, semaphore: AdaptiveLimiter,
+                               http_client: Optional[UsptoHttpClient] = None) -> None:
+    """Runs search_term for every term on a pool of loaded pages, emitting progress as tasks finish."""
+    lookup = UsptoLookup(pool, http_client) # Prefix probes are shared by every term in this run
+    tasks = {asyncio.create_task(search_term(term, lookup, cancel_event, semaphore)): term for term in terms}
+    completed_count = 0
+    total_terms = len(tasks)
+
+    async for task in as_completed_until_cancelled(tasks, cancel_event):
+        try:
+            # search_term now prints its own JSON result, we just need to wait for completion
+            await task
+            completed_count += 1
+            progress_percent = int((completed_count / total_terms) * 100) if total_terms > 0 else 0
+            emit({"type": "progress", "source": "uspto", "value": progress_percent, "limit": semaphore.limit})
+        except asyncio.CancelledError:
+            sys.stderr.write("DEBUG: A search task was cancelled.\n")
+            # Don't print cancellation here, rely on individual tasks or final check
         except Exception as e:
+            # This might catch errors from within search_term if not handled there
             error_message = str(e)
-            sys.stderr.write(f"DEBUG: Error in search_mgs_term: {error_message}\n")
-            return term, f"MGS Search Error (NICE {'On' if nice_filter else 'Off'}): {error_message}"
-        finally:
-            await page.close()
+            sys.stderr.write(f"ERROR: Uncaught exception during task execution: {error_message}\n")
+            # Attempt to determine the term if possible (might be difficult here)
+            emit({"type": "error", "term": "Unknown", "source": "uspto", "message": f"Unhandled error: {error_message}"})
+
+    sys.stderr.write(f"DEBUG: USPTO lookup stats: {json.dumps(lookup.stats())}\n")
+    # Terms stopped mid-search get a cancelled result; ones that finished or bailed out early already reported
+    for task, term in tasks.items():
+        if task.cancelled() or not task.done():
+            emit(cancelled_result(term, "uspto"))
+
+
+async def process_job(terms: List[str], mgs_tasks: List[Dict], uspto_pool: PagePool, mgs_pool: PagePool,
+                      cancel_event: asyncio.Event, semaphores: Dict[str, AdaptiveLimiter],
+                      http_client: Optional[UsptoHttpClient] = None) -> None:
+    """Runs a mixed job's USPTO terms and MGS tasks concurrently, each source under its own semaphore.
+
+    Results stream as they finish, tagged by source; each source emits its own search_time when done.
+    """
+    async def run_source(source: str, work) -> None:
+        start_time = time.time()
+        try:
+            await work
+        except Exception as e:
+            sys.stderr.write(f"ERROR: {source} search failed: {e}\n")
+            emit({"type": "error", "source": source, "message": f"Error during search setup or browser operation: {e}"})
+        emit({"type": "search_time", "source": source, "value": f"{time.time() - start_time:.2f} seconds"})
 
+    sources = []
+    if terms:
+        sources.append(run_source("uspto", process_search_terms(terms, uspto_pool, cancel_event, semaphores["uspto"], http_client)))
+    if mgs_tasks:
+        sources.append(run_source("mgs", process_mgs_tasks(mgs_tasks, mgs_pool, cancel_event, semaphores["mgs"])))
+    await asyncio.gather(*sources)
 
-async def search_term(term: str, base_url: str, context, cancel_event: asyncio.Event, semaphore: asyncio.Semaphore) -> Tuple[str, str]:
-    if cancel_event.is_set() or os.path.exists(CANCELLATION_FILE):
-        return term, "Cancelled"
-    if term in search_cache:
-        # Ensure cached data is returned in the expected format (full object)
-        cached_data = search_cache[term]
-        if isinstance(cached_data, dict):
-             print(json.dumps(cached_data)) # Print cached object if it's already structured
-             return term, cached_data.get("statusText", "Cached Status Missing")
-        else:
-             # If cache contains old format (just status string), handle gracefully or re-fetch
-             sys.stderr.write(f"DEBUG: Old cache format found for term: {term}. Re-fetching.\n")
-             # Fall through to re-fetch logic
-        
-    async with semaphore:
-        page = await context.new_page()
+
+def create_source_semaphores() -> Dict[str, AdaptiveLimiter]:
+    """Per-source AIMD limiters: each starts small and grows toward its *_CONCURRENCY maximum while the site keeps up."""
+    return {"uspto": AdaptiveLimiter("USPTO", CONCURRENT_LIMIT), "mgs": AdaptiveLimiter("MGS", MGS_CONCURRENT_LIMIT)}
+
+
+def log_concurrency_stats(semaphores: Dict[str, AdaptiveLimiter]) -> None:
+    sys.stderr.write(f"DEBUG: Concurrency stats: {json.dumps({source: limiter.stats() for source, limiter in semaphores.items()})}\n")
+
+
+async def run_searches(terms: List[str], mgs_tasks: Optional[List[Dict]] = None):
+    """Runs USPTO terms and MGS tasks in one process, sharing a single browser between both sources."""
+    cancel_event = asyncio.Event()
+    mgs_tasks = mgs_tasks or []
+
+    context = LazyBrowserContext(ResourcePolicy()) # Only launched if a term actually needs the browser
+    uspto_pool = create_uspto_pool(context)
+    mgs_pool = create_mgs_pool(context)
+    http_client = create_http_client()
+    semaphores = create_source_semaphores()
+    try:
+        async with watch_cancellation(cancel_event): # SIGTERM/SIGINT or the cancellation file
+            await process_job(terms, mgs_tasks, uspto_pool, mgs_pool, cancel_event, semaphores, http_client)
+    finally:
+        log_concurrency_stats(semaphores)
+        sys.stderr.write(f"DEBUG: Circuit breakers: {json.dumps(breaker_stats())}\n")
+        if terms:
+            sys.stderr.write(f"DEBUG: Page pool: {uspto_pool.navigations} navigations, {uspto_pool.reuses} reuses.\n")
+        if mgs_tasks:
+            sys.stderr.write(f"DEBUG: MGS page pool: {mgs_pool.navigations} navigations, {mgs_pool.reuses} reuses.\n")
+        await uspto_pool.close()
+        await mgs_pool.close()
+        if http_client is not None:
+            await http_client.close()
+        await context.close()
+        context.resource_policy.log_stats("Search")
+
+    sys.stderr.write(f"DEBUG: Result cache stats: {json.dumps(get_search_cache().stats())}, LLM cache stats: {json.dumps(get_llm_cache().stats())}\n")
+    if mgs_tasks:
+        sys.stderr.write(f"DEBUG: MGS result cache stats: {json.dumps(get_mgs_search_cache().stats())}\n")
+    sys.stderr.write(f"DEBUG: Gemini client stats: {json.dumps(gemini_stats())}, vagueness batches: {json.dumps(vagueness_batcher.stats())}\n")
+    if get_local_index() is not None:
+        sys.stderr.write(f"DEBUG: Local ID Manual index stats: {json.dumps(get_local_index().stats())}\n")
+
+
+class SearchWorker:
+    """Resident worker for --serve mode: keeps Playwright, the browser context and Gemini warm across requests."""
+
+    def __init__(self):
+        self.context = LazyBrowserContext(ResourcePolicy())
+        self.uspto_pool = create_uspto_pool(self.context)
+        self.mgs_pool = create_mgs_pool(self.context)
+        self.http_client = create_http_client()
+        self.semaphores = create_source_semaphores() # Per-source limits shared by all in-flight jobs
+        self.cancel_events: Dict[str, asyncio.Event] = {}
+        self.jobs: Dict[str, asyncio.Task] = {}
+
+    async def close(self):
+        await self.uspto_pool.close()
+        await self.mgs_pool.close()
+        if self.http_client is not None:
+            await self.http_client.close()
+        await self.context.close()
+        self.context.resource_policy.log_stats("Worker")
+        log_concurrency_stats(self.semaphores)
+        sys.stderr.write(f"DEBUG: Circuit breakers: {json.dumps(breaker_stats())}\n")
+
+    def submit(self, request: Dict) -> None:
+        request_id = str(request.get("id") or f"job-{len(self.jobs) + 1}")
+        self.cancel_events[request_id] = asyncio.Event()
+        self.jobs[request_id] = asyncio.create_task(self.handle(request_id, request))
+
+    async def handle(self, request_id: str, request: Dict) -> None:
+        current_request_id.set(request_id) # Only affects this task and the tasks it spawns
+        op = request.get("op")
+        cancel_event = self.cancel_events[request_id]
         try:
-            await page.goto(base_url, wait_until="networkidle", timeout=0)
-            await page.wait_for_selector("div.main-search input.search-term", timeout=30000)
-            await page.fill("div.main-search input.search-term", term)
-            await page.press("div.main-search input.search-term", "Enter")
-            try:
-                await wait_for_results_update(page)
-            except asyncio.TimeoutError:
-                content = ""
+            if op in ("search", "mgs", "examine"):
+                # "examine" carries both: USPTO terms and MGS tasks run concurrently on the shared browser
+                terms = [t.strip() for t in request.get("terms", []) if isinstance(t, str) and t.strip()] if op != "mgs" else []
+                mgs_tasks = request.get("tasks", []) if op != "search" else []
+                await process_job(terms, mgs_tasks, self.uspto_pool, self.mgs_pool, cancel_event, self.semaphores, self.http_client)
+            elif op == "vagueness":
+                term = request.get("term")
+                if not term:
+                    raise ValueError("'term' is required for the vagueness op.")
+                # One term at a time from the UI: nothing to batch with, so skip the batch window (the LLM cache is checked first)
+                classification, reasoning = await analyze_vagueness_gemini(term)
+                emit({
+                    "type": "vagueness_result",
+                    "term": term,
+                    "isVague": classification == "Vague",
+                    "vaguenessReasoning": reasoning if classification != "Error" else None,
+                    "error": reasoning if classification == "Error" else None
+                })
+            elif op == "suggest":
+                term, reason = request.get("term"), request.get("reason")
+                if not term or not reason:
+                    raise ValueError("'term' and 'reason' are required for the suggest op.")
+                suggestions = await suggest_alternatives_gemini(term, reason, request.get("example"), bool(request.get("fullNiceContext")))
+                emit({"type": "suggestions", "term": term, "suggestions": suggestions})
+            elif op == "classify":
+                terms = [t.strip() for t in request.get("terms", []) if isinstance(t, str) and t.strip()]
+                for record in classify_terms(terms, int(request.get("topK", 3))):
+                    emit(record)
             else:
-                content = (await page.text_content("span.page-results")) or ""
-
-            initial_result_type = ""
-            full_match_prefix = "Displaying search results for:"
-            all_records_prefix = "Displaying all of"
-
-            if content and full_match_prefix in content:
-                displayed_term_match = re.search(rf"{re.escape(full_match_prefix)}\s*\"(.+?)\"", content)
-                if displayed_term_match:
-                    displayed_term = displayed_term_match.group(1).strip()
-                    if normalize_text(term) == normalize_text(displayed_term):
-                        initial_result_type = "full_match_prefix"
-                    else:
-                        initial_result_type = "larger_description_prefix"
-                else:
-                    initial_result_type = "larger_description_prefix_fail"
-            elif content and all_records_prefix in content:
-                initial_result_type = "larger_description_general"
-            elif content and "Displaying" not in content and "No listings found" not in content:
-                partial = await binary_search_partial(term, page, base_url, cancel_event)
-                if partial:
-                    await page.goto(base_url, wait_until="networkidle", timeout=0)
-                    await page.wait_for_selector("div.main-search input.search-term", timeout=30000)
-                    await page.fill("div.main-search input.search-term", partial)
-                    await page.press("div.main-search input.search-term", "Enter")
-                    try:
-                        await wait_for_results_update(page)
-                    except asyncio.TimeoutError:
-                        pass
-
-                    description_cells = await page.query_selector_all("td[data-column='description']")
-
-                    found_in_template = False
-                    template_text = ""
-                    template_id = "Not found"
-                    partial_match_description_example = ""
-                    partial_match_term_id = "Not found"
-
-                    normalized_partial = normalize_text(partial)
-                    partial_words = normalized_partial.split()
-
-                    for cell in description_cells:
-                        cell_text = (await cell.text_content()).strip()
-                        normalized_cell = normalize_text(cell_text)
-                        cell_words = normalized_cell.split()
-
-                        if is_subsequence(partial_words, cell_words):
-                            found_in_template = True
-                            template_text = cell_text
-                            parent_row = await cell.evaluate_handle("node => node.parentElement")
-                            id_element = await parent_row.query_selector("a.view-record")
-                            if id_element:
-                                template_id = (await id_element.text_content()).strip()
-                                partial_match_term_id = template_id
-                            partial_match_description_example = cell_text
-                            break
-
-                    if found_in_template:
-                        initial_result_type = "template_match"
-                        description_text = template_text
-                        term_id_number = template_id
-                    else:
-                        initial_result_type = "partial"
-                        description_text = partial_match_description_example
-                        term_id_number = partial_match_term_id
-
-                else:
-                    initial_result_type = "no_match"
-
-            description_text = None # Reset before checking descriptions
-            term_id_number = "Not found" # Reset before checking descriptions
-            is_deleted_description = False
-            found_full_description_match = False
-            found_in_description = False
-
-            if initial_result_type != "template_match" and initial_result_type != "no_match":
-                view_record_link = await page.query_selector("a.view-record")
-                if view_record_link:
-                    term_id_number = (await view_record_link.text_content()).strip()
-
-                description_cells = await page.query_selector_all("td[data-column='description']")
-
-                matched_cell_text = ""
-
-                for cell in description_cells:
-                    cell_text = (await cell.text_content()).strip()
-                    normalized_cell_text = normalize_text(cell_text)
-                    normalized_term = normalize_text(term)
-
-                    if normalized_term == normalized_cell_text:
-                        found_full_description_match = True
-                        found_in_description = True
-                        description_text = cell_text # Store the exact matching description
-                        parent_row = await cell.evaluate_handle("node => node.parentElement")
-                        status_element = await parent_row.query_selector("td[data-column='status']")
-                        if status_element:
-                            status_text = (await status_element.text_content()).strip()
-                            if status_text == "D":
-                                is_deleted_description = True
-                                # description_text remains the matched text even if deleted
-                                break # Exit loop once deleted full match found
-                        # If not deleted, store ID and break
-                        id_element = await parent_row.query_selector("a.view-record")
-                        if id_element:
-                             term_id_number = (await id_element.text_content()).strip()
-                        break # Exit loop once full match found
-
-                    elif normalized_term in normalized_cell_text:
-                        found_in_description = True
-                        if description_text is None: # Only store the first partial match example
-                            description_text = cell_text
-                        # Check if this partial match is deleted
-                        parent_row = await cell.evaluate_handle("node => node.parentElement")
-                        status_element = await parent_row.query_selector("td[data-column='status']")
-                        if status_element:
-                            status_text = (await status_element.text_content()).strip()
-                            if status_text == "D":
-                                # If a deleted partial match is found, prioritize it as the example?
-                                # Or maybe just note it? For now, let's keep the first non-deleted example if possible.
-                                # If description_text is still None, store this deleted one.
-                                if description_text is None:
-                                     description_text = cell_text
-                                     # Potentially mark this example as coming from a deleted entry?
-                        # Get Term ID for the first partial match found
-                        if term_id_number == "Not found":
-                             id_element = await parent_row.query_selector("a.view-record")
-                             if id_element:
-                                 term_id_number = (await id_element.text_content()).strip()
-                        # Don't break here, continue searching for a full match
-
-                # If no description found yet, and it was a binary search partial, use that partial text
-                if not found_in_description and initial_result_type == "partial" and partial:
-                     description_text = partial # Use the prefix as the example
-
-            vagueness_classification = "Not Analyzed"
-            vagueness_reason = ""
-
-            # Always perform vagueness analysis unless it's a non-deleted full match
-            if not (found_full_description_match and not is_deleted_description):
-                # *** Always analyze the original term for vagueness ***
-                text_to_analyze = term
-
-                sys.stderr.write(f"DEBUG: Analyzing original term for vagueness: '{text_to_analyze}'\n")
-                
-                vagueness_classification, vagueness_reason = analyze_vagueness_gemini(text_to_analyze)
-                
-                sys.stderr.write(f"DEBUG: Vagueness Analysis Results: Classification='{vagueness_classification}', Reason='{vagueness_reason}'\n")
-
-            # --- Construct Structured Result ---
-            result_data = {
-                "type": "result",
-                "term": term,
-                "source": "uspto",
-                "matchType": "unknown", # Default value, will be overwritten
-                "termId": term_id_number if term_id_number != "Not found" else None,
-                "descriptionExample": None, # Initialize
-                "isVague": None, # Initialize as None
-                "vaguenessReasoning": None, # Initialize as None
-                "statusText": "" # Initialize as empty
-            }
-
-            # Determine matchType and set descriptionExample and statusText
-            if is_deleted_description:
-                result_data["matchType"] = "deleted"
-                result_data["descriptionExample"] = description_text # Show the deleted description
-                result_data["statusText"] = f"Deleted description found (Term ID: {term_id_number})"
-            elif found_full_description_match:
-                result_data["matchType"] = "full"
-                result_data["descriptionExample"] = description_text # Show the matched description
-                result_data["statusText"] = f"Full match found (Term ID: {term_id_number})"
-            elif initial_result_type == "template_match":
-                result_data["matchType"] = "partial"
-                result_data["descriptionExample"] = description_text # Example from template
-                result_data["statusText"] = f"Apart of a larger description (Example: {description_text}, Term ID: {term_id_number})"
-            elif found_in_description:
-                 result_data["matchType"] = "partial"
-                 result_data["descriptionExample"] = description_text # Example from partial match
-                 result_data["statusText"] = f"Apart of a larger description (Example: {description_text or 'N/A'}, Term ID: {term_id_number})"
-            elif initial_result_type == "partial" and partial:
-                 result_data["matchType"] = "partial"
-                 result_data["descriptionExample"] = partial # Example is the prefix
-                 result_data["statusText"] = f"Partial prefix match found: '{partial}' (Term ID: {term_id_number}). Consider checking broader term."
-            elif initial_result_type == "larger_description_general":
-                 result_data["matchType"] = "partial" # Treat as partial
-                 # Try to get first description as example
-                 first_desc_element = await page.query_selector("td[data-column='description']")
-                 first_desc_text = (await first_desc_element.text_content()).strip() if first_desc_element else None
-                 result_data["descriptionExample"] = first_desc_text
-                 result_data["statusText"] = f"General description listing found (Example: {first_desc_text or 'N/A'}, Term ID: {term_id_number})"
-            elif initial_result_type == "no_match":
-                 result_data["matchType"] = "none"
-                 result_data["statusText"] = "No match found"
-            else: # Fallback
-                 result_data["matchType"] = "unknown"
-                 result_data["statusText"] = f"Unknown match type (Initial: {initial_result_type})"
-
-            # Add vagueness info if analysis was performed and successful
-            if vagueness_classification not in ["Not Analyzed", "Error"]:
-                result_data["isVague"] = (vagueness_classification == "Vague")
-                result_data["vaguenessReasoning"] = vagueness_reason
-                # Optionally adjust statusText based on vagueness for non-full/non-deleted matches
-                if result_data["matchType"] not in ["full", "deleted"]:
-                     if result_data["isVague"]:
-                          result_data["statusText"] += " - Potentially Vague"
-                     else:
-                          result_data["statusText"] += " - Likely Acceptable"
-
-
-            # Update cache with the structured data
-            search_cache[term] = result_data # Cache the whole object
-
-            # Print the structured JSON result to stdout
-            sys.stderr.write(f"DEBUG: [FINAL_OUTPUT] Term: {term}, Structured Result: {json.dumps(result_data, indent=2)}\n")
-            print(json.dumps(result_data))
-
-            # Return term and statusText (though statusText isn't really used by caller anymore)
-            return term, result_data["statusText"]
+                raise ValueError(f"Unknown op: {op}")
+        except Exception as e:
+            sys.stderr.write(f"DEBUG: Worker request {request_id} ({op}) failed: {e}\n")
+            emit({"type": "error", "message": str(e)})
         finally:
-            await page.close()
+            emit({"type": "done", "op": op})
+            self.cancel_events.pop(request_id, None)
+            self.jobs.pop(request_id, None)
 
 
-async def run_searches(terms: List[str], search_type="uspto"):
-    base_url_uspto = "https://idm-tmng.uspto.gov/id-master-list-public.html"
-    mgs_base_url = "https://webaccess.wipo.int/mgs/" # Correct MGS base URL
+async def serve_requests() -> None:
+    """NDJSON request/response loop over stdin/stdout for --serve mode."""
+    import threading
+    worker = SearchWorker()
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue = asyncio.Queue() # Unbounded: cancel/shutdown must get through while jobs run
+    threading.Thread(target=read_lines_into, args=(loop, lines), daemon=True).start()
+    emit({"type": "ready"})
+
+    try:
+        while True:
+            line = await lines.get()
+            if line is None:
+                break
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object.")
+            except (json.JSONDecodeError, ValueError) as e:
+                emit({"type": "error", "message": f"Invalid request: {e}"})
+                continue
+
+            op = request.get("op")
+            if op == "shutdown":
+                break
+            elif op == "ping":
+                emit({"type": "pong", "id": request.get("id")})
+            elif op == "cancel":
+                # Without a target every in-flight job is cancelled
+                target = request.get("target")
+                for request_id, job_cancel_event in list(worker.cancel_events.items()):
+                    if target is None or request_id == target:
+                        job_cancel_event.set()
+            else:
+                worker.submit(request)
+
+        # Let in-flight jobs finish before tearing the browser down
+        if worker.jobs:
+            await asyncio.gather(*worker.jobs.values(), return_exceptions=True)
+    finally:
+        await worker.close()
+        sys.stderr.write(f"DEBUG: Result cache stats: {json.dumps(get_search_cache().stats())}, LLM cache stats: {json.dumps(get_llm_cache().stats())}\n")
+        sys.stderr.write(f"DEBUG: Gemini client stats: {json.dumps(gemini_stats())}, vagueness batches: {json.dumps(vagueness_batcher.stats())}\n")
+
+async def run_stream_job() -> None:
+    """--stream mode: reads NDJSON job records from stdin and schedules each one as it arrives.
+
+    Records are {"source": "uspto", "term": ...} or {"source": "mgs", "term": ..., "needsNiceOn": ...,
+    "needsNiceOff": ...}; EOF or {"type": "end"} ends the job. Results are written as they complete.
+    """
+    import threading
+    worker = SearchWorker() # Same browser, pools and per-source limits as the resident worker
     cancel_event = asyncio.Event()
-    semaphore = asyncio.Semaphore(CONCURRENT_LIMIT)
-    results = {}
+    lookup = UsptoLookup(worker.uspto_pool, worker.http_client)
+    mgs_inflight = SingleFlight()
     start_time = time.time()
 
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-
-            tasks = []
-            for term in terms:
-                # Only handle uspto search type in this script
-                if search_type == "uspto":
-                    task = asyncio.create_task(search_term(term, base_url_uspto, context, cancel_event, semaphore))
-                    tasks.append(task)
-                else:
-                    # Log an error if called with an unexpected type, but don't handle MGS
-                    sys.stderr.write(f"ERROR: search_script.py called with invalid search_type: {search_type}\n")
-                    print(json.dumps({"type": "error", "message": f"search_script.py does not handle search type '{search_type}'"}))
-                    continue # Skip to next term
-
-            completed_count = 0
-            total_terms = len(tasks) # Total terms is now just the number of USPTO tasks
-
-            for task in asyncio.as_completed(tasks):
-                if os.path.exists(CANCELLATION_FILE):
-                    cancel_event.set() # Signal cancellation to other tasks
-                    break
-                try:
-                    # search_term now prints its own JSON result, we just need to wait for completion
-                    await task
-                    completed_count += 1
-                    progress_percent = int((completed_count / total_terms) * 100) if total_terms > 0 else 0
-                    print(json.dumps({"type": "progress", "value": progress_percent}))
-                except asyncio.CancelledError:
-                    sys.stderr.write("DEBUG: A search task was cancelled.\n")
-                    # Don't print cancellation here, rely on individual tasks or final check
-                except Exception as e:
-                    # This might catch errors from within search_term if not handled there
-                    error_message = str(e)
-                    sys.stderr.write(f"ERROR: Uncaught exception during task execution: {error_message}\n")
-                    # Attempt to determine the term if possible (might be difficult here)
-                    print(json.dumps({"type": "error", "term": "Unknown", "source": "uspto", "message": f"Unhandled error: {error_message}"}))
-
-            # Check if cancellation happened
-            if cancel_event.is_set():
-                 print(json.dumps({"type": "result", "term": "Cancelled", "source": "uspto", "matchType": "cancelled", "statusText": "Search Cancelled"}))
-
-
-            await context.close()
-            await browser.close()
+    async def run_uspto(record: Dict) -> None:
+        await search_term(record["term"], lookup, cancel_event, worker.semaphores["uspto"])
 
-    except Exception as e:
-        error_message = str(e)
-        print(json.dumps({"type": "error", "message": f"Error during search setup or browser operation: {error_message}"}))
+    async def run_mgs(record: Dict) -> None:
+        for result in await search_mgs_term(record["term"], worker.mgs_pool, cancel_event, worker.semaphores["mgs"], mgs_nice_filters(record),
+                                            mgs_inflight):
+            emit(result)
+
+    def report_cancelled(source: str, record: Dict) -> None:
+        if source == "mgs":
+            for nice_filter in mgs_nice_filters(record):
+                emit(cancelled_result(record["term"], f"mgs-nice-{nice_label(nice_filter)}"))
+        else:
+            emit(cancelled_result(record["term"], source))
 
-    elapsed_time = time.time() - start_time
-    # Send final time report
-    print(json.dumps({"type": "search_time", "source": search_type, "value": f"{elapsed_time:.2f} seconds"}))
-    # run_searches doesn't need to return results dict anymore as results are printed directly
-    # return results
+    stream = JobStream({"uspto": run_uspto, "mgs": run_mgs}, STREAM_MAX_IN_FLIGHT, on_cancelled=report_cancelled,
+                       limits=worker.semaphores)
+    lines: asyncio.Queue = asyncio.Queue(maxsize=DEFAULT_LINE_BUFFER)
+    threading.Thread(target=read_lines_into, args=(asyncio.get_running_loop(), lines, cancel_event), daemon=True).start()
+    try:
+        async with watch_cancellation(cancel_event): # SIGTERM/SIGINT, the cancellation file or a {"type": "cancel"} line
+            await stream.run(lines, cancel_event)
+        stream.report_times(start_time)
+    finally:
+        await worker.close()
+        sys.stderr.write(f"DEBUG: Job stream stats: {json.dumps(stream.stats())}, USPTO lookup stats: {json.dumps(lookup.stats())}, "
+                         f"MGS term lookups: {json.dumps(mgs_inflight.stats())}\n")
+        sys.stderr.write(f"DEBUG: Result cache stats: {json.dumps(get_search_cache().stats())}, LLM cache stats: {json.dumps(get_llm_cache().stats())}\n")
+        sys.stderr.write(f"DEBUG: Gemini client stats: {json.dumps(gemini_stats())}, vagueness batches: {json.dumps(vagueness_batcher.stats())}\n")
+
+async def run_sharded_job(workers: int, records: Optional[List[Dict]] = None) -> None:
+    """--workers N: shards one job across N --stream worker processes, each with its own browser.
+
+    Job records come from `records` (search mode) or as NDJSON on stdin (--stream). Every site's
+    concurrency budget and Gemini's are split between the workers (see shard_coordinator.worker_env).
+    """
+    import threading
+    cancel_event = asyncio.Event()
+    budgets = {
+        "USPTO_CONCURRENCY": CONCURRENT_LIMIT,
+        "MGS_CONCURRENCY": MGS_CONCURRENT_LIMIT,
+        "GEMINI_CONCURRENCY": int(os.environ.get("GEMINI_CONCURRENCY", GEMINI_DEFAULT_CONCURRENCY)),
+        "GEMINI_RPM": float(os.environ.get("GEMINI_RPM", GEMINI_DEFAULT_RPM)),
+        "STREAM_MAX_IN_FLIGHT": STREAM_MAX_IN_FLIGHT,
+    }
+    coordinator = ShardCoordinator(workers, {"uspto": normalize_text, "mgs": normalize_mgs_text}, worker_env(workers, budgets, {"USPTO_SEARCH_ENGINE": USPTO_SEARCH_ENGINE}))
+    if records is None:
+        lines: asyncio.Queue = asyncio.Queue(maxsize=DEFAULT_LINE_BUFFER)
+        threading.Thread(target=read_lines_into, args=(asyncio.get_running_loop(), lines, cancel_event), daemon=True).start()
+    else:
+        lines = asyncio.Queue()
+        for record in records:
+            lines.put_nowait(json.dumps(record))
+        lines.put_nowait(None)
+    try:
+        async with watch_cancellation(cancel_event): # SIGTERM/SIGINT, the cancellation file or a {"type": "cancel"} line
+            await coordinator.run(lines, cancel_event)
+    finally:
+        sys.stderr.write(f"DEBUG: Sharded job stats: {json.dumps(coordinator.stats())}\n")
+
+def profile_startup() -> Dict:
+    """Times module import stages plus each dependency the modes load lazily (for --startup-profile)."""
+    import importlib
+    import_ms = {name: round((at - _startup_marks[i][1]) * 1000, 1) for i, (name, at) in enumerate(_startup_marks[1:])}
+    lazy_ms: Dict[str, object] = {}
+
+    def timed(stage: str, load) -> None:
+        started = time.perf_counter()
+        try:
+            loaded = load()
+        except Exception as e:
+            lazy_ms[stage] = f"unavailable: {e}"
+            return
+        lazy_ms[stage] = round((time.perf_counter() - started) * 1000, 1) if loaded is not None else "unavailable"
+
+    timed("nice_text", lambda: importlib.import_module("nice_text"))
+    timed("nice_index", get_nice_index)
+    timed("nice_classifier", get_nice_classifier) # numpy import + matrix build
+    timed("gemini", get_gemini_client) # google.generativeai import + configure
+    timed("playwright", lambda: importlib.import_module("playwright.async_api"))
+    timed("httpx", lambda: importlib.import_module("httpx"))
+    timed("local_index", get_local_index)
+    return {
+        "type": "startup_profile",
+        "importMs": import_ms,
+        "totalImportMs": round((_startup_marks[-1][1] - _startup_marks[0][1]) * 1000, 1),
+        "lazyMs": lazy_ms,
+    }
 
 if __name__ == "__main__":
     # --- Argument Parsing and Mode Handling ---
@@ -1621,23 +1230,54 @@ if __name__ == "__main__":
     mode_group = parser.add_mutually_exclusive_group()
     mode_group.add_argument('--suggest', action='store_true', help='Run in suggestion mode')
     mode_group.add_argument('--vagueness-only', action='store_true', help='Run only vagueness analysis for a single term') # New mode
+    mode_group.add_argument('--serve', action='store_true', help='Run as a resident worker reading NDJSON requests from stdin')
+    mode_group.add_argument('--stream', action='store_true', help='Run one search job whose USPTO terms and MGS tasks arrive as NDJSON records on stdin')
+    mode_group.add_argument('--startup-profile', action='store_true', help='Report import time per startup stage and per lazily loaded dependency, then exit')
+    mode_group.add_argument('--classify', action='store_true', help='Predict NICE classes locally for the given terms (no Gemini or browser)')
 
     # Arguments for suggestion mode (only relevant if --suggest is used)
     parser.add_argument('--term', help='The term for suggestion or vagueness-only mode')
     parser.add_argument('--reason', help='The reason the term is vague (for suggestion mode)')
     parser.add_argument('--example', help='An example description found during search (optional, for suggestion mode)')
+    parser.add_argument('--top-classes', type=int, default=3, help='Number of ranked classes per term (for classify mode)')
+    parser.add_argument('--full-nice-context', action='store_true', help='Send the whole NICE text with the suggestion prompt instead of the most relevant classes')
 
     # Arguments for search mode (default if --suggest or --vagueness-only are not used)
-    parser.add_argument('--search_type', default='uspto', choices=['uspto'], help='Type of search to perform (only uspto supported by this script)') # Only uspto now
+    parser.add_argument('--search_type', default='uspto', choices=['uspto', 'all'], help="Type of search to perform; 'all' also runs the MGS tasks given in the MGS_TASKS_JSON env var")
+    parser.add_argument('--engine', choices=['browser', 'http'], help='USPTO lookup engine (default: USPTO_SEARCH_ENGINE env var or browser)')
+    parser.add_argument('--workers', type=int, default=SEARCH_WORKERS, help='Shard search and --stream jobs across this many worker processes, each with its own browser (default: SEARCH_WORKERS env var or 1)')
     # Optional positional argument for search terms string
     parser.add_argument('search_terms_string', nargs='?', default=None, help='Semicolon/newline separated search terms (for search mode)')
 
     # Parse arguments
     args = parser.parse_args()
+    if args.engine:
+        USPTO_SEARCH_ENGINE = args.engine
 
     # --- Mode Handling ---
 
-    if args.vagueness_only:
+    if args.startup_profile:
+        emit(profile_startup())
+        sys.exit(0)
+
+    elif args.stream:
+        # --- Streaming Job Mode ---
+        sys.stderr.write("DEBUG: Running in Stream Mode\n")
+        clear_cancellation_file()
+        if args.workers > 1:
+            sys.stderr.write(f"DEBUG: Sharding the stream across {args.workers} workers\n")
+            asyncio.run(run_sharded_job(args.workers))
+        else:
+            asyncio.run(run_stream_job())
+        sys.exit(0)
+
+    elif args.serve:
+        # --- Resident Worker Mode ---
+        sys.stderr.write("DEBUG: Running in Serve Mode\n")
+        asyncio.run(serve_requests())
+        sys.exit(0)
+
+    elif args.vagueness_only:
         # --- Vagueness Only Mode ---
         if not args.term:
             print(json.dumps({"type": "error", "message": "--term is required for --vagueness-only mode."}))
@@ -1648,12 +1288,8 @@ if __name__ == "__main__":
              print(json.dumps({"type": "error", "message": "GEMINI_API_KEY not configured for vagueness check."}))
              sys.exit(1)
         try:
-             # Ensure configuration happens if not already done
-             if 'gemini_model' not in globals():
-                  genai.configure(api_key=GEMINI_API_KEY)
-                  gemini_model = genai.GenerativeModel('gemini-1.5-flash-latest')
 
-             classification, reasoning = analyze_vagueness_gemini(args.term)
+             classification, reasoning = asyncio.run(analyze_vagueness_gemini(args.term))
              # Print ONLY the vagueness result JSON
              print(json.dumps({
                  "type": "vagueness_result", # Specific type for this mode
@@ -1668,6 +1304,22 @@ if __name__ == "__main__":
              print(json.dumps({"type": "error", "term": args.term, "message": f"Failed to analyze vagueness: {vague_error}"}))
              sys.exit(1)
 
+    elif args.classify:
+        # --- Local NICE Classification Mode ---
+        classify_text = args.search_terms_string if args.search_terms_string is not None else (sys.stdin.read() if not sys.stdin.isatty() else "")
+        terms = [term.strip() for term in re.split(r'[\n;]+', classify_text) if term.strip()]
+        if not terms:
+            print(json.dumps({"type": "error", "message": "No terms to classify."}))
+            sys.exit(1)
+        from nice_classifier import NiceClassifierError
+        try:
+            for record in classify_terms(terms, args.top_classes):
+                emit(record)
+        except NiceClassifierError as classify_error:
+            print(json.dumps({"type": "error", "message": str(classify_error)}))
+            sys.exit(1)
+        sys.exit(0)
+
     elif args.suggest:
         # --- Suggestion Mode ---
         if not args.term or not args.reason:
@@ -1680,12 +1332,8 @@ if __name__ == "__main__":
              print(json.dumps({"type": "error", "message": "GEMINI_API_KEY not configured for suggestions."}))
              sys.exit(1)
         try:
-             # Ensure configuration happens if not already done (though it should be at top level)
-             if 'gemini_model' not in globals():
-                  genai.configure(api_key=GEMINI_API_KEY)
-                  gemini_model = genai.GenerativeModel('gemini-1.5-flash-latest')
 
-             suggestions = suggest_alternatives_gemini(args.term, args.reason, args.example)
+             suggestions = asyncio.run(suggest_alternatives_gemini(args.term, args.reason, args.example, args.full_nice_context))
              print(json.dumps({"type": "suggestions", "term": args.term, "suggestions": suggestions}))
         except Exception as suggest_error:
              # Catch potential errors during suggestion call itself
@@ -1704,12 +1352,8 @@ if __name__ == "__main__":
              print(json.dumps({"type": "error", "message": "GEMINI_API_KEY not configured for vagueness check."}))
              sys.exit(1)
         try:
-             # Ensure configuration happens if not already done
-             if 'gemini_model' not in globals():
-                  genai.configure(api_key=GEMINI_API_KEY)
-                  gemini_model = genai.GenerativeModel('gemini-1.5-flash-latest')
 
-             classification, reasoning = analyze_vagueness_gemini(args.term)
+             classification, reasoning = asyncio.run(analyze_vagueness_gemini(args.term))
              # Print ONLY the vagueness result JSON
              print(json.dumps({
                  "term": args.term,
@@ -1739,25 +1383,33 @@ if __name__ == "__main__":
 
 
         search_type = args.search_type.lower()
-        if search_type not in ["uspto"]: # Only USPTO is handled by this script's run_searches
-             print(json.dumps({"type": "error", "message": f"Invalid or unsupported search type for this script: {search_type}"}))
-             sys.exit(1)
-
-        if os.path.exists(CANCELLATION_FILE):
+        mgs_tasks = []
+        if search_type == "all":
+            # Same task format as mgs_search_script.py: [{"term", "needsNiceOn", "needsNiceOff"}, ...]
             try:
-                os.remove(CANCELLATION_FILE)
-                sys.stderr.write("DEBUG: Removed existing cancellation file.\n")
-            except OSError as e:
-                sys.stderr.write(f"WARN: Could not remove cancellation file: {e}\n")
+                mgs_tasks = json.loads(os.environ.get('MGS_TASKS_JSON') or "[]")
+                if not isinstance(mgs_tasks, list):
+                    raise ValueError("MGS_TASKS_JSON must be a JSON list of tasks.")
+            except (json.JSONDecodeError, ValueError) as e:
+                print(json.dumps({"type": "error", "message": f"Invalid MGS tasks: {e}"}))
+                sys.exit(1)
+
+        clear_cancellation_file()
 
 
         # Get terms from the description text (either from arg or stdin)
         terms = [term.strip() for term in re.split(r'[\n;]+', description_text) if term.strip()]
 
-        if not terms:
+        if not terms and not mgs_tasks:
              print(json.dumps({"type": "error", "message": "No valid search terms found."}))
              sys.exit(1)
 
-        sys.stderr.write(f"DEBUG: Running in Search Mode (Type: {search_type}), Terms: {terms}\n")
+        sys.stderr.write(f"DEBUG: Running in Search Mode (Type: {search_type}), Terms: {terms}, MGS tasks: {len(mgs_tasks)}\n")
         # Run the main search workflow
-        asyncio.run(run_searches(terms, search_type))
+        workers = min(args.workers, len(terms) + len(mgs_tasks))
+        if workers > 1:
+            records = [{"source": "uspto", "term": term} for term in terms]
+            records += [{**task, "source": "mgs"} for task in mgs_tasks if isinstance(task, dict) and task.get("term")]
+            asyncio.run(run_sharded_job(workers, records))
+        else:
+            asyncio.run(run_searches(terms, mgs_tasks))
@@ -0,0 +1,255 @@
+# python/shard_coordinator.py
+import os
+import sys
+import json
+import time
+import zlib
+import signal
+import asyncio
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from stream_output import emit
+from job_stream import parse_job_record, unless_cancelled
+from cancellation import CLOSE_TIMEOUT_SECONDS, cancelled_result
+from mgs_search_script import mgs_nice_filters, nice_label
+
+SEARCH_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "search_script.py")
+SOURCES = ("uspto", "mgs")
+# A cancelled worker closes its pools, context and browser, each step bounded by CLOSE_TIMEOUT_SECONDS
+WORKER_EXIT_TIMEOUT = CLOSE_TIMEOUT_SECONDS * 4
+WORKER_LINE_LIMIT = 2 ** 22 # Result records with long listings exceed asyncio's 64 KiB default
+CANCEL_LINE = (json.dumps({"type": "cancel"}) + "\n").encode("utf-8")
+END_LINE = (json.dumps({"type": "end"}) + "\n").encode("utf-8")
+
+
+def shard_index(key: str, workers: int) -> int:
+    """Stable across processes and runs (unlike hash()), so equal keys always land on the same worker."""
+    return zlib.crc32(key.encode("utf-8")) % workers
+
+
+def result_sources(record: Dict) -> List[str]:
+    """The sources a job record's results are reported under: "uspto", or one "mgs-nice-*" per NICE setting."""
+    if record["source"] == "mgs":
+        return [f"mgs-nice-{nice_label(nice_filter)}" for nice_filter in mgs_nice_filters(record)]
+    return [record["source"]]
+
+
+def worker_env(workers: int, budgets: Dict[str, float], overrides: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Environment for each worker: its share of every process-wide budget, so N workers put no more
+    load on USPTO, WIPO or Gemini than one process would."""
+    env = dict(os.environ)
+    for name, total in budgets.items():
+        env[name] = str(max(1, int(total) // workers)) if isinstance(total, int) else f"{total / workers:g}"
+    env.update(overrides or {})
+    env["SEARCH_WORKERS"] = "1" # Workers must not shard again
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+
+class _Worker:
+    def __init__(self, index: int, process: asyncio.subprocess.Process):
+        self.index = index
+        self.process = process
+        self.routed: Counter = Counter() # Records sent, per source
+        self.pending: Counter = Counter() # (result source, term) not reported yet
+        self.completed: Dict[str, int] = {} # Per source, from the worker's own progress records
+        self.limits: Dict[str, int] = {}
+        self.exit_code: Optional[int] = None
+
+    def send(self, line: bytes) -> bool:
+        if self.process.returncode is not None or self.process.stdin.is_closing():
+            return False
+        try:
+            self.process.stdin.write(line)
+            return True
+        except (BrokenPipeError, ConnectionResetError):
+            return False
+
+
+class ShardCoordinator:
+    """Runs one search job across `workers` `search_script.py --stream` processes (--workers N).
+
+    Each worker has its own event loop and browser. Job records are routed by a stable hash of
+    `shard_keys[source](term)`, each source's own normal form, so spellings that source treats as
+    equal meet in one worker and share its in-flight lookup and its share of the result cache. Workers' result, error and metric records pass straight
+    through. Their progress is folded into one record per source against every record received.
+    Each source's search_time is reported once at the end. Cancellation is forwarded to every
+    worker as a cancel line plus SIGTERM (POSIX only). A worker that exits early has its
+    unreported terms answered with errors, so the job still finishes.
+    """
+
+    def __init__(self, workers: int, shard_keys: Dict[str, Callable[[str], str]], env: Dict[str, str]):
+        self.worker_count = max(1, workers)
+        self.shard_keys = shard_keys
+        self.env = env
+        self.workers: List[_Worker] = []
+        self.received: Counter = Counter()
+        self.rejected = 0
+        self.finished_at: Dict[str, float] = {}
+        self.cancelled = False
+
+    async def run(self, lines: asyncio.Queue, cancel_event: asyncio.Event) -> None:
+        """Routes `lines` (job records, then None) to the workers until EOF, {"type": "end"} or cancellation."""
+        started = time.time()
+        for index in range(self.worker_count):
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, SEARCH_SCRIPT, "--stream", env=self.env, limit=WORKER_LINE_LIMIT,
+                stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE) # stderr is shared with ours
+            self.workers.append(_Worker(index, process))
+        readers = [asyncio.create_task(self._read(worker)) for worker in self.workers]
+        cancel_wait = asyncio.ensure_future(cancel_event.wait())
+        try:
+            await self._route(lines, cancel_wait)
+            if not cancel_event.is_set():
+                for worker in self.workers:
+                    worker.send(END_LINE) # stdin stays open so a later cancel can still get through
+                await unless_cancelled(asyncio.wait(readers), cancel_wait)
+            if cancel_event.is_set():
+                self.cancelled = True
+                self._forward_cancel()
+                self._report_unrouted(lines)
+                _, stuck = await asyncio.wait(readers, timeout=WORKER_EXIT_TIMEOUT)
+                for worker, reader in zip(self.workers, readers):
+                    if reader in stuck and worker.process.returncode is None:
+                        sys.stderr.write(f"WARN: Search worker {worker.index + 1} did not stop; killing it.\n")
+                        worker.process.kill()
+            await asyncio.gather(*readers, return_exceptions=True)
+        finally:
+            cancel_wait.cancel()
+            for worker in self.workers:
+                if worker.process.returncode is None:
+                    worker.process.kill()
+                if not worker.process.stdin.is_closing():
+                    worker.process.stdin.close()
+        self.report_times(started)
+
+    async def _route(self, lines: asyncio.Queue, cancel_wait: asyncio.Future) -> None:
+        while True:
+            line = await unless_cancelled(lines.get(), cancel_wait)
+            if line is None:
+                return # EOF or cancelled
+            if not line.strip():
+                continue
+            try:
+                record = parse_job_record(line, SOURCES)
+            except (json.JSONDecodeError, ValueError) as e:
+                self.rejected += 1
+                emit({"type": "error", "message": f"Invalid job record: {e}"})
+                continue
+            if record.get("type") == "end":
+                return
+            source = record["source"]
+            worker = self.workers[shard_index(self.shard_keys[source](record["term"]), len(self.workers))]
+            self.received[source] += 1
+            worker.routed[source] += 1
+            for result_source in result_sources(record):
+                worker.pending[(result_source, record["term"])] += 1
+            if worker.send((json.dumps(record) + "\n").encode("utf-8")):
+                try:
+                    await unless_cancelled(worker.process.stdin.drain(), cancel_wait) # Back-pressure from the worker
+                except (BrokenPipeError, ConnectionResetError):
+                    pass # The worker is gone; its reader reports what it left unanswered
+            elif worker.exit_code is not None:
+                self._report_lost(worker) # Exited before this record was routed to it
+
+    async def _read(self, worker: _Worker) -> None:
+        async for raw in worker.process.stdout:
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                sys.stderr.write(f"WARN: Unparseable output from search worker {worker.index + 1}: {raw[:200]!r}\n")
+                continue
+            kind = record.get("type")
+            if kind == "progress":
+                self._merge_progress(worker, record)
+                continue
+            if kind == "search_time":
+                continue # Reported once per source by report_times
+            if kind in ("result", "error"):
+                key = (record.get("source"), record.get("term"))
+                if worker.pending[key] > 0:
+                    worker.pending[key] -= 1
+            emit(record)
+        worker.exit_code = await worker.process.wait()
+        if worker.exit_code != 0:
+            sys.stderr.write(f"WARN: Search worker {worker.index + 1} exited with code {worker.exit_code}.\n")
+        self._report_lost(worker)
+
+    def _merge_progress(self, worker: _Worker, record: Dict) -> None:
+        source = record.get("source")
+        worker.completed[source] = int(record.get("completed", 0))
+        if "limit" in record:
+            worker.limits[source] = record["limit"]
+        self.finished_at[source] = time.time()
+        self._emit_progress(source)
+
+    def _emit_progress(self, source: str) -> None:
+        completed = sum(worker.completed.get(source, 0) for worker in self.workers)
+        received = self.received[source]
+        progress = {
+            "type": "progress",
+            "source": source,
+            "value": min(100, int(completed / received * 100)) if received else 100,
+            "completed": completed,
+            "received": received,
+        }
+        limits = [worker.limits[source] for worker in self.workers if source in worker.limits]
+        if limits:
+            progress["limit"] = sum(limits) # Pages in flight across all workers
+        emit(progress)
+
+    def _report_lost(self, worker: _Worker) -> None:
+        """Answers the terms an exited worker never reported, then counts its records as done."""
+        lost = +worker.pending
+        if not lost:
+            return
+        worker.pending.clear()
+        for (source, term), count in lost.items():
+            for _ in range(count):
+                if self.cancelled:
+                    emit(cancelled_result(term, source))
+                else:
+                    emit({"type": "error", "term": term, "source": source, "errorKind": "worker_exit",
+                          "message": f"Search worker {worker.index + 1} exited (code {worker.exit_code}) before reporting this term"})
+        worker.completed = dict(worker.routed)
+        for source in worker.routed:
+            self._emit_progress(source)
+
+    def _forward_cancel(self) -> None:
+        for worker in self.workers:
+            if worker.process.returncode is not None:
+                continue
+            worker.send(CANCEL_LINE)
+            if os.name != "nt": # On Windows SIGTERM would kill the worker outright; it gets the line and the cancellation file
+                try:
+                    worker.process.send_signal(signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+    def _report_unrouted(self, lines: asyncio.Queue) -> None:
+        """Records read but never routed to a worker when the job was cancelled."""
+        while not lines.empty():
+            line = lines.get_nowait()
+            try:
+                record = parse_job_record(line, SOURCES) if line and line.strip() else None
+            except (json.JSONDecodeError, ValueError):
+                record = None
+            if record is not None and record.get("type") != "end":
+                for result_source in result_sources(record):
+                    emit(cancelled_result(record["term"], result_source))
+
+    def report_times(self, started: float) -> None:
+        """Emits one search_time per source that received work (start of the job to its last completion)."""
+        for source in self.received:
+            elapsed = self.finished_at.get(source, time.time()) - started
+            emit({"type": "search_time", "source": source, "value": f"{elapsed:.2f} seconds"})
+
+    def stats(self) -> Dict:
+        return {
+            "workers": len(self.workers),
+            "received": dict(self.received),
+            "perWorker": [dict(worker.routed) for worker in self.workers],
+            "exitCodes": [worker.exit_code for worker in self.workers],
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,54 @@
+# python/singleflight.py
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+        self.abandoned = False # Cancelled because every caller left; new callers start over
+
+
+class SingleFlight:
+    """Coalesces concurrent lookups that share a key into one in-flight operation.
+
+    The first caller for a key starts `operation` as its own task; callers arriving while it runs
+    wait for the same task and get the same result (or exception). The result object is shared,
+    so callers copy it before changing it. A caller being cancelled does not stop the lookup for
+    the others; the task is only cancelled once every caller waiting on it has gone. Keys are
+    forgotten when their task finishes, so this dedups in-flight work only; the result cache
+    covers the rest.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    async def run(self, key: str, operation: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is None or call.abandoned:
+            call = _Call(asyncio.create_task(operation()))
+            call.task.add_done_callback(lambda _, key=key, call=call: self._forget(key, call))
+            self._calls[key] = call
+            self.started += 1
+        else:
+            self.coalesced += 1
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.abandoned = True
+                call.task.cancel()
+
+    def stats(self) -> Dict:
+        return {"started": self.started, "coalesced": self.coalesced, "inFlight": len(self._calls)}
@@ -0,0 +1,45 @@
+# python/spans.py
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+from stream_output import emit
+from resilience import current_stage, mark_stage
+
+# Off by default: one record per stage per term adds up, and the app only needs them when profiling
+METRICS_ENABLED = os.environ.get("SEARCH_METRICS", "off").lower() == "on"
+
+_current_term: ContextVar[Optional[Tuple[str, str]]] = ContextVar("current_term", default=None)
+
+
+def bind_term(term: str, source: str) -> None:
+    """Tags spans from the current task, and the tasks it starts, with the term and source."""
+    _current_term.set((term, source))
+
+
+@contextmanager
+def span(stage: str):
+    """Times the enclosed step of a term's pipeline.
+
+    With SEARCH_METRICS=on each span is emitted as {"type": "metric", "stage", "ms", "ok", "term",
+    "source"}. The step is also marked as the term's current stage for run_term's deadline errors;
+    a step that fails keeps its mark, so the error names it.
+    """
+    previous = current_stage()
+    mark_stage(stage)
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        if ok and previous is not None:
+            mark_stage(previous)
+        if METRICS_ENABLED:
+            record = {"type": "metric", "stage": stage, "ms": round((time.perf_counter() - started) * 1000, 2), "ok": ok}
+            bound = _current_term.get()
+            if bound is not None:
+                record["term"], record["source"] = bound
+            emit(record)
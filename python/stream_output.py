@@ -0,0 +1,23 @@
+# python/stream_output.py
+import sys
+import json
+import threading
+import contextvars
+from typing import Optional, Dict
+
+# Set by the --serve worker for the duration of a request so every record
+# printed on its behalf (results, progress, errors) carries the request id.
+current_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_request_id", default=None)
+
+_write_lock = threading.Lock() # Gemini calls run in worker threads; keep lines from interleaving
+
+
+def emit(record: Dict) -> None:
+    """Write one NDJSON record to stdout, tagged with the active request id (if any)."""
+    request_id = current_request_id.get()
+    if request_id is not None and "id" not in record:
+        record = {**record, "id": request_id}
+    line = json.dumps(record)
+    with _write_lock:
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
@@ -0,0 +1,141 @@
+# python/term_matching.py
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set
+
+FULL = "full"
+PARTIAL = "partial"
+SUBSEQUENCE = "subsequence"
+
+_ID_MANUAL_DROP = str.maketrans("", "", "-,")
+
+
+class _WordsAndSpaces(dict):
+    """str.translate table dropping what re's [^\\w\\s] matches; each character is classified once, on first sight."""
+
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        kept = code if char.isalnum() or char == "_" or char.isspace() else None
+        self[code] = kept
+        return kept
+
+
+_MGS_DROP = _WordsAndSpaces()
+
+
+def normalize_text(text: str) -> str:
+    """Comparison form of ID Manual (USPTO) text: hyphens and commas dropped, whitespace collapsed, lowercased.
+
+    Result-cache keys and the local index's stored descriptions use it too, so a change here
+    means re-importing the index.
+    """
+    return " ".join(text.translate(_ID_MANUAL_DROP).split()).lower()
+
+
+def normalize_mgs_text(text: str) -> str:
+    """Comparison form of MGS text: lowercased, whitespace collapsed, then everything but word characters and spaces dropped.
+
+    Punctuation goes after the whitespace collapse, so "a - b" keeps a double space, on the term
+    and on the hit list alike.
+    """
+    return " ".join(text.lower().split()).translate(_MGS_DROP).strip()
+
+
+def is_subsequence(small: Sequence[str], big: Sequence[str]) -> bool:
+    """Whether the words of `small` appear in `big` in the same order, not necessarily adjacent."""
+    remaining = iter(big)
+    return all(word in remaining for word in small)
+
+
+class TermMatch(NamedTuple):
+    kind: str # FULL, PARTIAL or SUBSEQUENCE
+    term: str # As given to the matcher
+    index: int # Position of the matching text in the scanned sequence
+
+
+class TermMatcher:
+    """Finds many terms in many texts, reading each normalized text once (Aho-Corasick).
+
+    A text equal to a term after normalization is a FULL match. A text containing it is PARTIAL,
+    with the live searches' `term in text` semantics, so the term may begin or end inside a word.
+    With `subsequences=True`, a text holding the term's words in order but not adjacent is a
+    SUBSEQUENCE match; that check is per term and only runs for terms the automaton did not find.
+    Spellings that normalize alike are all reported. A single term skips the automaton and uses
+    str's own substring search.
+    """
+
+    def __init__(self, terms: Iterable[str], normalize: Callable[[str], str] = normalize_text):
+        self.normalize = normalize
+        self.spellings: Dict[str, List[str]] = {} # Normalized term -> the spellings given, in order
+        for term in terms:
+            key = normalize(term)
+            if key:
+                self.spellings.setdefault(key, []).append(term)
+        self._order = {key: position for position, key in enumerate(self.spellings)}
+        self._words = {key: key.split() for key in self.spellings}
+        self._single = next(iter(self.spellings)) if len(self.spellings) == 1 else None
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        if self._single is None:
+            self._build()
+
+    def _build(self) -> None:
+        for key in self.spellings:
+            state = 0
+            for char in key:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(key)
+        # Breadth-first, so every state's failure target is finished before its children need it
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                target = self._fail[state]
+                while target and char not in self._goto[target]:
+                    target = self._fail[target]
+                fallback = self._goto[target].get(char, 0)
+                self._fail[child] = fallback if fallback != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+                queue.append(child)
+
+    def _found_in(self, normalized: str) -> Set[str]:
+        if self._single is not None:
+            return {self._single} if self._single in normalized else set()
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        state = 0
+        for char in normalized:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def scan(self, texts: Iterable[str], subsequences: bool = False, normalized: bool = False) -> Iterator[TermMatch]:
+        """Yields the matches text by text; within a text, in the order the terms were given.
+
+        `normalized=True` says the texts are already in the matcher's normal form (as an index stores them).
+        """
+        for index, text in enumerate(texts):
+            normalized_text = text if normalized else self.normalize(text)
+            found = self._found_in(normalized_text)
+            for key in sorted(found, key=self._order.__getitem__):
+                kind = FULL if key == normalized_text else PARTIAL
+                for term in self.spellings[key]:
+                    yield TermMatch(kind, term, index)
+            if subsequences:
+                words = normalized_text.split()
+                for key, key_words in self._words.items():
+                    if key not in found and is_subsequence(key_words, words):
+                        for term in self.spellings[key]:
+                            yield TermMatch(SUBSEQUENCE, term, index)
+
+    def first(self, texts: Iterable[str]) -> Optional[TermMatch]:
+        """The first FULL or PARTIAL match in `texts`, or None."""
+        return next(self.scan(texts), None)
@@ -0,0 +1,70 @@
+# python/tests/test_adaptive_limit.py
+import asyncio
+
+import pytest
+
+from adaptive_limit import DECREASE_FACTOR, MIN_WINDOW, AdaptiveLimiter
+
+
+async def hold(limiter, seconds=0.01, error=None):
+    async with limiter:
+        await asyncio.sleep(seconds)
+        if error is not None:
+            raise error
+
+
+def run_all(limiter, count, **kwargs):
+    async def run():
+        return await asyncio.gather(*(hold(limiter, **kwargs) for _ in range(count)), return_exceptions=True)
+    return asyncio.run(run())
+
+
+def test_saturated_healthy_windows_add_one_permit_each():
+    limiter = AdaptiveLimiter("test", maximum=20, initial=2, enabled=True)
+    run_all(limiter, MIN_WINDOW * 4)
+    assert limiter.limit == 6 and limiter.increases == 4 and limiter.decreases == 0
+
+
+def test_limit_does_not_grow_unless_it_is_used():
+    limiter = AdaptiveLimiter("test", maximum=20, initial=10, enabled=True)
+    async def run():
+        for _ in range(MIN_WINDOW * 3):
+            await hold(limiter) # One at a time: never saturated
+    asyncio.run(run())
+    assert limiter.limit == 10 and limiter.increases == 0
+
+
+def test_error_shrinks_the_limit_once_per_window():
+    limiter = AdaptiveLimiter("test", maximum=10, initial=10, enabled=True)
+    results = run_all(limiter, 2, error=RuntimeError("HTTP 503"))
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert limiter.limit == int(10 * DECREASE_FACTOR) and limiter.decreases == 1 and limiter.failures == 2
+
+
+def test_latency_spike_shrinks_the_limit():
+    limiter = AdaptiveLimiter("test", maximum=MIN_WINDOW, initial=MIN_WINDOW, enabled=True)
+    run_all(limiter, MIN_WINDOW, seconds=0.01) # Sets the uncongested baseline
+    run_all(limiter, MIN_WINDOW, seconds=0.1)
+    assert limiter.limit == int(MIN_WINDOW * DECREASE_FACTOR) and limiter.decreases == 1
+
+
+def test_limit_stays_within_bounds():
+    limiter = AdaptiveLimiter("test", maximum=3, initial=2, minimum=2, enabled=True)
+    run_all(limiter, MIN_WINDOW * 4)
+    assert limiter.limit == 3
+    run_all(limiter, 1, error=RuntimeError("timeout"))
+    assert limiter.limit == 2
+
+
+@pytest.mark.parametrize("error", [ValueError("HTTP 400"), asyncio.CancelledError()])
+def test_errors_that_are_not_congestion_leave_the_limit_alone(error):
+    limiter = AdaptiveLimiter("test", maximum=10, initial=10, enabled=True,
+                              is_congestion=lambda e: not isinstance(e, ValueError))
+    run_all(limiter, 1, error=error)
+    assert limiter.limit == 10 and limiter.failures == 0 and limiter.in_flight == 0
+
+
+def test_disabled_limiter_is_pinned_at_maximum():
+    limiter = AdaptiveLimiter("test", maximum=10, initial=2, enabled=False)
+    run_all(limiter, 3, error=RuntimeError("HTTP 503"))
+    assert limiter.limit == 10
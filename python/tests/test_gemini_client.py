@@ -0,0 +1,63 @@
+# python/tests/test_gemini_client.py
+import asyncio
+import types
+
+import pytest
+
+import gemini_client
+from gemini_client import GeminiClient
+
+
+class ApiError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class FakeModel:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+
+    async def generate_content_async(self, prompt, **kwargs):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return types.SimpleNamespace(text=outcome)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(gemini_client, "BACKOFF_BASE_SECONDS", 0.0)
+
+
+def make_client(outcomes, max_retries=2):
+    return GeminiClient(FakeModel(outcomes), max_concurrency=8, requests_per_minute=6000, max_retries=max_retries)
+
+
+def test_bad_request_is_not_congestion():
+    client = make_client([ApiError(400)])
+    with pytest.raises(ApiError):
+        asyncio.run(client.generate("prompt"))
+    assert client._limiter.limit == 8 and client._limiter.decreases == 0
+    assert client.calls == 1 and client.failures == 1
+
+
+@pytest.mark.parametrize("error", [ApiError(429), ApiError(503), asyncio.TimeoutError()])
+def test_rate_limits_server_errors_and_timeouts_shrink_the_limit(error):
+    client = make_client([error, "ok"])
+    assert asyncio.run(client.generate("prompt")) == "ok"
+    assert client._limiter.limit < 8 and client.retries == 1
+
+
+def test_token_is_taken_before_a_concurrency_slot():
+    async def run():
+        client = GeminiClient(FakeModel(["ok"]), max_concurrency=1, requests_per_minute=60, max_retries=0)
+        client._bucket.tokens = 0 # The call waits about a second for its token
+        call = asyncio.create_task(client.generate("prompt"))
+        await asyncio.sleep(0.1)
+        in_flight_while_waiting = client._limiter.in_flight
+        call.cancel()
+        await asyncio.gather(call, return_exceptions=True)
+        return in_flight_while_waiting
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,49 @@
+# python/tests/test_id_manual_index.py
+import json
+import time
+import sqlite3
+
+import pytest
+
+from id_manual_index import LocalIdIndex, import_export
+from term_matching import normalize_text
+
+DESCRIPTIONS = [
+    "Downloadable software for use in database management",
+    "Downloadable computer game software",
+    "Software as a service (SaaS) services featuring software for managing databases",
+    "Bags, namely, tote bags and handbags",
+    "Retail store services featuring bags",
+    "Non-downloadable e-books in the field of cooking",
+    "Cooking classes",
+    "T-shirts",
+]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    export = tmp_path / "export.json"
+    export.write_text(json.dumps([{"description": text, "status": "A", "termId": str(i)} for i, text in enumerate(DESCRIPTIONS)]))
+    path = str(tmp_path / "index.sqlite3")
+    import_export(str(export), path)
+    return path
+
+
+@pytest.mark.parametrize("query", ["software", "soft", "ware", "w", "ag", "bags", "nload", "tshirts", "ok", "cooking cl",
+                                   "ware for", "game soft", "zzz", "e"])
+def test_containing_matches_a_substring_scan(index_path, query):
+    index = LocalIdIndex.load(index_path)
+    normalized = normalize_text(query)
+    expected = sorted((i for i, text in enumerate(DESCRIPTIONS) if normalized in normalize_text(text)),
+                      key=lambda i: (len(normalize_text(DESCRIPTIONS[i])), i))
+    assert index.containing(query) == expected
+
+
+def test_stale_index_is_skipped_with_a_warning(index_path, capsys):
+    conn = sqlite3.connect(index_path)
+    with conn:
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'imported_at'", (str(time.time() - 30 * 86400),))
+    conn.close()
+    assert LocalIdIndex.load(index_path, max_age_days=14) is None
+    assert "WARN: Local ID Manual index is 30 days old" in capsys.readouterr().err
+    assert LocalIdIndex.load(index_path, max_age_days=0) is not None
@@ -0,0 +1,145 @@
+# python/tests/test_job_stream.py
+import json
+import asyncio
+from collections import Counter
+
+from job_stream import JobStream, unless_cancelled
+
+
+def job_lines(*records):
+    lines = asyncio.Queue()
+    for record in records:
+        lines.put_nowait(record if record is None else json.dumps(record))
+    return lines
+
+
+def uspto(*terms):
+    return [{"source": "uspto", "term": term} for term in terms]
+
+
+class Handlers:
+    """Answers "fast" terms at once and holds the rest until cancelled, tracking records in flight."""
+
+    def __init__(self, hold_seconds=None):
+        self.hold_seconds = hold_seconds
+        self.answered = []
+        self.cancelled = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def run(self, record):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if record["term"].startswith("fast"):
+                await asyncio.sleep(0)
+            elif self.hold_seconds is not None:
+                await asyncio.sleep(self.hold_seconds)
+            else:
+                await asyncio.Event().wait()
+            self.answered.append(record["term"])
+        finally:
+            self.in_flight -= 1
+
+    def on_cancelled(self, source, record):
+        self.cancelled.append(record["term"])
+
+    def stream(self, max_in_flight):
+        return JobStream({"uspto": self.run, "mgs": self.run}, max_in_flight, on_cancelled=self.on_cancelled)
+
+
+def test_cancel_reports_every_record_once_including_unscheduled_ones():
+    terms = ["fast-1", "slow-1", "slow-2", "waiting-for-a-slot", "queued-1", "queued-2"]
+    handlers = Handlers()
+
+    async def run():
+        stream = handlers.stream(max_in_flight=2)
+        cancel_event = asyncio.Event()
+        lines = job_lines(*uspto(*terms)) # No EOF: the job is still being written when it is cancelled
+        running = asyncio.create_task(stream.run(lines, cancel_event))
+        await asyncio.sleep(0.05)
+        cancel_event.set()
+        await running
+        return stream
+
+    stream = asyncio.run(run())
+    assert Counter(handlers.answered + handlers.cancelled) == Counter(terms)
+    assert handlers.answered == ["fast-1"]
+    assert stream.cancelled["uspto"] == 5 and stream.completed["uspto"] == 3 # Ran: fast-1, slow-1, slow-2
+
+
+def test_cancel_after_input_ends_reports_running_records():
+    handlers = Handlers()
+
+    async def run():
+        stream = handlers.stream(max_in_flight=10)
+        cancel_event = asyncio.Event()
+        running = asyncio.create_task(stream.run(job_lines(*uspto("fast-1", "slow-1", "slow-2"), None), cancel_event))
+        await asyncio.sleep(0.05)
+        cancel_event.set()
+        await running
+
+    asyncio.run(run())
+    assert handlers.answered == ["fast-1"] and sorted(handlers.cancelled) == ["slow-1", "slow-2"]
+
+
+def test_in_flight_records_never_exceed_the_limit(capsys):
+    handlers = Handlers(hold_seconds=0.01)
+    terms = [f"term-{i}" for i in range(25)]
+
+    async def run():
+        stream = handlers.stream(max_in_flight=3)
+        await stream.run(job_lines(*uspto(*terms), None), asyncio.Event())
+        return stream
+
+    stream = asyncio.run(run())
+    assert handlers.peak == 3
+    assert sorted(handlers.answered) == sorted(terms) and stream.completed["uspto"] == 25
+    progress = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert progress[-1] == {"type": "progress", "source": "uspto", "value": 100, "completed": 25, "received": 25}
+
+
+def test_end_record_stops_reading():
+    handlers = Handlers()
+
+    async def run():
+        stream = handlers.stream(max_in_flight=10)
+        lines = job_lines(*uspto("fast-1"), {"type": "end"}, *uspto("fast-2"), None)
+        await stream.run(lines, asyncio.Event())
+        return stream, lines.qsize()
+
+    stream, left = asyncio.run(run())
+    assert handlers.answered == ["fast-1"] and stream.received == {"uspto": 1}
+    assert left == 2 # "fast-2" and EOF were never read
+
+
+def test_invalid_records_are_rejected_and_reading_goes_on(capsys):
+    handlers = Handlers()
+
+    async def run():
+        stream = handlers.stream(max_in_flight=10)
+        lines = job_lines({"source": "elsewhere", "term": "x"}, {"source": "uspto", "term": "  "}, *uspto("fast-1"), None)
+        lines.put_nowait("not json") # After EOF: never read
+        await stream.run(lines, asyncio.Event())
+        return stream
+
+    stream = asyncio.run(run())
+    assert stream.rejected == 2 and handlers.answered == ["fast-1"]
+    errors = [json.loads(line) for line in capsys.readouterr().out.splitlines() if '"error"' in line]
+    assert len(errors) == 2 and all(error["message"].startswith("Invalid job record") for error in errors)
+
+
+def test_cancelled_wait_leaves_waiting_input_alone():
+    async def run():
+        cancel_event = asyncio.Event()
+        cancel_wait = asyncio.ensure_future(cancel_event.wait())
+        lines = job_lines(*uspto("fast-1", "fast-2"))
+        first = await unless_cancelled(lines.get(), cancel_wait)
+        cancel_event.set()
+        await asyncio.sleep(0)
+        second = await unless_cancelled(lines.get(), cancel_wait) # "fast-2" is waiting, but the job is cancelled
+        return first, second, lines.qsize()
+
+    first, second, left = asyncio.run(run())
+    assert json.loads(first)["term"] == "fast-1"
+    assert second is None and left == 1
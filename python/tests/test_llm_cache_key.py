@@ -0,0 +1,53 @@
+# python/tests/test_llm_cache_key.py
+import pytest
+
+import nice_text
+import search_script
+from search_script import llm_cache_key, suggest_cache_key, vagueness_cache_key
+
+
+def test_each_component_changes_the_key(monkeypatch):
+    base = llm_cache_key("vagueness", "1", "guidelines", "leather bags")
+    assert len({
+        base,
+        llm_cache_key("suggest", "1", "guidelines", "leather bags"),
+        llm_cache_key("vagueness", "2", "guidelines", "leather bags"),
+        llm_cache_key("vagueness", "1", "guidelines, revised", "leather bags"),
+        llm_cache_key("vagueness", "1", "guidelines", "leather goods"),
+        llm_cache_key("vagueness", "1", "guidelines", "leather bags", None),
+    }) == 6
+    monkeypatch.setattr(search_script, "GEMINI_MODEL_NAME", "another-model")
+    assert llm_cache_key("vagueness", "1", "guidelines", "leather bags") != base
+
+
+@pytest.mark.parametrize("setting, value", [("GEMINI_MODEL_NAME", "another-model"), ("VAGUENESS_PROMPT_VERSION", "99"),
+                                            ("VAGUENESS_GUIDELINES", "Revised guidelines")])
+def test_vagueness_key_follows_model_prompt_version_and_guidelines(monkeypatch, setting, value):
+    before = vagueness_cache_key("leather bags")
+    monkeypatch.setattr(search_script, setting, value)
+    assert vagueness_cache_key("leather bags") != before
+
+
+def test_vagueness_inputs_differing_in_whitespace_or_case_share_a_key():
+    assert vagueness_cache_key("Leather  Bags") == vagueness_cache_key(" leather bags ") == vagueness_cache_key("LEATHER\tBAGS")
+    assert vagueness_cache_key("leather bags") != vagueness_cache_key("leather bag")
+
+
+@pytest.mark.parametrize("module, setting, value", [(search_script, "GEMINI_MODEL_NAME", "another-model"),
+                                                    (search_script, "SUGGEST_PROMPT_VERSION", "99"),
+                                                    (nice_text, "NICE_CLASSIFICATION_TEXT", "Class 1 ... (revised edition)")])
+def test_suggest_key_follows_model_prompt_version_and_nice_text(monkeypatch, module, setting, value):
+    before = suggest_cache_key("goods", "too broad", None, "9,42")
+    monkeypatch.setattr(module, setting, value)
+    assert suggest_cache_key("goods", "too broad", None, "9,42") != before
+
+
+def test_suggest_key_follows_inputs_and_ignores_whitespace():
+    key = suggest_cache_key("leather goods", "too broad", "Leather bags", "18")
+    assert key == suggest_cache_key(" leather  goods", "too\nbroad ", "Leather   bags", "18")
+    assert len({key,
+                suggest_cache_key("leather goods", "too broad", "Leather bags", "18,25"),
+                suggest_cache_key("leather goods", "too broad", None, "18"),
+                suggest_cache_key("leather goods", "indefinite", "Leather bags", "18"),
+                # Case is kept on purpose: suggestions must start with the example's exact wording
+                suggest_cache_key("leather goods", "too broad", "leather bags", "18")}) == 5
@@ -0,0 +1,74 @@
+# python/tests/test_micro_batch.py
+import asyncio
+
+import pytest
+
+from micro_batch import MicroBatcher
+
+
+class Recorder:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return {item: item.upper() for item in items if item != "missing"}
+
+
+def test_flushes_as_soon_as_max_batch_items_are_waiting():
+    async def run():
+        recorder = Recorder()
+        batcher = MicroBatcher(recorder, max_batch=3, window=60)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(*(batcher.submit(item) for item in ["a", "b", "c"]))
+        return results, recorder.batches, loop.time() - started
+
+    results, batches, elapsed = asyncio.run(run())
+    assert results == ["A", "B", "C"]
+    assert batches == [["a", "b", "c"]]
+    assert elapsed < 1 # Did not wait for the 60 s window
+
+
+def test_flushes_a_partial_batch_when_the_window_closes():
+    async def run():
+        recorder = Recorder()
+        batcher = MicroBatcher(recorder, max_batch=20, window=0.05)
+        first = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(batcher.submit("b"))
+        await asyncio.sleep(0.01)
+        assert recorder.batches == [] # Still inside the window
+        results = await asyncio.gather(first, second)
+        later = await batcher.submit("c") # A new window opens for the next item
+        return results, later, recorder.batches
+
+    results, later, batches = asyncio.run(run())
+    assert results == ["A", "B"] and later == "C"
+    assert batches == [["a", "b"], ["c"]]
+
+
+def test_duplicates_share_one_slot_in_the_batch():
+    async def run():
+        recorder = Recorder()
+        batcher = MicroBatcher(recorder, max_batch=3, window=0.01)
+        results = await asyncio.gather(*(batcher.submit(item) for item in ["a", "a", "b"]))
+        return results, recorder.batches
+
+    results, batches = asyncio.run(run())
+    assert results == ["A", "A", "B"]
+    assert batches == [["a", "b"]]
+
+
+def test_batch_errors_and_missing_results_reach_every_submitter():
+    async def run(recorder, items):
+        batcher = MicroBatcher(recorder, max_batch=len(items), window=0.01)
+        return await asyncio.gather(*(batcher.submit(item) for item in items), return_exceptions=True)
+
+    failed = asyncio.run(run(Recorder(fail=True), ["a", "b"]))
+    assert all(isinstance(result, RuntimeError) for result in failed)
+    partial = asyncio.run(run(Recorder(), ["a", "missing"]))
+    assert partial[0] == "A" and isinstance(partial[1], KeyError)
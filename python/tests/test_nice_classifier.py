@@ -0,0 +1,38 @@
+# python/tests/test_nice_classifier.py
+from collections import Counter
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from nice_classifier import NiceClassifier, features
+from nice_text import NICE_CLASSIFICATION_TEXT
+
+TERMS = ["legal services", "downloadable computer game software", "leather bags", "coffee and tea", "t-shirts",
+         "", "zzzz qqqq", "retail store services featuring clothing clothing"]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return NiceClassifier(NICE_CLASSIFICATION_TEXT)
+
+
+def dense_scores(classifier, terms):
+    vectors = np.zeros((len(terms), len(classifier.vocabulary)), dtype=np.float32)
+    for row, term in enumerate(terms):
+        for gram, count in Counter(features(term)).items():
+            if gram in classifier.vocabulary:
+                vectors[row, classifier.vocabulary[gram]] = 1 + np.log(count)
+    return classifier._normalize(vectors * classifier.idf) @ classifier.matrix.T
+
+
+def test_sparse_scores_match_a_dense_multiply(classifier):
+    np.testing.assert_allclose(classifier.scores(TERMS), dense_scores(classifier, TERMS), atol=1e-6)
+
+
+def test_zero_score_classes_are_left_out(classifier):
+    ranked = classifier.classify(TERMS, top_k=5)
+    assert [entry["class"] for entry in ranked[0]] == [45]
+    assert ranked[5] == [] and ranked[6] == []
+    assert all(entry["score"] > 0 for entries in ranked for entry in entries)
+    assert ranked[2][0]["class"] == 18
@@ -0,0 +1,74 @@
+# python/tests/test_prefix_resolver.py
+import asyncio
+
+import pytest
+
+from prefix_resolver import PrefixResolver
+from term_matching import normalize_text
+
+LISTING = {"rows": [{"description": "Downloadable e-books", "status": "A", "termId": "1"}], "firstTermId": "1"}
+
+
+class SlowProbe:
+    def __init__(self, listings):
+        self.listings = listings
+        self.calls = []
+
+    async def __call__(self, prefix):
+        self.calls.append(prefix)
+        await asyncio.sleep(0.05)
+        return self.listings.get(prefix)
+
+
+def never():
+    return False
+
+
+def test_cancelling_one_term_keeps_shared_probes_for_another():
+    async def run():
+        probe = SlowProbe({"downloadable": LISTING})
+        resolver = PrefixResolver(probe, normalize_text, fanout=3)
+        first = asyncio.create_task(resolver.longest_prefix("downloadable software", never))
+        second = asyncio.create_task(resolver.longest_prefix("downloadable games", never))
+        await asyncio.sleep(0.01) # Both terms are now waiting on the shared "downloadable" probe
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second, probe.calls
+
+    result, calls = asyncio.run(run())
+    assert result == ("downloadable", LISTING)
+    assert calls.count("downloadable") == 1
+
+
+def test_probe_abandoned_by_every_term_is_retried():
+    async def run():
+        probe = SlowProbe({"downloadable": LISTING})
+        resolver = PrefixResolver(probe, normalize_text, fanout=3)
+        first = asyncio.create_task(resolver.longest_prefix("downloadable software", never))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        return await resolver.longest_prefix("downloadable games", never), probe.calls
+
+    result, calls = asyncio.run(run())
+    assert result == ("downloadable", LISTING)
+    assert calls.count("downloadable") == 2
+
+
+def test_failed_probe_is_not_memoized():
+    async def run():
+        attempts = []
+
+        async def probe(prefix):
+            attempts.append(prefix)
+            if len(attempts) == 1:
+                raise RuntimeError("page crashed")
+            return LISTING
+
+        resolver = PrefixResolver(probe, normalize_text, fanout=1)
+        with pytest.raises(RuntimeError):
+            await resolver.longest_prefix("downloadable", never)
+        return await resolver.longest_prefix("downloadable", never)
+
+    assert asyncio.run(run()) == ("downloadable", LISTING)
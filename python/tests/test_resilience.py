@@ -0,0 +1,83 @@
+# python/tests/test_resilience.py
+import asyncio
+
+import pytest
+
+import resilience
+from adaptive_limit import AdaptiveLimiter
+from resilience import CircuitBreaker, TermDeadline, TermFailure, run_term
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(resilience, "jittered_backoff", lambda attempt: 0.0)
+
+
+def test_budget_spent_queueing_for_a_retry_does_not_trip_the_breaker():
+    async def run():
+        limiter = AdaptiveLimiter("test", maximum=1, initial=1, enabled=True)
+        breaker = CircuitBreaker("idm.test", threshold=2)
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            await asyncio.sleep(0.01) # Lets the other caller queue for the permit
+            raise ConnectionError("Connection reset")
+
+        async def hog():
+            await asyncio.sleep(0.005)
+            async with limiter:
+                await asyncio.sleep(0.3) # Holds the permit past the term's deadline
+
+        hogging = asyncio.create_task(hog())
+        with pytest.raises(TermFailure) as failure:
+            await run_term("lookup", flaky, breaker, limiter, TermDeadline(0.1))
+        await hogging
+        return failure.value, breaker, limiter, attempts
+
+    failure, breaker, limiter, attempts = asyncio.run(run())
+    assert failure.kind == "timeout" and len(attempts) == 1
+    assert breaker.consecutive_failures == 1 and breaker.state == "closed"
+    assert limiter.failures == 1 # The failed attempt only
+
+
+def test_deadline_is_shared_with_work_after_run_term():
+    async def run():
+        deadline = TermDeadline(1.0)
+        limiter = AdaptiveLimiter("test", maximum=1, enabled=True)
+
+        async def lookup():
+            await asyncio.sleep(0.2)
+            return "listing"
+
+        result = await run_term("lookup", lookup, CircuitBreaker("idm.test"), limiter, deadline)
+        return result, deadline.remaining()
+
+    result, remaining = asyncio.run(run())
+    assert result == "listing" and remaining < 0.85
+
+
+def test_deadline_starts_on_first_use():
+    async def run():
+        deadline = TermDeadline(0.5)
+        assert not deadline.expired() and deadline.expires_at is None
+        await asyncio.sleep(0.05)
+        return deadline.remaining()
+
+    assert asyncio.run(run()) == pytest.approx(0.5, abs=0.01)
+
+
+def test_operation_timeout_at_the_deadline_reports_its_stage():
+    async def run():
+        async def stalls():
+            resilience.mark_stage("results_wait")
+            await asyncio.sleep(1)
+
+        breaker = CircuitBreaker("idm.test")
+        with pytest.raises(TermFailure) as failure:
+            await run_term("lookup", stalls, breaker, AdaptiveLimiter("test", maximum=1), TermDeadline(0.05))
+        return failure.value, breaker
+
+    failure, breaker = asyncio.run(run())
+    assert (failure.kind, failure.stage) == ("timeout", "results_wait")
+    assert breaker.consecutive_failures == 1
@@ -0,0 +1,59 @@
+# python/tests/test_resource_policy.py
+import types
+import asyncio
+
+import pytest
+
+from resource_policy import TYPICAL_BYTES, TYPICAL_BYTES_OTHER, ResourcePolicy, should_block
+
+
+@pytest.mark.parametrize("url, resource_type, blocked", [
+    # Trackers, subdomains included, whatever the resource type
+    ("https://www.google-analytics.com/analytics.js", "script", True),
+    ("https://region1.google-analytics.com/g/collect?v=2", "xhr", True),
+    ("https://dap.digitalgov.gov/Universal-Federated-Analytics-Min.js", "script", True),
+    ("https://notgoogle-analytics.com/app.js", "script", False), # A suffix, not a subdomain
+    # First-party stylesheets are kept by SITE_ALLOWLISTS; third-party ones are not
+    ("https://idm-tmng.uspto.gov/css/main.css", "stylesheet", False),
+    ("https://webaccess.wipo.int/mgs/css/style.css", "stylesheet", False),
+    ("https://webaccess.wipo.int/other/style.css", "stylesheet", True), # Outside the allowlisted path
+    ("https://fonts.googleapis.com/css?family=Roboto", "stylesheet", True),
+    ("https://idm-tmng.uspto.gov/img/logo.png", "image", True), # The allowlist covers stylesheets only
+    ("https://idm-tmng.uspto.gov/fonts/icons.woff2", "font", True),
+    # What the search screens need
+    ("https://idm-tmng.uspto.gov/id-master-list-public.html", "document", False),
+    ("https://idm-tmng.uspto.gov/idm2-services/search/public?searchInfo=bags", "xhr", False),
+    ("https://webaccess.wipo.int/mgs/js/app.js", "script", False),
+    # Never on the network
+    ("data:image/png;base64,iVBORw0KGgo=", "image", False),
+    ("blob:https://webaccess.wipo.int/8c2d0b9e-1f3a", "media", False),
+    ("about:blank", "document", False),
+])
+def test_should_block(url, resource_type, blocked):
+    assert should_block(url, resource_type) is blocked
+
+
+def test_stats_estimate_saved_bytes_and_count_undeclared_responses():
+    async def run():
+        policy = ResourcePolicy(enabled=True)
+
+        async def abort(reason):
+            pass
+
+        async def continue_():
+            pass
+
+        for url, resource_type in [("https://idm-tmng.uspto.gov/a.png", "image"), ("https://idm-tmng.uspto.gov/b.png", "image"),
+                                   ("https://www.google-analytics.com/collect", "ping"),
+                                   ("https://idm-tmng.uspto.gov/app.js", "script")]:
+            request = types.SimpleNamespace(url=url, resource_type=resource_type)
+            await policy._route(types.SimpleNamespace(request=request, abort=abort, continue_=continue_))
+        policy._count_response(types.SimpleNamespace(headers={"content-length": "1200"}))
+        policy._count_response(types.SimpleNamespace(headers={"transfer-encoding": "chunked"}))
+        return policy.stats()
+
+    stats = asyncio.run(run())
+    assert stats["blockedRequests"] == 3 and stats["blockedByType"] == {"image": 2, "ping": 1}
+    assert stats["estimatedSavedBytes"] == 2 * TYPICAL_BYTES["image"] + TYPICAL_BYTES_OTHER
+    assert stats["allowedRequests"] == 1
+    assert (stats["declaredFetchedBytes"], stats["undeclaredResponses"]) == (1200, 1)
@@ -0,0 +1,42 @@
+# python/tests/test_result_cache.py
+import result_cache
+from result_cache import ResultCache
+
+
+def rows(cache):
+    return cache._conn.execute(f"SELECT COUNT(*) FROM {cache.table}").fetchone()[0]
+
+
+def test_evicts_least_recently_used_beyond_max_entries(tmp_path):
+    cache = ResultCache(path=str(tmp_path / "cache.sqlite3"), max_entries=3)
+    for key in "abc":
+        cache.set(key, {"key": key})
+    cache.get("a") # "b" is now the least recently used
+    cache.set("d", {"key": "d"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"key": "a"}
+    assert rows(cache) == 3 and cache.evictions == 1
+
+
+def test_replacing_a_key_does_not_count_as_a_new_entry(tmp_path):
+    cache = ResultCache(path=str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("b", 3)
+    cache.set("a", 4)
+    assert cache.evictions == 0
+    assert (cache.get("a"), cache.get("b")) == (4, 3)
+
+
+def test_count_resyncs_with_writes_from_other_connections(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, "RECOUNT_EVERY", 2)
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResultCache(path=path, max_entries=3)
+    other = ResultCache(path=path, max_entries=3)
+    cache.set("a", 1)
+    for key in "xyz":
+        other.set(key, 0)
+    cache.set("b", 2) # Counted by hand: this process still thinks there are two entries
+    cache.set("c", 3) # Recounted: five rows, so the two oldest go
+    assert rows(cache) == 3
+    assert cache.get("c") == 3
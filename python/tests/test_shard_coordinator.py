@@ -0,0 +1,201 @@
+# python/tests/test_shard_coordinator.py
+import json
+import types
+import asyncio
+from collections import Counter
+
+import shard_coordinator
+from shard_coordinator import ShardCoordinator, _Worker, shard_index
+from term_matching import normalize_mgs_text, normalize_text
+
+
+class FakeStdin:
+    def __init__(self):
+        self.lines = []
+
+    def is_closing(self):
+        return False
+
+    def write(self, line):
+        self.lines.append(json.loads(line))
+
+    async def drain(self):
+        pass
+
+
+def route(records, workers=8):
+    async def run():
+        coordinator = ShardCoordinator(workers, {"uspto": normalize_text, "mgs": normalize_mgs_text}, {})
+        coordinator.workers = [_Worker(index, types.SimpleNamespace(returncode=None, stdin=FakeStdin())) for index in range(workers)]
+        lines = asyncio.Queue()
+        for record in records:
+            lines.put_nowait(json.dumps(record))
+        lines.put_nowait(None)
+        await coordinator._route(lines, asyncio.get_running_loop().create_future())
+        return {record["term"]: worker.index for worker in coordinator.workers for record in worker.process.stdin.lines}
+    return asyncio.run(run())
+
+
+def test_each_source_shards_by_its_own_normal_form():
+    # "Leather Bags!" and "leather bags" are one MGS search but two ID Manual ones (USPTO keeps "!")
+    mgs = route([{"source": "mgs", "term": term} for term in ["Leather Bags!", "leather bags", "LEATHER   bags"]])
+    assert len(set(mgs.values())) == 1
+    uspto = route([{"source": "uspto", "term": term} for term in ["T-Shirts", "tshirts", "Tshirts"]])
+    assert len(set(uspto.values())) == 1
+
+
+class FakeWorkerStdin(FakeStdin):
+    def __init__(self, process):
+        super().__init__()
+        self.process = process
+        self.closed = False
+
+    def is_closing(self):
+        return self.closed
+
+    def write(self, line):
+        super().write(line)
+        self.process.receive(self.lines[-1])
+
+    async def drain(self):
+        if len(self.process.held) >= 2:
+            await self.process.wait() # Pipe full: the worker is not reading
+        if self.process.returncode is not None:
+            raise ConnectionResetError("worker exited")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeWorker:
+    """Stands in for a `search_script.py --stream` process.
+
+    Answers "fast-*" terms at once and holds the rest until cancelled or the end of input;
+    a "crash-*" term makes it exit with code 1, leaving what it holds unanswered.
+    """
+
+    def __init__(self):
+        self.stdin = FakeWorkerStdin(self)
+        self.stdout = asyncio.StreamReader()
+        self.returncode = None
+        self.held = []
+        self.answered = 0
+        self._exited = asyncio.Event()
+
+    def _write(self, record):
+        self.stdout.feed_data((json.dumps(record) + "\n").encode("utf-8"))
+
+    def _answer(self, term, **fields):
+        self.answered += 1
+        self._write({"type": "result", "term": term, "source": "uspto", "matchType": "none", **fields})
+        self._write({"type": "progress", "source": "uspto", "value": 0, "completed": self.answered, "received": 0})
+
+    def receive(self, record):
+        kind = record.get("type")
+        if kind == "cancel":
+            for term in self.held:
+                self._answer(term, matchType="cancelled")
+            self.held = []
+            self._exit(0)
+        elif kind == "end":
+            for term in self.held:
+                self._answer(term)
+            self.held = []
+            self._exit(0)
+        elif record["term"].startswith("fast"):
+            self._answer(record["term"])
+        else:
+            self.held.append(record["term"])
+            if record["term"].startswith("crash"):
+                self._exit(1)
+
+    def _exit(self, code):
+        if self.returncode is None:
+            self.returncode = code
+            self.stdout.feed_eof()
+            self._exited.set()
+
+    async def wait(self):
+        await self._exited.wait()
+        return self.returncode
+
+    def kill(self):
+        self._exit(-9)
+
+    def send_signal(self, signal):
+        pass
+
+
+def terms_for_worker(index, prefix, count, workers=2):
+    """`count` terms named prefix-N that shard to worker `index`."""
+    terms = (f"{prefix}-{n}" for n in range(1000))
+    return [term for term in terms if shard_index(normalize_text(term), workers) == index][:count]
+
+
+def run_coordinator(monkeypatch, records, workers=2, cancel_after=None):
+    processes = []
+
+    async def create_subprocess_exec(*args, **kwargs):
+        processes.append(FakeWorker())
+        return processes[-1]
+
+    monkeypatch.setattr(shard_coordinator.asyncio, "create_subprocess_exec", create_subprocess_exec)
+
+    async def run():
+        coordinator = ShardCoordinator(workers, {"uspto": normalize_text, "mgs": normalize_mgs_text}, {})
+        lines = asyncio.Queue()
+        for record in records:
+            lines.put_nowait(record if record is None else json.dumps(record))
+        cancel_event = asyncio.Event()
+        running = asyncio.create_task(coordinator.run(lines, cancel_event))
+        if cancel_after is not None:
+            await asyncio.sleep(cancel_after)
+            cancel_event.set()
+        await running
+        return coordinator, lines.qsize()
+
+    return asyncio.run(run())
+
+
+def output(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_cancel_reports_every_record_once_including_unrouted_ones(monkeypatch, capsys):
+    terms = terms_for_worker(0, "fast", 2) + terms_for_worker(0, "slow", 2) + terms_for_worker(0, "unrouted", 3) \
+        + terms_for_worker(1, "slow", 1)
+    coordinator, _ = run_coordinator(monkeypatch, [{"source": "uspto", "term": term} for term in terms], cancel_after=0.05)
+    results = [record for record in output(capsys) if record["type"] == "result"]
+    assert Counter(record["term"] for record in results) == Counter(terms)
+    assert {record["term"] for record in results if record["matchType"] != "cancelled"} == set(terms[:2])
+    assert coordinator.cancelled and coordinator.received["uspto"] == 4 # Worker 0 stopped reading after two held terms
+
+
+def test_worker_exit_answers_its_pending_terms_and_completes_progress(monkeypatch, capsys):
+    lost = terms_for_worker(0, "slow", 1) + terms_for_worker(0, "crash", 1)
+    answered = terms_for_worker(1, "fast", 3)
+    records = [{"source": "uspto", "term": term} for term in answered[:1] + lost + answered[1:]] + [None]
+    coordinator, _ = run_coordinator(monkeypatch, records)
+    emitted = output(capsys)
+    errors = [record for record in emitted if record["type"] == "error"]
+    assert sorted(record["term"] for record in errors) == sorted(lost)
+    assert all(record["errorKind"] == "worker_exit" for record in errors)
+    assert sorted(record["term"] for record in emitted if record["type"] == "result") == sorted(answered)
+    progress = [record for record in emitted if record["type"] == "progress"]
+    assert progress[-1] == {"type": "progress", "source": "uspto", "value": 100, "completed": 5, "received": 5}
+    assert coordinator.stats()["exitCodes"] == [1, 0]
+
+
+def test_progress_is_folded_across_workers(monkeypatch, capsys):
+    terms = terms_for_worker(0, "fast", 2) + terms_for_worker(1, "fast", 2)
+    run_coordinator(monkeypatch, [{"source": "uspto", "term": term} for term in terms] + [None])
+    progress = [record for record in output(capsys) if record["type"] == "progress"]
+    assert [record["completed"] for record in progress] == [1, 2, 3, 4]
+    assert progress[-1]["value"] == 100 and progress[-1]["received"] == 4
+
+
+def test_end_record_stops_routing(monkeypatch, capsys):
+    records = [{"source": "uspto", "term": "fast-1"}, {"type": "end"}, {"source": "uspto", "term": "fast-2"}, None]
+    coordinator, left = run_coordinator(monkeypatch, records)
+    assert coordinator.received == {"uspto": 1} and left == 2
+    assert [record["term"] for record in output(capsys) if record["type"] == "result"] == ["fast-1"]
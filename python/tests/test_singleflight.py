@@ -0,0 +1,80 @@
+# python/tests/test_singleflight.py
+import asyncio
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+class Lookup:
+    def __init__(self, result="listing", error=None, seconds=0.05):
+        self.result, self.error, self.seconds = result, error, seconds
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.seconds)
+        if self.error is not None:
+            raise self.error
+        return {"rows": [self.result]}
+
+
+def test_concurrent_callers_share_one_lookup_and_its_result():
+    async def run():
+        flight, lookup = SingleFlight(), Lookup()
+        results = await asyncio.gather(*(flight.run("uspto:leather bags", lookup) for _ in range(5)))
+        return flight, lookup, results
+
+    flight, lookup, results = asyncio.run(run())
+    assert lookup.calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"started": 1, "coalesced": 4, "inFlight": 0}
+
+
+def test_different_keys_and_later_calls_run_again():
+    async def run():
+        flight, lookup = SingleFlight(), Lookup(seconds=0)
+        await asyncio.gather(flight.run("a", lookup), flight.run("b", lookup))
+        await flight.run("a", lookup) # The first "a" finished; only in-flight work is shared
+        return lookup.calls
+
+    assert asyncio.run(run()) == 3
+
+
+def test_errors_reach_every_waiter_and_are_not_kept():
+    async def run():
+        flight, failing = SingleFlight(), Lookup(error=RuntimeError("page crashed"))
+        results = await asyncio.gather(*(flight.run("a", failing) for _ in range(3)), return_exceptions=True)
+        retried = await flight.run("a", Lookup(result="second try", seconds=0))
+        return failing.calls, results, retried
+
+    calls, results, retried = asyncio.run(run())
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) and result is results[0] for result in results)
+    assert retried == {"rows": ["second try"]}
+
+
+def test_cancelling_one_caller_keeps_the_lookup_for_the_others():
+    async def run():
+        flight, lookup = SingleFlight(), Lookup()
+        first = asyncio.create_task(flight.run("a", lookup))
+        second = asyncio.create_task(flight.run("a", lookup))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second, lookup.calls
+
+    assert asyncio.run(run()) == ({"rows": ["listing"]}, 1)
+
+
+def test_lookup_abandoned_by_every_caller_is_cancelled_and_restarted():
+    async def run():
+        flight, lookup = SingleFlight(), Lookup()
+        only = asyncio.create_task(flight.run("a", lookup))
+        await asyncio.sleep(0.01)
+        only.cancel()
+        await asyncio.gather(only, return_exceptions=True)
+        return await flight.run("a", lookup), lookup.calls
+
+    assert asyncio.run(run()) == ({"rows": ["listing"]}, 2)
@@ -0,0 +1,69 @@
+# python/tests/test_term_matching.py
+import random
+
+import pytest
+
+from term_matching import FULL, PARTIAL, SUBSEQUENCE, TermMatch, TermMatcher, is_subsequence, normalize_mgs_text, normalize_text
+
+WORDS = ["bag", "bags", "leather", "tote", "hand", "handbags", "software", "soft", "ware", "game", "games", "a", "an", "of", "s"]
+
+
+def brute_force(terms, texts, normalize, subsequences):
+    """The per-term, per-text comparisons TermMatcher replaces."""
+    keys = {}
+    for term in terms:
+        if normalize(term):
+            keys.setdefault(normalize(term), []).append(term)
+    matches = []
+    for index, text in enumerate(texts):
+        normalized = normalize(text)
+        for key, spellings in keys.items():
+            if key == normalized:
+                kind = FULL
+            elif key in normalized:
+                kind = PARTIAL
+            elif subsequences and is_subsequence(key.split(), normalized.split()):
+                kind = SUBSEQUENCE
+            else:
+                continue
+            matches.extend(TermMatch(kind, term, index) for term in spellings)
+    return matches
+
+
+def order(matches):
+    kinds = {FULL: 0, PARTIAL: 0, SUBSEQUENCE: 1} # Substring matches come before subsequence ones within a text
+    return sorted(matches, key=lambda match: (match.index, kinds[match.kind]))
+
+
+def phrase(rng, low, high, punctuation=True):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    if punctuation and rng.random() < 0.3:
+        words[rng.randrange(len(words))] += rng.choice(["-", ",", "!", " -"])
+    return (" " if rng.random() < 0.8 else "  ").join(word.upper() if rng.random() < 0.1 else word for word in words)
+
+
+@pytest.mark.parametrize("normalize", [normalize_text, normalize_mgs_text])
+@pytest.mark.parametrize("seed", range(20))
+def test_scan_agrees_with_brute_force(normalize, seed):
+    rng = random.Random(seed)
+    terms = [phrase(rng, 1, 3) for _ in range(rng.choice([1, 2, 12]))]
+    texts = [phrase(rng, 1, 8) for _ in range(30)] + [rng.choice(terms)]
+    for subsequences in (False, True):
+        matcher = TermMatcher(terms, normalize)
+        found = list(matcher.scan(texts, subsequences=subsequences))
+        assert order(found) == found # Text by text, substring matches first
+        assert sorted(found) == sorted(brute_force(terms, texts, normalize, subsequences))
+
+
+def test_overlapping_terms_and_shared_spellings():
+    matcher = TermMatcher(["hand", "handbags", "bags", "Hand-bags", "and"])
+    found = list(matcher.scan(["leather handbags", "handbags", "hand bags"]))
+    assert found == [
+        # "Hand-bags" normalizes like "handbags", so it is reported with it, in that term's place
+        TermMatch(PARTIAL, "hand", 0), TermMatch(PARTIAL, "handbags", 0), TermMatch(PARTIAL, "Hand-bags", 0),
+        TermMatch(PARTIAL, "bags", 0), TermMatch(PARTIAL, "and", 0),
+        TermMatch(PARTIAL, "hand", 1), TermMatch(FULL, "handbags", 1), TermMatch(FULL, "Hand-bags", 1),
+        TermMatch(PARTIAL, "bags", 1), TermMatch(PARTIAL, "and", 1),
+        TermMatch(PARTIAL, "hand", 2), TermMatch(PARTIAL, "bags", 2), TermMatch(PARTIAL, "and", 2),
+    ]
+    assert matcher.first(["tote", "hand bags"]) == TermMatch(PARTIAL, "hand", 1)
@@ -0,0 +1,106 @@
+# python/tests/test_uspto_http.py
+import os
+import json
+import types
+import asyncio
+
+import pytest
+
+import uspto_http
+from uspto_http import UsptoHttpClient, UsptoHttpError, parse_search_response
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_parses_recorded_response():
+    listing = parse_search_response(load_fixture("uspto_search_public.json"))
+    assert listing == {
+        "rows": [
+            {"description": "Downloadable software for use in database management", "status": "A", "termId": "009-1467"},
+            {"description": "Downloadable software in the nature of a mobile application for ordering food", "status": "A", "termId": "90123"},
+            {"description": "Downloadable software, namely, games", "status": "D", "termId": "009-2001"},
+        ],
+        "firstTermId": "009-1467",
+    }
+
+
+def test_rejects_unrecognized_payload():
+    with pytest.raises(UsptoHttpError):
+        parse_search_response({"error": "maintenance"})
+
+
+class _HTTPError(Exception):
+    pass
+
+
+class _HTTPStatusError(_HTTPError):
+    def __init__(self, status):
+        super().__init__(f"status {status}")
+        self.response = types.SimpleNamespace(status_code=status)
+
+
+class _Response:
+    def __init__(self, status, payload):
+        self.status, self.payload = status, payload
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise _HTTPStatusError(self.status)
+
+    def json(self):
+        return self.payload
+
+
+class _AsyncClient:
+    responses = []
+
+    def __init__(self, **_):
+        self.requests = 0
+
+    async def get(self, url, params):
+        self.requests += 1
+        return self.responses.pop(0)
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def fake_httpx(monkeypatch):
+    module = types.SimpleNamespace(AsyncClient=_AsyncClient, Limits=lambda **_: None,
+                                   HTTPError=_HTTPError, HTTPStatusError=_HTTPStatusError)
+    monkeypatch.setattr(uspto_http, "httpx", module)
+    return module
+
+
+def search_all(client, queries):
+    async def run():
+        outcomes = []
+        for query in queries:
+            try:
+                outcomes.append(len((await client.search(query))["rows"]))
+            except UsptoHttpError:
+                outcomes.append(None)
+        return outcomes
+    return asyncio.run(run())
+
+
+def test_client_error_disables_the_engine(fake_httpx):
+    _AsyncClient.responses = [_Response(404, None)]
+    client = UsptoHttpClient(api_url="http://idm.test/search")
+    assert search_all(client, ["a", "b", "c"]) == [None, None, None]
+    assert client.disabled and client._client.requests == 1
+
+
+def test_consecutive_failures_disable_the_engine(fake_httpx, monkeypatch):
+    monkeypatch.setattr(uspto_http, "MAX_CONSECUTIVE_FAILURES", 2)
+    _AsyncClient.responses = [_Response(503, None), _Response(200, {"docs": []}), _Response(429, None),
+                              _Response(200, "<html>"), _Response(200, {"docs": []})]
+    client = UsptoHttpClient(api_url="http://idm.test/search")
+    assert search_all(client, ["a", "b", "c", "d", "e"]) == [None, 0, None, None, None]
+    assert client.disabled and client._client.requests == 4
@@ -0,0 +1,134 @@
+# python/uspto_http.py
+import os
+import sys
+from typing import Dict, List, Optional
+
+httpx = None # Optional: only needed for the HTTP search engine, so imported by the first client
+
+# The public ID Manual page (id-master-list-public.html) loads its listings from this
+# service. It is not a documented API, so the URL can be overridden if it moves.
+DEFAULT_USPTO_API_URL = "https://idm-tmng.uspto.gov/idm2-services/search/public"
+MAX_ROWS = 500 # The browser UI pages results; ask for enough rows to cover a typical listing
+# Failed requests in a row after which the client stops trying for the rest of the run
+MAX_CONSECUTIVE_FAILURES = int(os.environ.get("USPTO_HTTP_MAX_FAILURES", 5))
+
+# Field names seen for listing records; the first one present wins
+DESCRIPTION_FIELDS = ("description", "descriptionText", "idText")
+STATUS_FIELDS = ("status", "statusCode", "recordStatus")
+TERM_ID_FIELDS = ("termId", "idNumber", "id")
+RECORD_LIST_FIELDS = ("docs", "results", "content", "items", "data")
+
+
+class UsptoHttpError(Exception):
+    """Raised when the ID Manual service cannot be queried or returns an unexpected payload."""
+
+
+def _import_httpx():
+    global httpx
+    if httpx is None:
+        try:
+            import httpx as module
+        except ImportError:
+            raise UsptoHttpError("httpx is not installed; the HTTP search engine is unavailable.") from None
+        httpx = module
+    return httpx
+
+
+def _first_field(record: Dict, names) -> Optional[str]:
+    for name in names:
+        value = record.get(name)
+        if value is not None:
+            return str(value)
+    return None
+
+
+def _find_records(payload) -> List[Dict]:
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        if isinstance(payload.get("response"), dict): # Solr-style envelope
+            return _find_records(payload["response"])
+        for name in RECORD_LIST_FIELDS:
+            if isinstance(payload.get(name), list):
+                return payload[name]
+    raise UsptoHttpError("Unrecognized ID Manual response payload.")
+
+
+def parse_search_response(payload) -> Dict:
+    """Turns a service response into the listing shape read from the page: {"rows": [...], "firstTermId": ...}."""
+    rows = []
+    for record in _find_records(payload):
+        if not isinstance(record, dict):
+            continue
+        description = _first_field(record, DESCRIPTION_FIELDS)
+        if description is None:
+            continue
+        rows.append({
+            "description": description,
+            "status": _first_field(record, STATUS_FIELDS),
+            "termId": _first_field(record, TERM_ID_FIELDS),
+        })
+    return {"rows": rows, "firstTermId": rows[0]["termId"] if rows else None}
+
+
+class UsptoHttpClient:
+    """Pooled async HTTP client for ID Manual lookups without a browser.
+
+    The service is undocumented, so the client gives up on it for the rest of the run (`disabled`)
+    after a client error (4xx other than 429, e.g. the endpoint moved or now wants a key) or
+    MAX_CONSECUTIVE_FAILURES failures in a row. Callers then go straight to the browser instead of
+    paying a failed request per term.
+    """
+
+    def __init__(self, api_url: Optional[str] = None, max_connections: int = 20, timeout: float = 15.0):
+        _import_httpx()
+        self.api_url = api_url or os.environ.get("USPTO_API_URL") or DEFAULT_USPTO_API_URL
+        self.consecutive_failures = 0
+        self.disabled_reason: Optional[str] = None
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            headers={"Accept": "application/json"},
+        )
+
+    @property
+    def disabled(self) -> bool:
+        return self.disabled_reason is not None
+
+    def _disable(self, reason: str) -> None:
+        if self.disabled_reason is None:
+            self.disabled_reason = reason
+            sys.stderr.write(f"WARN: HTTP engine disabled for the rest of this run ({reason}); using the browser engine.\n")
+
+    def _record_failure(self, error: UsptoHttpError, status: Optional[int] = None) -> UsptoHttpError:
+        self.consecutive_failures += 1
+        if status is not None and 400 <= status < 500 and status != 429:
+            self._disable(f"HTTP {status} from {self.api_url}")
+        elif self.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            self._disable(f"{self.consecutive_failures} failed requests in a row")
+        return error
+
+    async def search(self, query: str) -> Dict:
+        if self.disabled:
+            raise UsptoHttpError(f"HTTP engine disabled: {self.disabled_reason}")
+        try:
+            response = await self._client.get(self.api_url, params={"searchInfo": query, "start": 0, "rows": MAX_ROWS})
+            response.raise_for_status()
+            payload = response.json()
+        except httpx.HTTPStatusError as e:
+            raise self._record_failure(UsptoHttpError(f"ID Manual request failed for '{query}': {e}"),
+                                       e.response.status_code) from e
+        except httpx.HTTPError as e:
+            raise self._record_failure(UsptoHttpError(f"ID Manual request failed for '{query}': {e}")) from e
+        except ValueError as e: # Body was not JSON (e.g. an HTML error page)
+            raise self._record_failure(UsptoHttpError(f"ID Manual returned a non-JSON response for '{query}'")) from e
+        try:
+            listing = parse_search_response(payload)
+        except UsptoHttpError as e:
+            raise self._record_failure(e)
+        self.consecutive_failures = 0
+        sys.stderr.write(f"DEBUG: HTTP engine: '{query}' -> {len(listing['rows'])} rows\n")
+        return listing
+
+    async def close(self) -> None:
+        await self._client.aclose()